@@ -0,0 +1,65 @@
+from typing import Optional
+
+import anyio
+from fastapi import APIRouter, Depends
+
+from app.api.auth import require_role, User
+from app.core.admission import admission_stats
+from app.core.cache import cache_namespace_stats
+from app.core.runtime import cache_stats, database_ping, pool_stats, process_stats
+from app.core.singleflight import single_flight_stats
+from app.core.warmup import warm_up_state
+from app.ml.reparse import reparse_progress
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+# Dedicated thread for the DB ping so it is not queued behind a saturated request pool
+_ping_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def thread_pool_stats() -> dict:
+    """Usage of the worker thread pool that runs sync endpoints and dependencies."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    statistics = limiter.statistics()
+    return {
+        "busy": statistics.borrowed_tokens,
+        "size": statistics.total_tokens,
+        "queued": statistics.tasks_waiting,
+    }
+
+
+@router.get("/stats")
+async def runtime_stats(current_user: User = Depends(require_role("admin"))):
+    """
+    Get runtime statistics of this worker process (admin only).
+
+    Reports connection pool counters, DB ping latency, thread pool queue
+    depth, cache sizes and hit rates, process memory and GC counters, and
+    admitted/rejected requests per rate-limited route class,
+    coalesced request counts and resume re-parse progress.
+    Cheap enough to poll every few seconds.
+    """
+    global _ping_limiter
+    if _ping_limiter is None:
+        _ping_limiter = anyio.CapacityLimiter(1)
+
+    pool = pool_stats()
+    # With every connection checked out a ping would wait for the pool timeout
+    if pool.get("exhausted"):
+        database = {"ok": False, "error": "pool exhausted"}
+    else:
+        database = await anyio.to_thread.run_sync(database_ping, limiter=_ping_limiter)
+
+    return {
+        "status": "healthy" if database["ok"] else "degraded",
+        "ready": warm_up_state.ready,
+        "database": database,
+        "pool": pool,
+        "thread_pool": thread_pool_stats(),
+        "caches": cache_stats(),
+        "shared_cache": cache_namespace_stats(),
+        "process": process_stats(),
+        "admission": admission_stats(),
+        "single_flight": single_flight_stats(),
+        "reparse": reparse_progress(),
+    }
@@ -1,16 +1,50 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.models import Application, Job, Candidate, User
-from app.schemas import ApplicationCreate, ApplicationUpdate, ApplicationResponse
+from app.schemas import (
+    ApplicationCreate, ApplicationUpdate, ApplicationResponse,
+    ApplicationBulkStatusUpdate, ApplicationBulkStatusResponse
+)
 from app.api.auth import get_current_user, require_role
-from app.ml.matcher import compute_match_score
+from app.core.serialization import json_response
+from app.core.bulk import EXPORT_MEDIA_TYPES, export_chunks
+from app.core.config import settings
+from app.core.fieldsets import APPLICATION_FIELDS
+from app.core.singleflight import single_flight
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
+# Concurrent identical applicant-list queries share one query
+applicant_list_reads = single_flight("job_applications")
+
+# Columns of the applicant export, in output order
+APPLICANT_EXPORT_COLUMNS = (
+    ("application_id", Application.id),
+    ("status", Application.status),
+    ("match_score", Application.match_score),
+    ("screening_score", Application.screening_score),
+    ("applied_at", Application.created_at),
+    ("candidate_id", Candidate.id),
+    ("full_name", User.full_name),
+    ("email", User.email),
+    ("phone", Candidate.phone),
+    ("location", Candidate.location),
+    ("experience_years", Candidate.experience_years),
+    ("headline", Candidate.headline),
+    ("skills", Candidate.skills_text),
+    ("resume_url", Candidate.resume_url),
+    ("linkedin_url", Candidate.linkedin_url),
+    ("github_url", Candidate.github_url),
+)
+
 
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 def create_application(
@@ -22,17 +56,21 @@ def create_application(
     Apply to a job (candidate only).
     
     Automatically calculates match score based on candidate profile and job requirements.
+    The candidate profile and job are read with one query and the application
+    is inserted with `ON CONFLICT DO NOTHING`, so concurrent submits of the
+    same application create exactly one row.
     """
-    # Get candidate profile
-    candidate = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
-    if not candidate:
+    # Candidate profile and job in one round trip (job is None if it does not exist)
+    row = db.query(Candidate, Job).outerjoin(
+        Job, Job.id == application_data.job_id
+    ).filter(Candidate.user_id == current_user.id).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Candidate profile not found. Please complete your profile first."
         )
     
-    # Verify job exists and is published
-    job = db.query(Job).filter(Job.id == application_data.job_id).first()
+    candidate, job = row
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -45,42 +83,43 @@ def create_application(
             detail="Cannot apply to a job that is not published"
         )
     
-    # Check if already applied
-    existing_application = db.query(Application).filter(
-        Application.job_id == application_data.job_id,
-        Application.candidate_id == candidate.id
-    ).first()
-    
-    if existing_application:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already applied to this job"
-        )
+    # Calculate match score (the matcher loads on first use, not with the app)
+    from app.ml.matcher import compute_match_score
     
-    # Calculate match score
     match_score = compute_match_score(candidate, job)
     
-    # Create application
-    new_application = Application(
+    # Create application; the unique (job_id, candidate_id) index rejects duplicates
+    statement = pg_insert(Application).values(
         job_id=application_data.job_id,
         candidate_id=candidate.id,
         cover_letter=application_data.cover_letter,
         match_score=match_score,
         status="applied"
-    )
+    ).on_conflict_do_nothing(
+        index_elements=[Application.job_id, Application.candidate_id]
+    ).returning(Application)
+    new_application = db.scalars(statement).first()
     
-    db.add(new_application)
+    if new_application is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already applied to this job"
+        )
+    
+    # Serialized before commit expires it: job and candidate come from the identity map
+    response = ApplicationResponse.model_validate(new_application)
     db.commit()
-    db.refresh(new_application)
     
-    return new_application
+    return response
 
 
-@router.get("/my", response_model=List[ApplicationResponse])
+@router.get("/my", response_model=List[Dict[str, Any]])
 def get_my_applications(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    status: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role("candidate"))
 ):
@@ -88,7 +127,11 @@ def get_my_applications(
     Get all applications for the current candidate.
     
     Returns applications with job details and match scores.
+    `cover_letter` and `notes` are only returned when requested via `fields`;
+    items carry only the selected `ApplicationResponse` fields.
     """
+    selected = APPLICATION_FIELDS.parse(fields)
+    
     # Get candidate profile
     candidate = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
     if not candidate:
@@ -97,28 +140,26 @@ def get_my_applications(
             detail="Candidate profile not found"
         )
     
-    query = db.query(Application).filter(Application.candidate_id == candidate.id)
+    query = db.query(Application).options(*APPLICATION_FIELDS.load_options(selected)).filter(
+        Application.candidate_id == candidate.id
+    )
     
-    if status:
-        query = query.filter(Application.status == status)
+    if status_filter:
+        query = query.filter(Application.status == status_filter)
     
     applications = query.order_by(Application.created_at.desc()).offset(skip).limit(limit).all()
     
-    # Load relationships
-    for app in applications:
-        app.job
-        app.job.company
-    
-    return applications
+    return json_response(APPLICATION_FIELDS.serialize(applications, selected))
 
 
-@router.get("/job/{job_id}", response_model=List[ApplicationResponse])
+@router.get("/job/{job_id}", response_model=List[Dict[str, Any]])
 def get_job_applications(
     job_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    status: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
     sort_by: str = Query("match_score", pattern="^(match_score|created_at)$"),
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role("recruiter"))
 ):
@@ -126,7 +167,11 @@ def get_job_applications(
     Get all applications for a specific job (recruiter only).
     
     Returns applications sorted by match score (default) or date.
+    `cover_letter` and `notes` are only returned when requested via `fields`;
+    items carry only the selected `ApplicationResponse` fields.
     """
+    selected = APPLICATION_FIELDS.parse(fields)
+    
     # Verify job exists and user has access
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
@@ -141,25 +186,121 @@ def get_job_applications(
             detail="You can only view applications for jobs you posted"
         )
     
-    query = db.query(Application).filter(Application.job_id == job_id)
+    def load_applications() -> list:
+        query = db.query(Application).options(*APPLICATION_FIELDS.load_options(selected)).filter(
+            Application.job_id == job_id
+        )
+        
+        if status_filter:
+            query = query.filter(Application.status == status_filter)
+        
+        # Sort by match score (descending) or created_at
+        if sort_by == "match_score":
+            query = query.order_by(Application.match_score.desc())
+        else:
+            query = query.order_by(Application.created_at.desc())
+        
+        applications = query.offset(skip).limit(limit).all()
+        return APPLICATION_FIELDS.serialize(applications, selected)
+    
+    # Access was checked above for this caller, so the key need not include the user
+    key = (job_id, status_filter, sort_by, skip, limit, tuple(selected))
+    return json_response(applicant_list_reads.do(key, load_applications))
+
+
+@router.get("/job/{job_id}/export")
+def export_job_applications(
+    job_id: UUID,
+    format: str = Query("csv", pattern="^(csv|jsonl)$"),
+    gzip: bool = False,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Download every application for a job with candidate details (recruiter only).
+    
+    Rows are read through a server-side cursor and written out batch by
+    batch, so memory use does not grow with the number of applicants.
+    Text cells that a spreadsheet would evaluate as formulas are prefixed
+    with `'` in CSV output.
+    
+    - **format**: `csv` (default) or `jsonl`
+    - **gzip**: Compress the download (`.gz`)
+    - **status**: Only applications with this status
+    """
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.posted_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only export applications for jobs you posted"
+        )
     
-    if status:
-        query = query.filter(Application.status == status)
+    statement = select(*(column for _, column in APPLICANT_EXPORT_COLUMNS)).select_from(Application).join(
+        Candidate, Application.candidate_id == Candidate.id
+    ).join(
+        User, Candidate.user_id == User.id
+    ).where(Application.job_id == job_id)
+    if status_filter:
+        statement = statement.where(Application.status == status_filter)
+    statement = statement.order_by(Application.match_score.desc(), Application.created_at)
+    
+    def batches():
+        # Own session: the request's session is closed independently of the response stream
+        session = SessionLocal()
+        try:
+            result = session.execute(statement.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+            yield from result.partitions()
+        finally:
+            session.close()
+    
+    header = [name for name, _ in APPLICANT_EXPORT_COLUMNS]
+    filename = f"applicants-{job_id}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export_chunks(header, batches(), format, compress=gzip),
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.patch("/status", response_model=ApplicationBulkStatusResponse)
+def bulk_update_application_status(
+    update_data: ApplicationBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Move many applications to one status (recruiter only).
     
-    # Sort by match score (descending) or created_at
-    if sort_by == "match_score":
-        query = query.order_by(Application.match_score.desc())
-    else:
-        query = query.order_by(Application.created_at.desc())
+    Ownership is checked by joining jobs inside a single
+    `UPDATE ... WHERE id = ANY(...) RETURNING` statement, so the whole
+    batch takes one round trip. IDs that do not exist, belong to jobs
+    posted by someone else, or already have the status are reported as
+    `skipped`.
+    """
+    application_ids = list(dict.fromkeys(update_data.application_ids))
     
-    applications = query.offset(skip).limit(limit).all()
+    statement = update(Application).where(
+        Application.id == any_(bindparam("application_ids", application_ids, type_=ARRAY(PGUUID(as_uuid=True)))),
+        Application.job_id == Job.id,
+        Job.posted_by == current_user.id,
+        Application.status != update_data.status
+    ).values(status=update_data.status).returning(Application.id).execution_options(synchronize_session=False)
     
-    # Load candidate relationships
-    for app in applications:
-        app.candidate
-        app.candidate.user
+    updated = set(db.execute(statement).scalars().all())
+    db.commit()
     
-    return applications
+    return {
+        "status": update_data.status,
+        "updated": [application_id for application_id in application_ids if application_id in updated],
+        "skipped": [application_id for application_id in application_ids if application_id not in updated],
+    }
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
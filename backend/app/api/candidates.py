@@ -10,6 +10,17 @@ from app.api.auth import get_current_user, require_role
 router = APIRouter(prefix="/candidates", tags=["Candidates"])
 
 
+def index_profile(candidate: Candidate) -> None:
+    """Build the relevance vector and skill signature once per profile change."""
+    # Imported here so the matcher (and NumPy) load on first use, not with the app
+    from app.ml.lsh import get_candidate_index
+    from app.ml.matcher import parse_skills
+    from app.ml.relevance import relevance_index
+    
+    relevance_index.candidate_vector(candidate)
+    get_candidate_index().add(candidate.id, parse_skills(candidate.skills_text))
+
+
 @router.get("/me", response_model=CandidateResponse)
 def get_my_profile(
     db: Session = Depends(get_db),
@@ -58,6 +69,7 @@ def create_my_profile(
     db.add(new_candidate)
     db.commit()
     db.refresh(new_candidate)
+    index_profile(new_candidate)
     
     return new_candidate
 
@@ -86,6 +98,7 @@ def update_my_profile(
     
     db.commit()
     db.refresh(candidate)
+    index_profile(candidate)
     
     return candidate
 
@@ -7,9 +7,14 @@ from app.database import get_db
 from app.models import Company, User
 from app.schemas import CompanyCreate, CompanyUpdate, CompanyResponse
 from app.api.auth import get_current_user, require_role
+from app.core.cache import get_cache
+from app.core.config import settings
 
 router = APIRouter(prefix="/companies", tags=["Companies"])
 
+# Cached job pages embed company details
+job_cache = get_cache("jobs", settings.CACHE_JOB_TTL_SECONDS)
+
 
 @router.get("", response_model=List[CompanyResponse])
 def get_companies(
@@ -144,6 +149,7 @@ def update_company(
     
     db.commit()
     db.refresh(company)
+    job_cache.invalidate(f"company:{company_id}")
     
     return company
 
@@ -177,5 +183,6 @@ def delete_company(
     
     db.delete(company)
     db.commit()
+    job_cache.invalidate(f"company:{company_id}")
     
     return None
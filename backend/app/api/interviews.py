@@ -0,0 +1,264 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import Application, Candidate, Interview, Job, User
+from app.schemas import InterviewCreate, InterviewUpdate, InterviewResponse, InterviewSlot
+from app.api.auth import get_current_user, require_role
+from app.core.scheduling import (
+    ACTIVE_INTERVIEW_STATUSES, as_utc, find_free_slots, interview_end, load_calendars
+)
+
+router = APIRouter(prefix="/interviews", tags=["Interviews"])
+
+MAX_AVAILABILITY_INTERVIEWERS = 20
+
+
+def _lock_interviewer(db: Session, interviewer_id: UUID) -> User:
+    """
+    Return the interviewer, locking their user row so concurrent bookings
+    for the same interviewer are checked one after the other.
+    """
+    interviewer = db.query(User).filter(User.id == interviewer_id).with_for_update().first()
+    if not interviewer or interviewer.role != "recruiter":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Interviewer must be an existing recruiter"
+        )
+    return interviewer
+
+
+def _check_conflicts(db: Session, interviewer_id: UUID, scheduled_at: datetime, duration_minutes: Optional[int],
+                     exclude_id: Optional[UUID] = None) -> None:
+    """Raise 409 if the interviewer has another active interview overlapping the slot."""
+    start = as_utc(scheduled_at)
+    end = interview_end(start, duration_minutes)
+    calendar = load_calendars(db, [interviewer_id], start, end, exclude_id=exclude_id)[interviewer_id]
+    conflicts = calendar.overlapping(start, end)
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Interviewer is already booked at this time (interview {conflicts[0]})"
+        )
+
+
+def _get_interview(db: Session, interview_id: UUID):
+    """Return (interview, job poster id, candidate user id), or raise 404."""
+    row = db.query(Interview, Job.posted_by, Candidate.user_id).join(
+        Application, Interview.application_id == Application.id
+    ).join(
+        Job, Application.job_id == Job.id
+    ).join(
+        Candidate, Application.candidate_id == Candidate.id
+    ).filter(Interview.id == interview_id).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Interview not found"
+        )
+    return row
+
+
+@router.post("", response_model=InterviewResponse, status_code=status.HTTP_201_CREATED)
+def create_interview(
+    interview_data: InterviewCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Schedule an interview for an application (recruiter only).
+
+    The interviewer defaults to the current recruiter. Returns 409 if the
+    interviewer already has a scheduled interview overlapping the slot.
+    """
+    row = db.query(Application.id, Job.posted_by).join(
+        Job, Application.job_id == Job.id
+    ).filter(Application.id == interview_data.application_id).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+
+    if row.posted_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only schedule interviews for jobs you posted"
+        )
+
+    interviewer_id = interview_data.interviewer_id or current_user.id
+    _lock_interviewer(db, interviewer_id)
+    _check_conflicts(db, interviewer_id, interview_data.scheduled_at, interview_data.duration_minutes)
+
+    new_interview = Interview(
+        **interview_data.dict(exclude={"interviewer_id"}),
+        interviewer_id=interviewer_id,
+        status="scheduled"
+    )
+
+    db.add(new_interview)
+    db.commit()
+    db.refresh(new_interview)
+
+    return new_interview
+
+
+@router.get("", response_model=List[InterviewResponse])
+def get_my_interviews(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    status: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get interviews of the current user, earliest first.
+
+    Recruiters see interviews they conduct and interviews for jobs they
+    posted; candidates see interviews for their applications.
+
+    - **start** / **end**: Only interviews scheduled in this range
+    - **status**: Only interviews with this status
+    """
+    query = db.query(Interview).join(Application, Interview.application_id == Application.id)
+
+    if current_user.role == "candidate":
+        query = query.join(Candidate, Application.candidate_id == Candidate.id).filter(
+            Candidate.user_id == current_user.id
+        )
+    else:
+        query = query.join(Job, Application.job_id == Job.id).filter(
+            or_(Interview.interviewer_id == current_user.id, Job.posted_by == current_user.id)
+        )
+
+    if start:
+        query = query.filter(Interview.scheduled_at >= start)
+    if end:
+        query = query.filter(Interview.scheduled_at < end)
+    if status:
+        query = query.filter(Interview.status == status)
+
+    return query.order_by(Interview.scheduled_at).offset(skip).limit(limit).all()
+
+
+@router.get("/availability", response_model=List[InterviewSlot])
+def get_free_slots(
+    interviewer_ids: Optional[List[UUID]] = Query(None, description="Defaults to the current recruiter"),
+    start: Optional[datetime] = Query(None, description="Earliest slot start (default: now)"),
+    days: int = Query(14, ge=1, le=60, description="How far ahead to search"),
+    duration_minutes: int = Query(60, ge=15, le=480),
+    step_minutes: int = Query(30, ge=5, le=240, description="Granularity of slot starts"),
+    count: int = Query(10, ge=1, le=50),
+    require: str = Query("all", pattern="^(all|any)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Find the next free interview slots (recruiter only).
+
+    Busy time of all interviewers is read with one range query and
+    searched in memory, so this is cheap enough to call as the user types.
+    Slots lie within working hours (INTERVIEW_DAY_START_HOUR to
+    INTERVIEW_DAY_END_HOUR UTC, Monday to Friday).
+
+    - **require**: `all` for slots where every interviewer is free (a panel),
+      `any` for slots where at least one of them is
+    """
+    interviewer_ids = list(dict.fromkeys(interviewer_ids or [current_user.id]))
+    if len(interviewer_ids) > MAX_AVAILABILITY_INTERVIEWERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_AVAILABILITY_INTERVIEWERS} interviewers can be searched at once"
+        )
+
+    window_start = as_utc(start) if start else datetime.now(timezone.utc)
+    window_end = window_start + timedelta(days=days)
+    duration = timedelta(minutes=duration_minutes)
+
+    calendars = load_calendars(db, interviewer_ids, window_start, window_end)
+    slots = find_free_slots(
+        calendars, window_start, window_end, duration, timedelta(minutes=step_minutes), count,
+        require_all=require == "all"
+    )
+    return [
+        {"start": slot_start, "end": slot_start + duration, "interviewer_ids": free}
+        for slot_start, free in slots
+    ]
+
+
+@router.get("/{interview_id}", response_model=InterviewResponse)
+def get_interview(
+    interview_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a specific interview by ID.
+
+    Available to the candidate, the interviewer and the recruiter who posted the job.
+    """
+    interview, posted_by, candidate_user_id = _get_interview(db, interview_id)
+
+    if current_user.id not in (posted_by, candidate_user_id, interview.interviewer_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this interview"
+        )
+
+    return interview
+
+
+@router.put("/{interview_id}", response_model=InterviewResponse)
+def update_interview(
+    interview_id: UUID,
+    interview_data: InterviewUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Reschedule an interview, change its status or record feedback (recruiter only).
+
+    Available to the interviewer and the recruiter who posted the job.
+    Moving an active interview is checked for conflicts like a new booking.
+    """
+    interview, posted_by, _ = _get_interview(db, interview_id)
+
+    if current_user.id not in (posted_by, interview.interviewer_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only update interviews you conduct or for jobs you posted"
+        )
+
+    update_data = interview_data.dict(exclude_unset=True)
+    interviewer_id = update_data.get("interviewer_id") or interview.interviewer_id
+    new_status = update_data.get("status", interview.status)
+    moved = any(
+        field in update_data and update_data[field] != getattr(interview, field)
+        for field in ("scheduled_at", "duration_minutes", "interviewer_id")
+    )
+    reactivated = new_status in ACTIVE_INTERVIEW_STATUSES and interview.status not in ACTIVE_INTERVIEW_STATUSES
+
+    if interviewer_id and new_status in ACTIVE_INTERVIEW_STATUSES and (moved or reactivated):
+        _lock_interviewer(db, interviewer_id)
+        _check_conflicts(
+            db,
+            interviewer_id,
+            update_data.get("scheduled_at") or interview.scheduled_at,
+            update_data.get("duration_minutes") or interview.duration_minutes,
+            exclude_id=interview.id
+        )
+
+    for field, value in update_data.items():
+        setattr(interview, field, value)
+
+    db.commit()
+    db.refresh(interview)
+
+    return interview
@@ -1,18 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, UploadFile, File
+from pydantic import ValidationError
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import or_, and_
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
+import uuid
 
 from app.database import get_db
 from app.models import Job, Company, User
-from app.schemas import JobCreate, JobUpdate, JobResponse
+from app.schemas import JobCreate, JobUpdate, JobResponse, JobImportResponse, JobImportRowError
 from app.api.auth import get_current_user, require_role
+from app.core.admission import admission
+from app.core.bulk import copy_rows, detect_format, iter_records, validation_messages
+from app.core.cache import MISSING, get_cache
+from app.core.config import settings
+from app.core.serialization import (
+    job_adapter, job_list_adapter, json_response, serialize_list, serialize_one
+)
+from app.core.singleflight import single_flight
+from app.core.fieldsets import JOB_FIELDS
+from app.ml.skills import get_skill_canonicalizer
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+# Concurrent identical public reads share one query
+job_reads = single_flight("get_job")
+company_job_reads = single_flight("get_company_jobs")
 
-@router.get("", response_model=List[JobResponse])
+# Invalidated through the "job:<id>" and "company:<id>" tags on writes
+job_cache = get_cache("jobs", settings.CACHE_JOB_TTL_SECONDS)
+
+# Columns written by the bulk import, in COPY order
+JOB_IMPORT_COLUMNS = (
+    "id", "company_id", "title", "description", "location", "location_lat", "location_lon",
+    "remote_type", "employment_type", "skills_required", "salary_min", "salary_max",
+    "currency", "experience_min", "experience_max", "status", "posted_by",
+)
+
+
+def skill_filter_cost(request: Request) -> float:
+    """Admission cost of a job search: one token per skill term (free without a skill filter)."""
+    skills = request.query_params.get("skills") or ""
+    return float(sum(1 for skill in skills.split(",") if skill.strip()))
+
+
+@router.get("", response_model=List[Dict[str, Any]], dependencies=[Depends(admission("job_search", skill_filter_cost))])
 def get_jobs(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -21,6 +53,9 @@ def get_jobs(
     remote_type: Optional[str] = Query(None, pattern="^(on-site|remote|hybrid)$"),
     skills: Optional[str] = None,  # Comma-separated skills to search for
     title: Optional[str] = None,  # Search in job title
+    near: Optional[str] = None,  # Place name to search around
+    radius_km: float = Query(50, gt=0, le=1000),
+    fields: Optional[str] = None,  # Comma-separated fields to return
     db: Session = Depends(get_db)
 ):
     """
@@ -33,8 +68,16 @@ def get_jobs(
     - **remote_type**: Filter by remote type
     - **skills**: Comma-separated skills to search for
     - **title**: Search in job title (partial match)
+    - **near**: Only jobs within `radius_km` of this place (e.g. "NYC", "Austin, TX")
+    - **radius_km**: Search radius for `near` (default 50 km)
+    - **fields**: Comma-separated fields to return (defaults to everything except `description`;
+      `description_preview` carries a short excerpt)
+    
+    Items carry the `JobResponse` fields selected by `fields`, so the
+    response is declared as plain objects.
     """
-    query = db.query(Job)
+    selected = JOB_FIELDS.parse(fields)
+    query = db.query(Job).options(*JOB_FIELDS.load_options(selected))
     
     # Default to published jobs only for public access
     if status:
@@ -52,10 +95,24 @@ def get_jobs(
     if title:
         query = query.filter(Job.title.ilike(f"%{title}%"))
     
+    if near:
+        from app.ml.geo import geocode, within_radius
+        
+        coordinates = geocode(near)
+        if not coordinates:
+            # The status query parameter shadows fastapi.status in this function
+            raise HTTPException(status_code=400, detail=f"Unknown location: {near}")
+        query = query.filter(within_radius(Job.location_lat, Job.location_lon, *coordinates, radius_km))
+    
     if skills:
-        # Search for any of the provided skills
-        skill_list = [s.strip() for s in skills.split(",")]
-        skill_filters = [Job.skills_required.ilike(f"%{skill}%") for skill in skill_list]
+        # Search for any of the provided skills, including aliases and typo fixes
+        canonicalizer = get_skill_canonicalizer()
+        skill_list = {
+            variant
+            for s in skills.split(",") if s.strip()
+            for variant in canonicalizer.variants(s)
+        }
+        skill_filters = [Job.skills_required.ilike(f"%{skill}%") for skill in sorted(skill_list)]
         query = query.filter(or_(*skill_filters))
     
     # Order by most recent first
@@ -63,11 +120,7 @@ def get_jobs(
     
     jobs = query.offset(skip).limit(limit).all()
     
-    # Load company relationship
-    for job in jobs:
-        job.company  # This triggers lazy loading
-    
-    return jobs
+    return json_response(JOB_FIELDS.serialize(jobs, selected))
 
 
 @router.get("/my", response_model=List[JobResponse])
@@ -93,7 +146,7 @@ def get_my_jobs(
             Application.job_id == job.id
         ).count()
     
-    return jobs
+    return json_response(serialize_list(job_list_adapter, jobs))
 
 
 @router.get("/{job_id}", response_model=JobResponse)
@@ -103,15 +156,23 @@ def get_job(job_id: UUID, db: Session = Depends(get_db)):
     
     Returns job details including company information.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
-    
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
-    
-    return job
+    def load_job() -> dict:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        
+        return serialize_one(job_adapter, job)
+    
+    job = job_cache.get(job_id)
+    if job is MISSING:
+        job = job_reads.do(job_id, load_job)
+        job_cache.set(job_id, job, tags=[f"job:{job_id}", f"company:{job['company_id']}"])
+    
+    return json_response(job)
 
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -149,10 +210,138 @@ def create_job(
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
+    job_cache.invalidate(f"company:{new_job.company_id}")
+    
+    # Precompute the relevance vector for published jobs
+    if new_job.status == "published":
+        from app.ml.relevance import relevance_index
+        
+        relevance_index.job_vector(new_job)
     
     return new_job
 
 
+@router.post("/import", response_model=JobImportResponse)
+def import_jobs(
+    company_id: UUID = Query(...),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|jsonl)$"),
+    dry_run: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Create many jobs from a CSV or JSONL file (recruiter only).
+    
+    Each row or line carries the `JobCreate` fields; `company_id` comes from
+    the query and may be omitted in the file. Rows are validated as they are
+    read, valid rows are loaded in one transaction and invalid ones are
+    reported by row number. A file that is not valid UTF-8 is rejected as a
+    whole. With `dry_run` nothing is written.
+    
+    - **format**: `csv` or `jsonl` (default: from the file extension)
+    """
+    from app.ml.geo import geocode
+    from app.ml.relevance import relevance_index
+    
+    # Verify company exists and user has access (once for the whole file)
+    company = db.query(Company).filter(Company.id == company_id).first()
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found"
+        )
+    
+    if company.created_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only post jobs for companies you created"
+        )
+    
+    bulk_format = detect_format(file.filename, format)
+    if bulk_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file format. Only CSV and JSONL files are supported."
+        )
+    
+    job_ids: List[UUID] = []
+    published_ids: List[UUID] = []
+    errors: List[JobImportRowError] = []
+    
+    def valid_rows():
+        for number, record, error in iter_records(file.file, bulk_format):
+            if number > settings.JOB_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Imports are limited to {settings.JOB_IMPORT_MAX_ROWS} rows"
+                )
+            if error:
+                errors.append(JobImportRowError(row=number, errors=[error]))
+                continue
+            if str(record.get("company_id", company_id)).lower() != str(company_id):
+                errors.append(JobImportRowError(row=number, errors=["company_id: does not match the import company"]))
+                continue
+            try:
+                job = JobCreate(**{**record, "company_id": company_id})
+            except ValidationError as e:
+                errors.append(JobImportRowError(row=number, errors=validation_messages(e)))
+                continue
+            
+            # COPY bypasses the ORM geocoding hook, so resolve coordinates here
+            latitude, longitude = geocode(job.location) or (None, None)
+            job_id = uuid.uuid4()
+            job_ids.append(job_id)
+            if job.status == "published":
+                published_ids.append(job_id)
+            yield (
+                job_id, company_id, job.title, job.description, job.location, latitude, longitude,
+                job.remote_type, job.employment_type, job.skills_required, job.salary_min, job.salary_max,
+                job.currency, job.experience_min, job.experience_max, job.status, current_user.id,
+            )
+    
+    try:
+        if dry_run:
+            imported = sum(1 for _ in valid_rows())
+        else:
+            imported = copy_rows(db, Job.__table__, JOB_IMPORT_COLUMNS, valid_rows())
+            db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except ValueError as e:
+        # Undecodable upload: drop the rows read before the bad byte as well
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{e}; no jobs were imported"
+        )
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error importing jobs: {type(e).__name__}"
+        )
+    
+    if not dry_run:
+        job_cache.invalidate(f"company:{company_id}")
+        # COPY bypasses the ORM, so run create_job's post-insert work for the new jobs
+        if published_ids:
+            published = db.query(Job).options(load_only(
+                Job.id, Job.title, Job.skills_required, Job.description, Job.updated_at
+            )).filter(Job.id.in_(published_ids))
+            for job in published.yield_per(1000):
+                relevance_index.job_vector(job)
+    
+    return JobImportResponse(
+        imported=imported,
+        failed=len(errors),
+        dry_run=dry_run,
+        job_ids=[] if dry_run else job_ids,
+        errors=errors
+    )
+
+
 @router.patch("/{job_id}", response_model=JobResponse)
 def update_job(
     job_id: UUID,
@@ -187,6 +376,15 @@ def update_job(
     
     db.commit()
     db.refresh(job)
+    job_cache.invalidate(f"job:{job.id}", f"company:{job.company_id}")
+    
+    # Keep the relevance vector current for published jobs only
+    from app.ml.relevance import relevance_index
+    
+    if job.status == "published":
+        relevance_index.job_vector(job)
+    else:
+        relevance_index.discard_job(job.id)
     
     return job
 
@@ -217,26 +415,46 @@ def delete_job(
             detail="You can only delete jobs you posted"
         )
     
+    company_id = job.company_id
     db.delete(job)
     db.commit()
+    job_cache.invalidate(f"job:{job_id}", f"company:{company_id}")
+    
+    from app.ml.relevance import relevance_index
+    
+    relevance_index.discard_job(job_id)
     
     return None
 
 
-@router.get("/company/{company_id}", response_model=List[JobResponse])
+@router.get("/company/{company_id}", response_model=List[Dict[str, Any]])
 def get_company_jobs(
     company_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
     Get all jobs for a specific company.
     
     Returns published jobs only for public access.
+    Accepts the same `fields` parameter as the job listing (items carry
+    only the selected `JobResponse` fields).
     """
-    jobs = db.query(Job).filter(
-        and_(Job.company_id == company_id, Job.status == "published")
-    ).order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return jobs
+    selected = JOB_FIELDS.parse(fields)
+    
+    def load_jobs() -> list:
+        jobs = db.query(Job).options(*JOB_FIELDS.load_options(selected)).filter(
+            and_(Job.company_id == company_id, Job.status == "published")
+        ).order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
+        return JOB_FIELDS.serialize(jobs, selected)
+    
+    key = (company_id, skip, limit, tuple(selected))
+    cache_key = f"company:{company_id}:{skip}:{limit}:{','.join(selected)}"
+    jobs = job_cache.get(cache_key)
+    if jobs is MISSING:
+        jobs = company_job_reads.do(key, load_jobs)
+        job_cache.set(cache_key, jobs, tags=[f"company:{company_id}"])
+    
+    return json_response(jobs)
@@ -1,18 +1,60 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
 from sqlalchemy.orm import Session
+from typing import List
 from uuid import UUID
+import os
+
+import anyio
 
 from app.database import get_db
-from app.models import Application, ScreeningAnswer
-from app.schemas import ResumeParseResponse, ScreeningScoreRequest, ScreeningScoreResponse
-from app.api.auth import get_current_user, User
-from app.ml.resume_parser import parse_resume
+from app.models import Application, Job, ScreeningAnswer
+from app.schemas import (
+    ResumeParseResponse, ScreeningScoreRequest, ScreeningScoreResponse, CandidateMatchResponse,
+    RankedCandidatesResponse, RankedCandidate
+)
+from app.api.auth import get_current_user, require_role, User
+from app.core.admission import admission
+from app.core.blobstore import get_resume_store
+from app.core.singleflight import single_flight
+from app.ml.resume_parser import extract_fields, extract_resume_text
 from app.ml.screening import score_answer_auto, calculate_overall_screening_score
 
 router = APIRouter(prefix="/ml", tags=["ML/AI"])
 
+# Concurrent rankings of the same job version share one computation
+candidate_rankings = single_flight("recommend_candidates")
+scatter_rankings = single_flight("ranked_candidates")
+
 
-@router.post("/parse-resume", response_model=ResumeParseResponse)
+def parse_resume_file(file_content: bytes, filename: str) -> ResumeParseResponse:
+    """
+    Extract the fields of a resume, keeping the file and its text when RESUME_STORE_DIR is set.
+    
+    Blocking (text extraction, file writes and fsync), so the endpoint runs
+    it in a worker thread.
+    
+    Raises:
+        ValueError: If the file cannot be read as PDF or DOCX
+    """
+    store = get_resume_store()
+    if store is None:
+        return ResumeParseResponse(**extract_fields(extract_resume_text(file_content, filename)))
+    
+    # Keep the file; a re-upload of the same bytes reuses its stored text
+    digest, _ = store.put(file_content, os.path.splitext(filename)[1])
+    text = store.get_text(digest)
+    if text is None:
+        text = extract_resume_text(file_content, filename)
+        store.put_text(digest, text)
+    
+    return ResumeParseResponse(
+        **extract_fields(text),
+        resume_id=digest,
+        resume_url=f"/api/resumes/{digest}"
+    )
+
+
+@router.post("/parse-resume", response_model=ResumeParseResponse, dependencies=[Depends(admission("resume_parse"))])
 async def parse_resume_endpoint(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user)
@@ -28,6 +70,9 @@ async def parse_resume_endpoint(
     
     **File size limit**: 10MB
     **Supported formats**: PDF, DOCX
+    
+    When RESUME_STORE_DIR is set the file and its extracted text are kept;
+    the response then carries `resume_url` for the candidate profile.
     """
     # Validate file size (10MB limit)
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
@@ -49,10 +94,7 @@ async def parse_resume_endpoint(
         )
     
     try:
-        # Parse resume
-        parsed_data = parse_resume(file_content, file.filename)
-        
-        return ResumeParseResponse(**parsed_data)
+        return await anyio.to_thread.run_sync(parse_resume_file, file_content, file.filename)
     
     except ValueError as e:
         raise HTTPException(
@@ -66,7 +108,7 @@ async def parse_resume_endpoint(
         )
 
 
-@router.post("/score-screening", response_model=ScreeningScoreResponse)
+@router.post("/score-screening", response_model=ScreeningScoreResponse, dependencies=[Depends(admission("screening"))])
 def score_screening_answers(
     request: ScreeningScoreRequest,
     db: Session = Depends(get_db),
@@ -141,3 +183,97 @@ def score_screening_answers(
         overall_score=overall_score,
         answer_scores=answer_scores
     )
+
+
+@router.get("/jobs/{job_id}/candidates", response_model=List[CandidateMatchResponse])
+def recommend_candidates(
+    job_id: UUID,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Find the candidates whose skills best match a job (recruiter only).
+    
+    Candidates are retrieved from a MinHash LSH index over skill sets and
+    only the retrieved set is reranked with the exact skills match, so the
+    lookup does not scan the whole candidate table.
+    """
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.posted_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view candidates for jobs you posted"
+        )
+    
+    def rank() -> list:
+        from app.ml.lsh import get_candidate_index, rank_candidates
+        from app.ml.matcher import parse_skills
+        
+        index = get_candidate_index(db)
+        return rank_candidates(index, parse_skills(job.skills_required), limit)
+    
+    ranked = candidate_rankings.do((job.id, job.updated_at, limit), rank)
+    return [
+        CandidateMatchResponse(
+            candidate_id=candidate_id,
+            match_percentage=round(match_pct, 2),
+            matched_skills=matched,
+            missing_skills=missing
+        )
+        for candidate_id, match_pct, matched, missing in ranked
+    ]
+
+
+@router.get("/jobs/{job_id}/ranked-candidates", response_model=RankedCandidatesResponse)
+def ranked_candidates(
+    job_id: UUID,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Rank all candidates for a job by full match score (recruiter only).
+    
+    The request is scattered to the scorer shards configured in
+    SCATTER_ADDRESSES and their top candidates are merged. If a shard
+    misses its deadline the response is flagged as partial.
+    """
+    from app.ml.scatter import get_coordinator
+    
+    coordinator = get_coordinator()
+    if coordinator is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Scatter-gather scoring is not configured"
+        )
+    
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.posted_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view candidates for jobs you posted"
+        )
+    
+    result = scatter_rankings.do((job.id, job.updated_at, limit), lambda: coordinator.top_k(job, limit))
+    return RankedCandidatesResponse(
+        job_id=job.id,
+        partial=result.partial,
+        missing_shards=result.missing_shards,
+        candidates=[
+            RankedCandidate(candidate_id=candidate_id, match_score=score)
+            for candidate_id, score in result.candidates
+        ]
+    )
@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Request
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import Candidate, User
+from app.api.auth import get_current_user
+from app.core.blobstore import BlobStore, get_resume_store, parse_range
+
+router = APIRouter(prefix="/resumes", tags=["Resumes"])
+
+RESUME_ID = Path(..., pattern="^[0-9a-f]{64}$", description="SHA-256 of the resume file")
+
+
+def _stored_resume(resume_id: str, db: Session, current_user: User) -> BlobStore:
+    """Return the store holding a resume the current user may read, or raise 404/403."""
+    store = get_resume_store()
+    if store is None or not store.exists(resume_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+
+    # Recruiters can view candidate resumes; candidates only the one on their profile
+    if current_user.role == "candidate":
+        own = db.query(Candidate.id).filter(
+            Candidate.user_id == current_user.id,
+            Candidate.resume_url.like(f"%{resume_id}%")
+        ).first()
+        if not own:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only view your own resume"
+            )
+
+    return store
+
+
+@router.get("/{resume_id}")
+def download_resume(
+    request: Request,
+    resume_id: str = RESUME_ID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download a stored resume file.
+
+    Supports single `Range: bytes=start-end` requests (206 Partial Content)
+    so PDF viewers can fetch pages on demand. Content never changes for a
+    given id, so responses carry the id as a strong ETag.
+    """
+    store = _stored_resume(resume_id, db, current_user)
+    metadata = store.metadata(resume_id) or {}
+    size = metadata.get("size") or 0
+    media_type = metadata.get("content_type", "application/octet-stream")
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{resume_id}"',
+        "Cache-Control": "private, max-age=31536000, immutable",
+    }
+
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{size}"}
+        )
+
+    if byte_range is None:
+        filename = f"resume-{resume_id[:12]}{metadata.get('extension', '')}"
+        return FileResponse(store.path(resume_id), media_type=media_type, filename=filename, headers=headers)
+
+    start, end = byte_range
+    return StreamingResponse(
+        store.read_range(resume_id, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers={
+            **headers,
+            "Content-Range": f"bytes {start}-{end}/{size}",
+            "Content-Length": str(end - start + 1),
+        }
+    )
+
+
+@router.get("/{resume_id}/text", response_class=PlainTextResponse)
+def get_resume_text(
+    resume_id: str = RESUME_ID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the plain text extracted from a stored resume.
+    """
+    store = _stored_resume(resume_id, db, current_user)
+    text = store.get_text(resume_id)
+    if text is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No extracted text for this resume"
+        )
+    return PlainTextResponse(text)
@@ -0,0 +1,308 @@
+"""
+Admission control for expensive endpoints.
+
+Each route class has a token bucket (sustained rate plus burst) and a cap
+on concurrent requests, both kept per caller: the JWT `sub` when a valid
+token is sent, the client address otherwise. The check runs as the
+first dependency of a route and only decodes the token, so rejected
+requests never reach the database or the parsers. Rejections are 429
+with a Retry-After header.
+
+With RATE_LIMIT_URL at its default (`memory://`) the state lives in each
+worker process, so N workers admit up to N times the configured limits.
+A `redis://host:port/db` URL keeps it on a Redis-protocol server shared
+by every worker and host.
+"""
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.core.cache import CacheError, RedisCacheBackend
+from app.core.config import settings
+from app.core.security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying when the concurrency cap is the limit
+CONCURRENCY_RETRY_AFTER = 1
+
+# Shared in-flight counters expire this long after the last acquire, so slots
+# held by a worker that died are eventually freed
+IN_FLIGHT_TTL_SECONDS = 300
+
+# Shared buckets count tokens in thousandths (the server only has integer counters)
+TOKEN_UNITS = 1000
+
+
+class RouteLimit(NamedTuple):
+    """Per-caller limits of one route class."""
+    per_minute: float
+    burst: float
+    concurrency: int
+
+    @classmethod
+    def parse(cls, value: str) -> "RouteLimit":
+        """Parse a "requests_per_minute,burst,max_concurrent" setting."""
+        per_minute, burst, concurrency = (part.strip() for part in value.split(","))
+        return cls(float(per_minute), float(burst), int(concurrency))
+
+
+def route_limits() -> Dict[str, RouteLimit]:
+    """Limits of every route class, from settings."""
+    return {
+        "resume_parse": RouteLimit.parse(settings.RATE_LIMIT_RESUME_PARSE),
+        "screening": RouteLimit.parse(settings.RATE_LIMIT_SCREENING),
+        "job_search": RouteLimit.parse(settings.RATE_LIMIT_JOB_SEARCH),
+    }
+
+
+class AdmissionBackend:
+    """Storage of token buckets and in-flight counters."""
+
+    def take(self, key: str, cost: float, rate: float, burst: float) -> float:
+        """
+        Take `cost` tokens from a bucket.
+
+        Args:
+            key: Bucket key
+            cost: Tokens the request needs
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity
+
+        Returns:
+            0 if the tokens were taken, otherwise seconds until they will be available
+        """
+        raise NotImplementedError
+
+    def acquire(self, key: str, limit: int) -> bool:
+        """Take an in-flight slot if fewer than `limit` are taken."""
+        raise NotImplementedError
+
+    def release(self, key: str) -> None:
+        """Return a slot taken by `acquire`."""
+        raise NotImplementedError
+
+
+class InProcessAdmissionBackend(AdmissionBackend):
+    """Buckets and counters in a dict guarded by a lock."""
+
+    def __init__(self, max_buckets: int = 100_000):
+        self.max_buckets = max_buckets
+        self._buckets: Dict[str, list] = {}  # key -> [tokens, updated_at, rate, burst]
+        self._in_flight: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, cost: float, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_buckets:
+                    self._prune(now)
+                bucket = self._buckets[key] = [burst, now, rate, burst]
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1:] = [now, rate, burst]
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                return 0.0
+            bucket[0] = tokens
+            return (cost - tokens) / rate
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled completely (indistinguishable from new ones)."""
+        full = [
+            key for key, (tokens, updated_at, rate, burst) in self._buckets.items()
+            if tokens + (now - updated_at) * rate >= burst
+        ]
+        for key in full:
+            del self._buckets[key]
+
+    def acquire(self, key: str, limit: int) -> bool:
+        with self._lock:
+            if self._in_flight[key] >= limit:
+                return False
+            self._in_flight[key] += 1
+            return True
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._in_flight[key] -= 1
+            if self._in_flight[key] <= 0:
+                del self._in_flight[key]
+
+
+class SharedAdmissionBackend(AdmissionBackend):
+    """
+    Buckets and counters on a Redis-protocol server, shared by every worker.
+
+    Only atomic INCRBY is used, so no script support is needed. Each
+    bucket is a fixed window of `burst / rate` seconds admitting `burst`
+    tokens: the bucket's sustained rate and burst, except that a caller
+    can spend two bursts across a window boundary. If the server cannot
+    be reached, requests are admitted and the failure counted, as cache
+    errors are treated as misses.
+    """
+
+    def __init__(self, backend: RedisCacheBackend, prefix: str = ""):
+        self.backend = backend
+        self.prefix = f"{prefix}admission:"
+        self.errors = 0
+
+    def _failed(self, operation: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning("Admission backend %s failed: %s", operation, error)
+
+    def take(self, key: str, cost: float, rate: float, burst: float) -> float:
+        window = burst / rate
+        now = time.time()
+        index = int(now // window)
+        counter = f"{self.prefix}rate:{key}:{index}"
+        units = max(1, round(cost * TOKEN_UNITS))
+        try:
+            used = self.backend.execute("INCRBY", counter, units)
+            if used == units:
+                self.backend.execute("PEXPIRE", counter, int(window * 2000) + 1)
+            if used <= burst * TOKEN_UNITS:
+                return 0.0
+            # Rejected requests do not use up the window
+            self.backend.execute("INCRBY", counter, -units)
+        except (OSError, CacheError) as e:
+            self._failed("take", e)
+            return 0.0
+        return (index + 1) * window - now
+
+    def acquire(self, key: str, limit: int) -> bool:
+        counter = f"{self.prefix}in_flight:{key}"
+        try:
+            count = self.backend.execute("INCRBY", counter, 1)
+            self.backend.execute("PEXPIRE", counter, IN_FLIGHT_TTL_SECONDS * 1000)
+            if count <= limit:
+                return True
+            self.backend.execute("INCRBY", counter, -1)
+        except (OSError, CacheError) as e:
+            self._failed("acquire", e)
+            return True
+        return False
+
+    def release(self, key: str) -> None:
+        try:
+            self.backend.execute("INCRBY", f"{self.prefix}in_flight:{key}", -1)
+        except (OSError, CacheError) as e:
+            self._failed("release", e)
+
+
+_backend: Optional[AdmissionBackend] = None
+_outcomes: Counter = Counter()  # (route class, outcome) -> requests
+
+
+def get_admission_backend() -> AdmissionBackend:
+    """Backend selected by RATE_LIMIT_URL ("memory://" or "redis://host:port/db"), built on first use."""
+    global _backend
+    if _backend is None:
+        url = settings.RATE_LIMIT_URL
+        if url.startswith(("redis://", "tcp://")):
+            _backend = SharedAdmissionBackend(
+                RedisCacheBackend(url, timeout=settings.CACHE_TIMEOUT_SECONDS), settings.CACHE_KEY_PREFIX
+            )
+        elif url and not url.startswith("memory://"):
+            raise ValueError(f"Unsupported RATE_LIMIT_URL scheme: {url}")
+        else:
+            _backend = InProcessAdmissionBackend()
+    return _backend
+
+
+def set_admission_backend(backend: AdmissionBackend) -> None:
+    """Use a different backend than the one RATE_LIMIT_URL selects."""
+    global _backend
+    _backend = backend
+
+
+def caller_key(request: Request) -> str:
+    """Identify the caller by JWT subject, or by client address for anonymous requests."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = decode_access_token(token)
+        if payload and payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def admit(route_class: str, key: str, cost: float = 1.0) -> Tuple[bool, str]:
+    """
+    Admit a request of a route class or raise 429.
+
+    Args:
+        route_class: Key of `route_limits()`
+        key: Caller key from `caller_key`
+        cost: Tokens charged (capped at the burst size)
+
+    Returns:
+        Whether an in-flight slot was taken, and its key for `release`
+
+    Raises:
+        HTTPException: 429 with Retry-After when a limit is exceeded
+    """
+    limit = route_limits()[route_class]
+    slot = f"{route_class}:{key}"
+    backend = get_admission_backend()
+    if limit.concurrency > 0 and not backend.acquire(slot, limit.concurrency):
+        _outcomes[route_class, "rejected_concurrency"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many concurrent requests",
+            headers={"Retry-After": str(CONCURRENCY_RETRY_AFTER)},
+        )
+    acquired = limit.concurrency > 0
+
+    if limit.per_minute > 0:
+        wait = backend.take(slot, min(cost, limit.burst), limit.per_minute / 60.0, limit.burst)
+        if wait > 0:
+            if acquired:
+                backend.release(slot)
+            _outcomes[route_class, "rejected_rate"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+    _outcomes[route_class, "admitted"] += 1
+    return acquired, slot
+
+
+def admission(route_class: str, cost: Optional[Callable[[Request], float]] = None):
+    """
+    Dependency factory applying the limits of a route class.
+
+    List it first in the route's `dependencies` so it runs before the
+    session and user lookups. `cost` maps a request to the tokens it is
+    charged; returning 0 lets the request through unchecked.
+    """
+    async def admission_checker(request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            yield
+            return
+        charge = cost(request) if cost is not None else 1.0
+        if charge <= 0:
+            yield
+            return
+        acquired, slot = admit(route_class, caller_key(request), charge)
+        try:
+            yield
+        finally:
+            if acquired:
+                get_admission_backend().release(slot)
+
+    return admission_checker
+
+
+def admission_stats() -> Dict[str, Dict[str, int]]:
+    """Admitted and rejected requests per route class in this process."""
+    stats: Dict[str, Dict[str, int]] = {}
+    for (route_class, outcome), count in sorted(_outcomes.items()):
+        stats.setdefault(route_class, {})[outcome] = count
+    return stats
@@ -0,0 +1,200 @@
+"""
+Content-addressed local blob store for uploaded resumes.
+
+Blobs are keyed by the SHA-256 of their bytes, so re-uploading a file
+stores nothing new. Each blob lives at `<root>/<ab>/<cd>/<digest>` (the
+first two byte pairs of the digest shard the directories) with two
+sidecars:
+- `<digest>.meta.json`: original extension, content type and size
+- `<digest>.txt`: plain text extracted by the resume parser, so later
+  scoring and re-parsing never re-open the PDF or DOCX
+
+Every file is written to `<root>/tmp` first and moved into place with
+`os.replace`, so readers never see a partial file and concurrent
+uploads of the same content are harmless.
+"""
+import hashlib
+import io
+import os
+import re
+import tempfile
+from functools import lru_cache
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+import orjson
+
+from app.core.config import settings
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+CHUNK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+class BlobStore:
+    """Sharded, deduplicating file store addressed by SHA-256."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.tmp = os.path.join(self.root, "tmp")
+        os.makedirs(self.tmp, exist_ok=True)
+
+    def path(self, digest: str, suffix: str = "") -> str:
+        """Location of a blob (or one of its sidecars)."""
+        if not DIGEST_PATTERN.match(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest[2:4], digest + suffix)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def _write_atomic(self, path: str, chunks) -> None:
+        """Write chunks to a temporary file, fsync it and move it to `path`."""
+        descriptor, tmp_path = tempfile.mkstemp(dir=self.tmp)
+        try:
+            with os.fdopen(descriptor, "wb") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+                output.flush()
+                os.fsync(output.fileno())
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def put(self, source: Union[bytes, BinaryIO], extension: str) -> Tuple[str, bool]:
+        """
+        Store content unless an identical blob already exists.
+
+        Args:
+            source: File content, or a binary file object read in chunks
+            extension: Original file extension (e.g. ".pdf"), kept in the metadata
+
+        Returns:
+            (hex SHA-256 digest, whether a new blob was written)
+        """
+        stream = io.BytesIO(source) if isinstance(source, bytes) else source
+        hasher = hashlib.sha256()
+        size = 0
+        descriptor, tmp_path = tempfile.mkstemp(dir=self.tmp)
+        try:
+            with os.fdopen(descriptor, "wb") as output:
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    output.write(chunk)
+                    size += len(chunk)
+                output.flush()
+                os.fsync(output.fileno())
+            digest = hasher.hexdigest()
+            path = self.path(digest)
+            if os.path.exists(path):
+                os.unlink(tmp_path)
+                return digest, False
+            extension = extension.lower()
+            metadata = {
+                "extension": extension,
+                "content_type": CONTENT_TYPES.get(extension, "application/octet-stream"),
+                "size": size,
+            }
+            # Metadata first: a blob that exists always has its metadata
+            self._write_atomic(self.path(digest, ".meta.json"), [orjson.dumps(metadata)])
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+            return digest, True
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def metadata(self, digest: str) -> Optional[dict]:
+        """Extension, content type and size of a blob, or None if it is not stored."""
+        try:
+            with open(self.path(digest, ".meta.json"), "rb") as meta:
+                return orjson.loads(meta.read())
+        except FileNotFoundError:
+            return None
+
+    def read(self, digest: str) -> bytes:
+        with open(self.path(digest), "rb") as blob:
+            return blob.read()
+
+    def read_range(self, digest: str, start: int, end: int) -> Iterator[bytes]:
+        """Yield bytes `start` to `end` (inclusive) of a blob in chunks."""
+        with open(self.path(digest), "rb") as blob:
+            blob.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = blob.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def put_text(self, digest: str, text: str) -> None:
+        """Store the extracted plain text of a blob (replacing any previous text)."""
+        self._write_atomic(self.path(digest, ".txt"), [text.encode("utf-8")])
+
+    def get_text(self, digest: str) -> Optional[str]:
+        """Extracted plain text of a blob, or None if none has been stored."""
+        try:
+            with open(self.path(digest, ".txt"), "rb") as text:
+                return text.read().decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def digests(self) -> Iterator[str]:
+        """Digests of every stored blob, in directory order."""
+        for shard in sorted(os.listdir(self.root)):
+            if len(shard) != 2 or shard == "tmp":
+                continue
+            for subshard in sorted(os.listdir(os.path.join(self.root, shard))):
+                for name in sorted(os.listdir(os.path.join(self.root, shard, subshard))):
+                    if DIGEST_PATTERN.match(name):
+                        yield name
+
+
+@lru_cache(maxsize=1)
+def get_resume_store() -> Optional[BlobStore]:
+    """The resume blob store under RESUME_STORE_DIR, or None when it is not configured."""
+    if not settings.RESUME_STORE_DIR:
+        return None
+    return BlobStore(settings.RESUME_STORE_DIR)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range `Range: bytes=...` header.
+
+    Args:
+        header: Header value (None when absent)
+        size: Blob size in bytes
+
+    Returns:
+        Inclusive (start, end), or None to serve the whole blob (no header,
+        another unit, or several ranges)
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    if not header or not header.startswith("bytes=") or "," in header or size == 0:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                raise ValueError("Empty suffix range")
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        raise ValueError(f"Malformed range: {header}")
+    if start >= size or end < start:
+        raise ValueError(f"Range not satisfiable: {header}")
+    return start, min(end, size - 1)
@@ -0,0 +1,222 @@
+"""
+Bulk loading and export helpers: streaming CSV/JSONL readers, COPY and
+streaming CSV/JSONL writers.
+
+Uploads are read record by record so a large file is never held in
+memory as a whole. `copy_rows` loads rows with PostgreSQL `COPY ... FROM
+STDIN` inside the session's transaction; other dialects fall back to
+batched executemany. `export_chunks` turns batches of result rows into
+encoded (optionally gzipped) chunks for a StreamingResponse.
+"""
+import codecs
+import csv
+import io
+import tempfile
+import zlib
+from decimal import Decimal
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import orjson
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+BULK_FORMATS = ("csv", "jsonl")
+EXECUTEMANY_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+# Leading characters that make spreadsheet applications evaluate a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def detect_format(filename: Optional[str], requested: Optional[str] = None) -> Optional[str]:
+    """Bulk format from an explicit choice or the file extension (None if unknown)."""
+    if requested:
+        return requested if requested in BULK_FORMATS else None
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return None
+
+
+def iter_records(file: BinaryIO, format: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Read records from an uploaded CSV or JSONL file one at a time.
+
+    Empty CSV cells are omitted so schema defaults apply, and blank JSONL
+    lines are skipped.
+
+    Args:
+        file: Binary file object positioned at the start
+        format: "csv" (with a header row) or "jsonl"
+
+    Yields:
+        (row number, record or None, parse error or None); CSV rows are
+        numbered from 1 after the header, JSONL rows by line
+
+    Raises:
+        ValueError: If the file is not valid UTF-8 (the caller should discard
+            rows read so far rather than keep a truncated prefix)
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if format == "csv":
+            reader = csv.DictReader(text)
+            for number, row in enumerate(reader, start=1):
+                if None in row:
+                    yield number, None, f"Expected {len(reader.fieldnames)} columns, got more"
+                    continue
+                yield number, {key.strip(): value for key, value in row.items() if value not in (None, "")}, None
+        else:
+            for number, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    yield number, None, f"Invalid JSON: {e}"
+                    continue
+                if not isinstance(record, dict):
+                    yield number, None, "Expected a JSON object"
+                    continue
+                yield number, record, None
+    except UnicodeDecodeError:
+        raise ValueError("File is not valid UTF-8") from None
+    finally:
+        # Leave the upload's file object open for its owner
+        text.detach()
+
+
+def copy_text_value(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(db: Session, table: Table, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Insert rows in the session's current transaction.
+
+    Uses `COPY ... FROM STDIN` on PostgreSQL (rows are spooled to a
+    temporary file as they are produced), batched executemany elsewhere.
+    ORM events do not run, so computed columns must already be filled in.
+
+    Args:
+        db: Session whose transaction the rows join (the caller commits)
+        table: Target table
+        columns: Column names, in the order of the row values
+        rows: Row values; may be a generator
+
+    Returns:
+        Number of rows inserted
+    """
+    connection = db.connection()
+    count = 0
+    if connection.dialect.name != "postgresql":
+        statement = insert(table)
+        batch = []
+        for row in rows:
+            batch.append(dict(zip(columns, row)))
+            if len(batch) == EXECUTEMANY_BATCH_SIZE:
+                connection.execute(statement, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            connection.execute(statement, batch)
+            count += len(batch)
+        return count
+
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024, mode="w+b") as spool:
+        writer = codecs.getwriter("utf-8")(spool)
+        for row in rows:
+            writer.write("\t".join(copy_text_value(value) for value in row))
+            writer.write("\n")
+            count += 1
+        if not count:
+            return 0
+        spool.seek(0)
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(f'COPY "{table.name}" ({column_list}) FROM STDIN', spool)
+        finally:
+            cursor.close()
+    return count
+
+
+def validation_messages(error) -> List[str]:
+    """Flatten a pydantic ValidationError into "field: message" strings."""
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+def spreadsheet_safe(value: Any) -> Any:
+    """Neutralize text that a spreadsheet would run as a formula (CSV injection)."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _export_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def export_chunks(header: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]], format: str,
+                  compress: bool = False) -> Iterator[bytes]:
+    """
+    Encode batches of rows as CSV or JSONL, one chunk per batch.
+
+    Args:
+        header: Column names (CSV header row, JSONL object keys)
+        batches: Row batches, e.g. `Result.partitions()` of a yield_per query
+        format: "csv" or "jsonl"
+        compress: Gzip the stream
+
+    Yields:
+        Encoded chunks; memory use is bounded by one batch
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    if format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        for batch in batches:
+            writer.writerows([spreadsheet_safe(value) for value in row] for row in batch)
+            chunk = emit(buffer.getvalue().encode())
+            buffer.seek(0)
+            buffer.truncate()
+            if chunk:
+                yield chunk
+        # Header only, when there were no rows
+        if buffer.tell():
+            yield emit(buffer.getvalue().encode())
+    else:
+        for batch in batches:
+            chunk = emit(b"".join(
+                orjson.dumps(dict(zip(header, row)), default=_export_default, option=orjson.OPT_APPEND_NEWLINE)
+                for row in batch
+            ))
+            if chunk:
+                yield chunk
+
+    if compressor:
+        yield compressor.flush()
@@ -0,0 +1,605 @@
+"""
+Cache subsystem shared by API workers.
+
+`Cache` is a namespaced facade over a `CacheBackend`:
+- `MemoryCacheBackend`: bounded LRU with TTLs, private to one process
+- `RedisCacheBackend`: any server speaking the Redis protocol (RESP),
+  shared by every worker and host; talks RESP directly over a socket so
+  no client library is needed
+
+Entries can carry tags (e.g. "job:<id>"); invalidating a tag deletes
+every entry written with it, in every namespace. Values are stored as
+orjson bytes behind a one-byte format header, zlib-compressed above
+`COMPRESS_THRESHOLD`. Backend failures are counted and treated as cache
+misses, so an unavailable cache never fails a request.
+
+`RespServer` is a small in-process stand-in for Redis used by the
+benchmark and for local development (`python -m app.core.cache [port]`).
+"""
+import logging
+import socket
+import socketserver
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Value encoding: one header byte, then the payload
+FORMAT_JSON = 1
+FORMAT_JSON_ZLIB = 2
+COMPRESS_THRESHOLD = 1024
+
+TAG_PREFIX = "tag:"
+MISSING = object()  # Returned by Cache.get on a miss (None is a valid cached value)
+
+
+class CacheError(Exception):
+    """Raised for error replies and protocol violations of a cache server."""
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Serialize a value for storage.
+
+    Args:
+        value: Anything orjson can encode (dicts from the response serializers,
+            lists, strings, numbers); UUIDs and datetimes come back as strings
+
+    Returns:
+        Format byte followed by the (possibly compressed) orjson payload
+    """
+    payload = orjson.dumps(value)
+    if len(payload) > COMPRESS_THRESHOLD:
+        compressed = zlib.compress(payload, 1)
+        if len(compressed) < len(payload):
+            return bytes((FORMAT_JSON_ZLIB,)) + compressed
+    return bytes((FORMAT_JSON,)) + payload
+
+
+def decode_value(data: bytes) -> Any:
+    """Inverse of `encode_value`."""
+    if data[0] == FORMAT_JSON_ZLIB:
+        return orjson.loads(zlib.decompress(data[1:]))
+    if data[0] == FORMAT_JSON:
+        return orjson.loads(data[1:])
+    raise CacheError(f"Unknown cache value format {data[0]}")
+
+
+class CacheBackend:
+    """Byte-level storage shared by every cache namespace."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Stored bytes of a key, or None if absent or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Sequence[str] = ()) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Full key (namespace included)
+            value: Encoded value
+            ttl: Seconds until the entry expires
+            tags: Tags the entry is invalidated with
+        """
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> int:
+        """Delete keys and return how many existed."""
+        raise NotImplementedError
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Delete every entry written with any of the tags and return how many existed."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release connections."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Least-recently-used entries in an OrderedDict, bounded by count and bytes."""
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, float, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Sequence[str] = ()) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, tuple(tags))
+            self._bytes += len(value)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str) -> bool:
+        """Drop an entry and its tag memberships (caller holds the lock)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= len(entry[0])
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._remove(key) for key in keys)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            return sum(self._remove(key) for key in keys)
+
+    def stats(self) -> dict:
+        """Entry count, stored bytes and evictions."""
+        return {"entries": len(self._entries), "bytes": self._bytes, "evictions": self.evictions}
+
+
+def encode_command(*args: Any) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+def read_reply(stream) -> Any:
+    """
+    Read one RESP reply from a buffered binary stream.
+
+    Raises:
+        CacheError: On an error reply or a malformed stream
+        ConnectionError: When the server closed the connection
+    """
+    line = stream.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Cache server closed the connection")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise CacheError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("Cache server closed the connection")
+        return data[:-2]
+    if kind == b"*":
+        length = int(body)
+        return None if length < 0 else [read_reply(stream) for _ in range(length)]
+    raise CacheError(f"Malformed reply from cache server: {line[:32]!r}")
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache on a Redis-protocol server, one connection per thread.
+
+    Tag membership is kept in server-side sets named "tag:<tag>".
+    Invalidation renames the set first, so entries written while it
+    runs join a fresh set instead of being lost.
+    """
+
+    def __init__(self, url: str, timeout: float = 0.5, tag_ttl: float = 86400.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.password = parsed.password
+        self.timeout = timeout
+        self.tag_ttl = tag_ttl
+        self._local = threading.local()
+        self._connections: List[socket.socket] = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """This thread's (socket, reader), connecting and selecting the DB on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = self._local.connection = (sock, sock.makefile("rb"))
+            with self._lock:
+                self._connections.append(sock)
+            setup = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            if setup:
+                self._pipeline(setup)
+        return connection
+
+    def _disconnect(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            with self._lock:
+                if connection[0] in self._connections:
+                    self._connections.remove(connection[0])
+            connection[0].close()
+
+    def _pipeline(self, commands: Iterable[Sequence[Any]]) -> List[Any]:
+        """Send commands in one write and read their replies in order."""
+        commands = list(commands)
+        sock, reader = self._connection()
+        try:
+            sock.sendall(b"".join(encode_command(*command) for command in commands))
+            replies, error = [], None
+            for _ in commands:
+                try:
+                    replies.append(read_reply(reader))
+                except CacheError as e:
+                    # Keep reading so the connection stays in step with the server
+                    replies.append(e)
+                    error = error or e
+        except (OSError, ConnectionError):
+            self._disconnect()
+            raise
+        if error is not None:
+            raise error
+        return replies
+
+    def execute(self, *command: Any) -> Any:
+        """Run one command and return its reply."""
+        return self._pipeline([command])[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Sequence[str] = ()) -> None:
+        # Tag sets must outlive their entries, so tagged entries are capped at tag_ttl
+        ttl_ms = max(1, int(1000 * (min(ttl, self.tag_ttl) if tags else ttl)))
+        commands = [("SET", key, value, "PX", ttl_ms)]
+        for tag in tags:
+            commands.append(("SADD", TAG_PREFIX + tag, key))
+            commands.append(("PEXPIRE", TAG_PREFIX + tag, int(1000 * self.tag_ttl)))
+        self._pipeline(commands)
+
+    def delete(self, *keys: str) -> int:
+        return self.execute("DEL", *keys) if keys else 0
+
+    def invalidate_tags(self, *tags: str) -> int:
+        deleted = 0
+        for tag in tags:
+            pending = f"{TAG_PREFIX}{tag}:invalidating:{time.time_ns()}"
+            try:
+                self.execute("RENAME", TAG_PREFIX + tag, pending)
+            except CacheError:
+                continue  # No entries carry this tag
+            _, keys, _ = self._pipeline([("PEXPIRE", pending, 60_000), ("SMEMBERS", pending), ("DEL", pending)])
+            if keys:
+                deleted += self.delete(*keys)
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for sock in connections:
+            sock.close()
+        self._local = threading.local()
+
+
+@lru_cache(maxsize=1)
+def get_cache_backend() -> CacheBackend:
+    """Backend selected by CACHE_URL ("memory://" or "redis://host:port/db")."""
+    url = settings.CACHE_URL
+    if url.startswith(("redis://", "tcp://")):
+        return RedisCacheBackend(url, timeout=settings.CACHE_TIMEOUT_SECONDS)
+    if url and not url.startswith("memory://"):
+        raise ValueError(f"Unsupported CACHE_URL scheme: {url}")
+    return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+class Cache:
+    """
+    Namespaced cache of JSON-compatible values.
+
+    Keys are prefixed with the namespace, tags are global so one
+    invalidation clears related entries in every namespace. A namespace
+    with a TTL of 0 is disabled: lookups miss and writes are dropped.
+    """
+
+    def __init__(self, namespace: str, ttl: float, backend: Optional[CacheBackend] = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._backend = backend
+        self.counters: Counter = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend if self._backend is not None else get_cache_backend()
+
+    def key(self, key: Any) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}{self.namespace}:{key}"
+
+    def _failed(self, operation: str, error: Exception) -> None:
+        self.counters["errors"] += 1
+        logger.warning("Cache %s failed in namespace %s: %s", operation, self.namespace, error)
+
+    def get(self, key: Any) -> Any:
+        """Cached value, or MISSING."""
+        if not self.enabled:
+            return MISSING
+        try:
+            data = self.backend.get(self.key(key))
+            if data is not None:
+                value = decode_value(data)
+                self.counters["hits"] += 1
+                return value
+        except (OSError, CacheError, ValueError, zlib.error) as e:
+            self._failed("get", e)
+        self.counters["misses"] += 1
+        return MISSING
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None, tags: Sequence[str] = ()) -> None:
+        """Store a value for `ttl` seconds (namespace default when None)."""
+        if not self.enabled:
+            return
+        try:
+            data = encode_value(value)
+            self.backend.set(self.key(key), data, ttl or self.ttl, tags)
+        except (OSError, CacheError, TypeError) as e:
+            self._failed("set", e)
+            return
+        self.counters["sets"] += 1
+        self.counters["bytes_written"] += len(data)
+
+    def get_or_set(self, key: Any, compute: Callable[[], Any], ttl: Optional[float] = None,
+                   tags: Sequence[str] = ()) -> Any:
+        """Cached value, or the result of `compute` (which is then stored)."""
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            self.set(key, value, ttl, tags)
+        return value
+
+    def delete(self, key: Any) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.delete(self.key(key))
+        except (OSError, CacheError) as e:
+            self._failed("delete", e)
+
+    def invalidate(self, *tags: str) -> None:
+        """Delete every entry, in any namespace, written with one of the tags."""
+        if not self.enabled or not tags:
+            return
+        try:
+            self.counters["invalidated"] += self.backend.invalidate_tags(*tags)
+        except (OSError, CacheError) as e:
+            self._failed("invalidate", e)
+
+    def stats(self) -> dict:
+        """Hit rate and operation counters of this namespace in this process."""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "hit_rate": round(self.counters["hits"] / lookups, 4) if lookups else None,
+            **self.counters,
+        }
+
+
+_namespaces: Dict[str, Cache] = {}
+
+
+def get_cache(namespace: str, ttl: float) -> Cache:
+    """The cache of a namespace, created on first use."""
+    cache = _namespaces.get(namespace)
+    if cache is None:
+        cache = _namespaces.setdefault(namespace, Cache(namespace, ttl))
+    return cache
+
+
+def cache_namespace_stats() -> dict:
+    """Backend type and per-namespace counters, for the admin stats endpoint."""
+    backend = get_cache_backend()
+    report = {"backend": type(backend).__name__}
+    if isinstance(backend, MemoryCacheBackend):
+        report.update(backend.stats())
+    report["namespaces"] = {name: cache.stats() for name, cache in sorted(_namespaces.items())}
+    return report
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    """
+    Minimal Redis stand-in: the commands `RedisCacheBackend` uses, in memory.
+
+    Supports PING, GET, SET (EX/PX/NX), INCRBY, DEL, EXISTS, SADD, SMEMBERS,
+    RENAME, EXPIRE/PEXPIRE, DBSIZE, FLUSHDB, SELECT and AUTH (both accepted).
+    Expired keys are dropped when accessed.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0)):
+        super().__init__(address, _RespHandler)
+        self.data: Dict[bytes, Any] = {}
+        self.expires: Dict[bytes, float] = {}
+        self.lock = threading.Lock()
+        self.commands = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "RespServer":
+        """Serve on a daemon thread."""
+        threading.Thread(target=self.serve_forever, name="resp-server", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def _live(self, key: bytes) -> Any:
+        expires = self.expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self.data.pop(key, None)
+            del self.expires[key]
+        return self.data.get(key)
+
+    def _expire(self, key: bytes, seconds: float) -> int:
+        if self._live(key) is None:
+            return 0
+        self.expires[key] = time.monotonic() + seconds
+        return 1
+
+    def execute(self, name: bytes, args: List[bytes]) -> Any:
+        """Run one command and return its reply (Exceptions become error replies)."""
+        with self.lock:
+            self.commands += 1
+            if name in (b"PING", b"SELECT", b"AUTH"):
+                return "PONG" if name == b"PING" else "OK"
+            if name == b"GET":
+                value = self._live(args[0])
+                if isinstance(value, set):
+                    raise CacheError("WRONGTYPE Operation against a key holding the wrong kind of value")
+                return value
+            if name == b"SET":
+                key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+                if b"NX" in options and self._live(key) is not None:
+                    return None
+                self.data[key] = value
+                self.expires.pop(key, None)
+                for unit, scale in ((b"EX", 1.0), (b"PX", 0.001)):
+                    if unit in options:
+                        self.expires[key] = time.monotonic() + float(args[2 + options.index(unit) + 1]) * scale
+                return "OK"
+            if name == b"INCRBY":
+                value = self._live(args[0])
+                if isinstance(value, set):
+                    raise CacheError("WRONGTYPE Operation against a key holding the wrong kind of value")
+                total = int(value or 0) + int(args[1])
+                self.data[args[0]] = b"%d" % total  # Keeps the key's expiry, as Redis does
+                return total
+            if name in (b"DEL", b"UNLINK"):
+                deleted = 0
+                for key in args:
+                    deleted += self._live(key) is not None
+                    self.data.pop(key, None)
+                    self.expires.pop(key, None)
+                return deleted
+            if name == b"EXISTS":
+                return sum(self._live(key) is not None for key in args)
+            if name == b"SADD":
+                members = self._live(args[0])
+                if members is None:
+                    members = self.data[args[0]] = set()
+                before = len(members)
+                members.update(args[1:])
+                return len(members) - before
+            if name == b"SMEMBERS":
+                return sorted(self._live(args[0]) or ())
+            if name == b"RENAME":
+                if self._live(args[0]) is None:
+                    raise CacheError("ERR no such key")
+                self.data[args[1]] = self.data.pop(args[0])
+                self.expires.pop(args[1], None)
+                if args[0] in self.expires:
+                    self.expires[args[1]] = self.expires.pop(args[0])
+                return "OK"
+            if name in (b"EXPIRE", b"PEXPIRE"):
+                return self._expire(args[0], float(args[1]) * (1.0 if name == b"EXPIRE" else 0.001))
+            if name == b"DBSIZE":
+                return sum(self._live(key) is not None for key in list(self.data))
+            if name == b"FLUSHDB":
+                self.data.clear()
+                self.expires.clear()
+                return "OK"
+            raise CacheError(f"ERR unknown command '{name.decode(errors='replace')}'")
+
+
+def encode_reply(reply: Any) -> bytes:
+    """Encode a Python value as a RESP reply."""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, CacheError):
+        return b"-%s\r\n" % str(reply).encode()
+    if isinstance(reply, str):
+        return b"+%s\r\n" % reply.encode()
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return b"*%d\r\n" % len(reply) + b"".join(encode_reply(item) for item in reply)
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        # Pipelined replies are small writes; don't let Nagle hold them back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        while True:
+            try:
+                command = read_reply(self.rfile)
+            except (ConnectionError, OSError, CacheError):
+                return
+            if not isinstance(command, list) or not command:
+                return
+            try:
+                reply = self.server.execute(command[0].upper(), command[1:])
+            except CacheError as e:
+                reply = e
+            except (IndexError, ValueError):
+                reply = CacheError(f"ERR wrong arguments for '{command[0].decode(errors='replace')}'")
+            self.wfile.write(encode_reply(reply))
+
+
+if __name__ == "__main__":
+    import sys
+
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 6379
+    server = RespServer(("127.0.0.1", port))
+    print(f"Stand-in cache server on {server.url}")
+    server.serve_forever()
@@ -20,6 +20,72 @@ class Settings(BaseSettings):
     APP_NAME: str = "AI Recruiter Platform"
     DEBUG: bool = True
     
+    # Serialize list endpoints with precompiled adapters and orjson
+    FAST_SERIALIZATION: bool = True
+    
+    # Match score component weights (normalized to sum to 1)
+    MATCH_WEIGHT_SKILLS: float = 0.60
+    MATCH_WEIGHT_EXPERIENCE: float = 0.25
+    MATCH_WEIGHT_LOCATION: float = 0.15
+    MATCH_WEIGHT_TEXT: float = 0.0  # TF-IDF relevance of job text to candidate profile
+    RELEVANCE_CACHE_MAX_ENTRIES: int = 50000  # Job and candidate term vectors kept each (least recently used dropped)
+    
+    # Location scoring: full match within the radius, exponential decay beyond it
+    LOCATION_MATCH_RADIUS_KM: float = 50.0
+    LOCATION_DECAY_KM: float = 100.0
+    
+    # MinHash LSH candidate retrieval: more bands raise recall, more rows raise precision
+    LSH_BANDS: int = 32
+    LSH_ROWS: int = 2
+    LSH_REFRESH_SECONDS: float = 30.0  # Re-read changed candidate skills at most this often
+    
+    # Worker processes for batch rescoring (0 = one per CPU core)
+    BATCH_MATCH_WORKERS: int = 0
+    
+    # Directory of memory-mapped candidate store snapshots shared by workers (empty = disabled)
+    CANDIDATE_SNAPSHOT_DIR: str = ""
+    CANDIDATE_WATERMARK_LAG_SECONDS: float = 300.0  # Deltas re-read this far behind the newest updated_at (longest write transaction)
+    
+    # Scatter-gather scorer shards ("host:port,host:port"; empty = disabled)
+    SCATTER_ADDRESSES: str = ""
+    SCATTER_SHARD_DEADLINE_MS: float = 250.0
+    SCATTER_AUTHKEY: str = ""  # Shared secret of coordinators and scorers (required with SCATTER_ADDRESSES)
+    SCATTER_SHARD_REFRESH_SECONDS: float = 60.0  # Scorers re-read changed candidates this often (0 = only at startup)
+    
+    # Startup warm-up (readiness is reported by /api/ready)
+    WARM_UP_PARSERS: bool = False  # Also import PDF parser libraries (enable on workers that handle uploads)
+    WARM_UP_INDEXES: bool = True  # Build candidate indexes and cache published job vectors
+    WARM_UP_POOL_CONNECTIONS: int = 5
+    WARM_UP_RETRY_SECONDS: float = 5.0
+    
+    # Bulk job import (CSV/JSONL upload loaded with COPY) and streaming exports
+    JOB_IMPORT_MAX_ROWS: int = 5000
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per round trip by streaming exports
+    
+    # Content-addressed store of uploaded resumes and their extracted text (empty = disabled)
+    RESUME_STORE_DIR: str = ""
+    
+    # Cache backend: "memory://" (per process) or "redis://host:port/db" (shared by workers)
+    CACHE_URL: str = "memory://"
+    CACHE_KEY_PREFIX: str = "recruiter:"
+    CACHE_TIMEOUT_SECONDS: float = 0.5
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_JOB_TTL_SECONDS: float = 0  # Job pages and company job lists (0 = disabled; needs a shared CACHE_URL with several workers)
+    
+    # Let concurrent identical reads (job pages, applicant lists, rankings) share one query
+    SINGLE_FLIGHT_ENABLED: bool = True
+    
+    # Admission control per user and route class: "requests_per_minute,burst,max_concurrent" (0 = no limit)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_URL: str = "memory://"  # Per worker process, or "redis://host:port/db" to share limits across workers
+    RATE_LIMIT_RESUME_PARSE: str = "10,5,2"
+    RATE_LIMIT_SCREENING: str = "60,20,4"
+    RATE_LIMIT_JOB_SEARCH: str = "120,40,8"  # Skill-filtered job search, charged per skill term
+    
+    # Working hours (UTC, Monday to Friday) offered by the interview free-slot search
+    INTERVIEW_DAY_START_HOUR: int = 9
+    INTERVIEW_DAY_END_HOUR: int = 18
+    
     @property
     def cors_origins(self) -> List[str]:
         """Parse comma-separated origins into a list."""
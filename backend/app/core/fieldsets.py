@@ -0,0 +1,135 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.orm import load_only, selectinload, with_expression
+
+from app.models import Application, Candidate, Company, Job
+
+
+class FieldSet:
+    """
+    Selectable fields for a listing route.
+    
+    A field set ties the `fields=` query parameter to both sides of a listing:
+    the columns SQLAlchemy selects (via `load_only`) and the keys serialized
+    in the response. Large text columns listed in `deferred` are left out
+    unless a client asks for them explicitly.
+    """
+    
+    def __init__(
+        self,
+        model: Any,
+        columns: Sequence[str],
+        deferred: Sequence[str] = (),
+        expressions: Optional[Dict[str, Any]] = None,
+        relationships: Optional[Dict[str, Tuple[str, "FieldSet"]]] = None,
+    ):
+        """
+        Args:
+            model: ORM model class
+            columns: Column attributes that may be requested
+            deferred: Columns excluded from the default field list
+            expressions: query_expression attributes mapped to their SQL expression
+            relationships: Relationship name mapped to (foreign key column, nested field set)
+        """
+        self.model = model
+        self.columns = list(columns)
+        self.expressions = expressions or {}
+        self.relationships = relationships or {}
+        self.allowed = self.columns + list(self.expressions) + list(self.relationships)
+        self.default = [name for name in self.allowed if name not in deferred]
+    
+    def parse(self, fields: Optional[str]) -> List[str]:
+        """
+        Resolve a comma-separated `fields=` value into the selected field list.
+        
+        Raises:
+            HTTPException: If an unknown field is requested
+        """
+        if not fields:
+            return self.default
+        
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in requested if field not in self.allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(self.allowed)}"
+            )
+        
+        # The id is always returned so clients can key their lists
+        return list(dict.fromkeys(["id"] + requested))
+    
+    def load_options(self, selected: Sequence[str]) -> list:
+        """Build loader options that select only the columns needed for `selected`."""
+        column_names = [name for name in selected if name in self.columns]
+        column_names += [fk for name, (fk, _) in self.relationships.items() if name in selected]
+        options = [load_only(*[getattr(self.model, name) for name in dict.fromkeys(column_names)])]
+        
+        for name, expression in self.expressions.items():
+            if name in selected:
+                options.append(with_expression(getattr(self.model, name), expression))
+        
+        for name, (_, nested) in self.relationships.items():
+            if name in selected:
+                options.append(
+                    selectinload(getattr(self.model, name)).options(*nested.load_options(nested.default))
+                )
+        
+        return options
+    
+    def serialize_one(self, obj: Any, selected: Sequence[str]) -> Dict[str, Any]:
+        """Read only the selected attributes of a loaded ORM row."""
+        data = {}
+        for name in selected:
+            value = getattr(obj, name)
+            if name in self.relationships and value is not None:
+                nested = self.relationships[name][1]
+                value = nested.serialize_one(value, nested.default)
+            data[name] = value
+        return data
+    
+    def serialize(self, rows: Iterable[Any], selected: Sequence[str]) -> List[Dict[str, Any]]:
+        """Serialize ORM rows to dictionaries ready for FastJSONResponse."""
+        return [self.serialize_one(row, selected) for row in rows]
+
+
+# Length of the description excerpt shown on job cards
+DESCRIPTION_PREVIEW_LENGTH = 200
+
+COMPANY_FIELDS = FieldSet(
+    Company,
+    columns=["id", "name", "description", "website", "logo_url", "industry", "size",
+             "location", "created_by", "created_at", "updated_at"],
+    deferred=["description"],
+)
+
+CANDIDATE_FIELDS = FieldSet(
+    Candidate,
+    columns=["id", "user_id", "headline", "experience_years", "location", "skills_text",
+             "phone", "linkedin_url", "github_url", "resume_url", "created_at", "updated_at"],
+)
+
+JOB_FIELDS = FieldSet(
+    Job,
+    columns=["id", "company_id", "title", "description", "location", "remote_type",
+             "employment_type", "skills_required", "salary_min", "salary_max", "currency",
+             "experience_min", "experience_max", "status", "posted_by", "created_at", "updated_at"],
+    deferred=["description"],
+    expressions={
+        "description_preview": func.substr(Job.description, 1, DESCRIPTION_PREVIEW_LENGTH),
+    },
+    relationships={"company": ("company_id", COMPANY_FIELDS)},
+)
+
+APPLICATION_FIELDS = FieldSet(
+    Application,
+    columns=["id", "job_id", "candidate_id", "status", "match_score", "screening_score",
+             "cover_letter", "notes", "created_at", "updated_at"],
+    deferred=["cover_letter", "notes"],
+    relationships={
+        "job": ("job_id", JOB_FIELDS),
+        "candidate": ("candidate_id", CANDIDATE_FIELDS),
+    },
+)
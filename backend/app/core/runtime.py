@@ -0,0 +1,112 @@
+"""
+Runtime statistics for the admin stats endpoint.
+
+Every collector reads counters that already exist (pool bookkeeping,
+lru_cache info, /proc) so the endpoint is cheap enough to poll every
+few seconds; the only I/O is a `SELECT 1` on a pooled connection.
+"""
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+from functools import _lru_cache_wrapper
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+from app.database import engine
+
+PROCESS_STARTED = time.time()
+
+
+def pool_stats() -> dict:
+    """Connection pool counters of the SQLAlchemy engine."""
+    pool = engine.pool
+    stats = {"class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if counter is not None:
+            stats[name] = counter()
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if max_overflow is not None and "size" in stats:
+        stats["max_overflow"] = max_overflow
+        stats["exhausted"] = stats["checkedout"] >= stats["size"] + max(max_overflow, 0)
+    return stats
+
+
+def database_ping() -> dict:
+    """Round-trip time of `SELECT 1` on a pooled connection."""
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        return {"ok": False, "error": type(e).__name__}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+
+def lru_cache_stats(function: _lru_cache_wrapper) -> dict:
+    """Size and hit rate of an lru_cache-decorated function."""
+    info = function.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else None,
+    }
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Sizes and hit rates of the in-process caches and indexes."""
+    from app.ml.geo import geocode
+    from app.ml.lsh import get_candidate_index
+    from app.ml.relevance import relevance_index
+    from app.ml.skills import canonical_skill
+    from app.ml.store import loaded_candidate_store
+
+    index = get_candidate_index()
+    store = loaded_candidate_store()
+    return {
+        "geocode": lru_cache_stats(geocode),
+        "canonical_skill": lru_cache_stats(canonical_skill),
+        "text_relevance": relevance_index.stats(),
+        "candidate_lsh": {"loaded": index.loaded, "candidates": len(index)},
+        "candidate_store": {
+            "loaded": store is not None,
+            "candidates": len(store) if store is not None else 0,
+            "snapshot_version": store.snapshot_version if store is not None else None,
+        },
+    }
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """Current resident set size (Linux /proc), or None where unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def process_stats() -> dict:
+    """Memory, thread and garbage collector figures of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "pid": os.getpid(),
+        "uptime_seconds": round(time.time() - PROCESS_STARTED, 1),
+        "rss_bytes": resident_memory_bytes(),
+        # ru_maxrss is in bytes on macOS and in kB elsewhere
+        "peak_rss_bytes": peak if sys.platform == "darwin" else peak * 1024,
+        "threads": threading.active_count(),
+        "gc": {
+            "enabled": gc.isenabled(),
+            "counts": gc.get_count(),
+            "thresholds": gc.get_threshold(),
+            "generations": gc.get_stats(),
+            "uncollectable": len(gc.garbage),
+        },
+    }
@@ -0,0 +1,185 @@
+"""
+Interviewer calendars as interval indexes, for conflict checks and
+free-slot search.
+
+Busy time is read with one range scan of `interviews.scheduled_at`
+(active interviews only) and kept per interviewer in an `IntervalIndex`:
+the interviews sorted by start, plus the merged disjoint busy intervals
+as two parallel sorted lists. Both lookups are a bisect:
+- `overlapping` returns the interviews that clash with a time range
+- `blocking` returns where the busy stretch covering a range ends, so
+  the slot search jumps over whole meetings instead of stepping through them
+
+`find_free_slots` walks candidate start times aligned to a step within
+working hours and yields the next N slots where every interviewer (or at
+least one, with `require_all=False`) is free.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Interview
+
+# Interviews in these states occupy the interviewer's calendar
+ACTIVE_INTERVIEW_STATUSES = ("scheduled", "rescheduled")
+
+# Longest allowed interview (InterviewBase.duration_minutes); bounds how far
+# before a range an overlapping interview can start
+MAX_INTERVIEW_DURATION = timedelta(minutes=480)
+DEFAULT_INTERVIEW_DURATION = 60
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC and convert aware ones to UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def interview_end(scheduled_at: datetime, duration_minutes: Optional[int]) -> datetime:
+    return scheduled_at + timedelta(minutes=duration_minutes or DEFAULT_INTERVIEW_DURATION)
+
+
+class IntervalIndex:
+    """Sorted busy intervals of one calendar (half-open: [start, end))."""
+
+    def __init__(self, intervals: Iterable[Tuple[datetime, datetime, object]] = ()):
+        self.items = sorted(intervals, key=lambda item: item[0])
+        self.item_starts = [start for start, _, _ in self.items]
+        self.max_length = max((end - start for start, end, _ in self.items), default=timedelta(0))
+
+        # Overlapping and touching intervals merged into disjoint busy stretches
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        for start, end, _ in self.items:
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @classmethod
+    def union(cls, indexes: Iterable["IntervalIndex"]) -> "IntervalIndex":
+        """One index holding the busy time of several calendars."""
+        return cls(item for index in indexes for item in index.items)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[object]:
+        """Keys of the intervals that overlap [start, end)."""
+        first = bisect_left(self.item_starts, start - self.max_length)
+        last = bisect_left(self.item_starts, end)
+        return [key for item_start, item_end, key in self.items[first:last] if item_end > start]
+
+    def blocking(self, start: datetime, end: datetime) -> Optional[datetime]:
+        """End of the earliest busy stretch overlapping [start, end), or None if the range is free."""
+        position = bisect_right(self.starts, start) - 1
+        if position >= 0 and self.ends[position] > start:
+            return self.ends[position]
+        if position + 1 < len(self.starts) and self.starts[position + 1] < end:
+            return self.ends[position + 1]
+        return None
+
+
+def load_calendars(db: Session, interviewer_ids: Sequence[UUID], start: datetime, end: datetime,
+                   exclude_id: Optional[UUID] = None) -> Dict[UUID, IntervalIndex]:
+    """
+    Busy time of interviewers between `start` and `end`.
+
+    Args:
+        db: Database session
+        interviewer_ids: Users whose calendars to load
+        start: Range start (interviews running into it are included)
+        end: Range end
+        exclude_id: Interview to leave out (the one being rescheduled)
+
+    Returns:
+        Interval index per interviewer id, keyed by interview id
+    """
+    query = db.query(
+        Interview.id, Interview.interviewer_id, Interview.scheduled_at, Interview.duration_minutes
+    ).filter(
+        Interview.scheduled_at >= start - MAX_INTERVIEW_DURATION,
+        Interview.scheduled_at < end,
+        Interview.interviewer_id.in_(interviewer_ids),
+        Interview.status.in_(ACTIVE_INTERVIEW_STATUSES)
+    )
+    if exclude_id is not None:
+        query = query.filter(Interview.id != exclude_id)
+
+    busy: Dict[UUID, List[Tuple[datetime, datetime, object]]] = {interviewer: [] for interviewer in interviewer_ids}
+    for interview_id, interviewer_id, scheduled_at, duration in query:
+        scheduled_at = as_utc(scheduled_at)
+        busy[interviewer_id].append((scheduled_at, interview_end(scheduled_at, duration), interview_id))
+    return {interviewer: IntervalIndex(intervals) for interviewer, intervals in busy.items()}
+
+
+def _working_start(moment: datetime, duration: timedelta, step: timedelta) -> datetime:
+    """
+    Earliest slot start at or after `moment` inside working hours; starts
+    are the opening hour plus a multiple of `step`.
+    """
+    day_start = time(settings.INTERVIEW_DAY_START_HOUR, tzinfo=timezone.utc)
+    day_length = timedelta(hours=settings.INTERVIEW_DAY_END_HOUR - settings.INTERVIEW_DAY_START_HOUR)
+    while True:
+        opens = datetime.combine(moment.date(), day_start)
+        if moment < opens:
+            moment = opens
+        else:
+            remainder = (moment - opens) % step
+            if remainder:
+                moment += step - remainder
+        if opens.weekday() < 5 and moment + duration <= opens + day_length:
+            return moment
+        moment = opens + timedelta(days=1)
+
+
+def find_free_slots(calendars: Dict[UUID, IntervalIndex], start: datetime, end: datetime,
+                    duration: timedelta, step: timedelta, count: int,
+                    require_all: bool = True) -> Iterator[Tuple[datetime, List[UUID]]]:
+    """
+    Next free slots within working hours (Monday to Friday, UTC).
+
+    Args:
+        calendars: Interval index per interviewer (from `load_calendars`)
+        start: Earliest slot start
+        end: Latest slot end
+        duration: Slot length
+        step: Slot starts are the opening hour plus multiples of this
+        count: Maximum number of slots
+        require_all: Every interviewer must be free (a panel); otherwise
+            a slot is offered when at least one of them is
+
+    Yields:
+        (slot start, ids of the interviewers free for the whole slot)
+    """
+    working_day = timedelta(hours=settings.INTERVIEW_DAY_END_HOUR - settings.INTERVIEW_DAY_START_HOUR)
+    if not calendars or count <= 0 or duration > working_day:
+        return
+    union = IntervalIndex.union(calendars.values()) if require_all else None
+    moment = start
+    found = 0
+    while found < count:
+        moment = _working_start(moment, duration, step)
+        if moment + duration > end:
+            return
+        slot_end = moment + duration
+        if require_all:
+            busy_until = union.blocking(moment, slot_end)
+            if busy_until is not None:
+                moment = busy_until
+                continue
+            free = list(calendars)
+        else:
+            blocked = [index.blocking(moment, slot_end) for index in calendars.values()]
+            free = [interviewer for interviewer, until in zip(calendars, blocked) if until is None]
+            if not free:
+                moment = min(blocked)
+                continue
+        yield moment, free
+        found += 1
+        moment += step
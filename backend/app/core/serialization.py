@@ -0,0 +1,64 @@
+from decimal import Decimal
+from typing import Any, Iterable, List
+
+import orjson
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.schemas import JobResponse, ApplicationResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+    
+    orjson encodes UUID and datetime values natively, so payloads produced by
+    `serialize_list` can be written without a jsonable_encoder pass.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
+
+
+# Precompiled adapters, built once at import time and reused by every request
+job_adapter = TypeAdapter(JobResponse)
+job_list_adapter = TypeAdapter(List[JobResponse])
+application_list_adapter = TypeAdapter(List[ApplicationResponse])
+
+
+def serialize_list(adapter: TypeAdapter, rows: Iterable[Any]) -> List[dict]:
+    """
+    Serialize ORM rows through a precompiled TypeAdapter.
+    
+    Args:
+        adapter: Precompiled adapter for a list of response schemas
+        rows: ORM instances (read via from_attributes)
+        
+    Returns:
+        List of plain dictionaries ready for FastJSONResponse
+    """
+    return adapter.dump_python(adapter.validate_python(list(rows), from_attributes=True))
+
+
+def serialize_one(adapter: TypeAdapter, row: Any) -> dict:
+    """Serialize a single ORM row through a precompiled TypeAdapter."""
+    return adapter.dump_python(adapter.validate_python(row, from_attributes=True))
+
+
+def json_response(content: Any) -> Any:
+    """
+    Return already-serialized content as a FastJSONResponse, or as is for
+    FastAPI's regular response encoding when FAST_SERIALIZATION is off.
+    """
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(content)
+    return content
@@ -0,0 +1,111 @@
+"""
+Single-flight coalescing of identical concurrent reads.
+
+When several requests ask for the same key at the same time, the first
+one runs the computation and the others wait for its result instead of
+issuing the same query. Nothing is cached: once the computation
+finishes, the next caller starts a new one.
+
+Results are handed to every waiting request, so coalesced functions
+must return plain data (serialized dicts, tuples), never ORM instances
+bound to the leader's session.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight computation and its outcome."""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with equal keys onto one computation."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Run `function`, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies equal calls (include every input of `function`)
+            function: Computation to run when no equal call is in flight
+
+        Returns:
+            The result of `function`, shared by every coalesced caller
+
+        Raises:
+            Whatever `function` raised, in the leader and every waiter
+        """
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return function()
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        """Executions, coalesced callers and keys currently in flight."""
+        with self._lock:
+            in_flight = len(self._calls)
+        calls = self.executions + self.coalesced
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / calls, 4) if calls else None,
+            "in_flight": in_flight,
+        }
+
+
+_groups: Dict[str, SingleFlight] = {}
+
+
+def single_flight(name: str) -> SingleFlight:
+    """Get the named coalescing group, creating it on first use."""
+    group = _groups.get(name)
+    if group is None:
+        group = _groups.setdefault(name, SingleFlight(name))
+    return group
+
+
+def single_flight_stats() -> Dict[str, dict]:
+    """Counters of every coalescing group in this process."""
+    return {name: group.stats() for name, group in sorted(_groups.items())}
@@ -0,0 +1,164 @@
+"""
+Startup warm-up and readiness tracking.
+
+The lifespan hook runs `warm_up` in a background thread so the server
+answers liveness checks immediately, while `/api/ready` reports 503
+until every phase has completed. Failed phases are retried until they
+succeed or the application shuts down.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 123-4567 | San Francisco, CA
+
+Summary
+Backend engineer with 6 years of experience building Python and PostgreSQL services.
+
+Skills
+Python, FastAPI, PostgreSQL, Docker, Kubernetes, AWS, React
+
+Education
+B.S. Computer Science, State University
+"""
+
+
+class WarmUpState:
+    """Progress of the warm-up phases, shared with the readiness endpoint."""
+
+    def __init__(self):
+        self.ready = False
+        self.phases: Dict[str, float] = {}  # Phase name -> duration in ms
+        self.errors: Dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+
+    def report(self) -> dict:
+        """Readiness payload for `/api/ready`."""
+        if self.ready:
+            status = "ready"
+        elif self.errors:
+            status = "retrying"
+        else:
+            status = "warming_up"
+        report = {"status": status, "phases_ms": dict(self.phases)}
+        if self.errors:
+            report["errors"] = dict(self.errors)
+        if self.completed_at is not None:
+            report["total_ms"] = round((self.completed_at - self.started_at) * 1000, 1)
+        return report
+
+
+warm_up_state = WarmUpState()
+
+
+def open_pool_connections() -> None:
+    """Open the pool's connections up front (checked out together, then returned)."""
+    from app.database import engine
+
+    connections = []
+    try:
+        for _ in range(max(1, settings.WARM_UP_POOL_CONNECTIONS)):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def warm_parsers() -> None:
+    """Compile the resume parser patterns and run them once."""
+    from app.ml.resume_parser import extract_fields, warm_up_parsers
+
+    extract_fields(SAMPLE_RESUME)
+    if settings.WARM_UP_PARSERS:
+        warm_up_parsers()
+
+
+def warm_matcher() -> None:
+    """Load the gazetteer and skill canonicalizer and prime their caches."""
+    from app.ml.geo import geocode
+    from app.ml.resume_parser import TECH_SKILLS
+    from app.ml.skills import canonical_skill
+
+    geocode("San Francisco, CA")
+    for skill in TECH_SKILLS:
+        canonical_skill(skill)
+
+
+def load_indexes() -> None:
+    """Build the candidate LSH index and candidate store, and cache published job vectors."""
+    from sqlalchemy.orm import load_only
+
+    from app.database import SessionLocal
+    from app.ml.lsh import get_candidate_index
+    from app.ml.relevance import relevance_index
+    from app.ml.store import get_candidate_store
+    from app.models import Job
+
+    db = SessionLocal()
+    try:
+        get_candidate_index(db)
+        get_candidate_store(db)
+        published = db.query(Job).options(load_only(
+            Job.id, Job.title, Job.skills_required, Job.description, Job.updated_at
+        )).filter(Job.status == "published")
+        for job in published.yield_per(1000):
+            relevance_index.job_vector(job)
+    finally:
+        db.close()
+
+
+def warm_up_phases() -> List[Tuple[str, Callable[[], None]]]:
+    """Phases in the order they run."""
+    phases = [
+        ("database_pool", open_pool_connections),
+        ("resume_parser", warm_parsers),
+        ("matcher", warm_matcher),
+    ]
+    if settings.WARM_UP_INDEXES:
+        phases.append(("indexes", load_indexes))
+    return phases
+
+
+def warm_up(stop: threading.Event, state: WarmUpState = warm_up_state) -> None:
+    """
+    Run every warm-up phase, retrying failed ones until all succeed.
+
+    Args:
+        stop: Set on shutdown to abandon retries
+        state: Where phase timings and errors are recorded
+    """
+    state.started_at = time.perf_counter()
+    pending = warm_up_phases()
+    while pending and not stop.is_set():
+        failed = []
+        for name, phase in pending:
+            started = time.perf_counter()
+            try:
+                phase()
+            except Exception as e:
+                # Only the error type is exposed on /api/ready; details go to the log
+                state.errors[name] = type(e).__name__
+                failed.append((name, phase))
+                logger.warning("Warm-up phase %s failed: %s", name, e)
+                continue
+            state.phases[name] = round((time.perf_counter() - started) * 1000, 1)
+            state.errors.pop(name, None)
+        pending = failed
+        if pending:
+            stop.wait(settings.WARM_UP_RETRY_SECONDS)
+
+    if not pending:
+        state.completed_at = time.perf_counter()
+        state.ready = True
+        logger.info("Warm-up complete in %.0f ms: %s", (state.completed_at - state.started_at) * 1000, state.phases)
@@ -1,7 +1,28 @@
-from fastapi import FastAPI
+import threading
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
-from app.api import auth, jobs, applications, companies, candidates, ml
+from app.core.warmup import warm_up, warm_up_state
+from app.api import auth, jobs, applications, companies, candidates, interviews, ml, admin, resumes
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup and shutdown hook.
+    
+    Warm-up runs in a background thread so the server starts answering
+    liveness checks at once; /api/ready reports when it has finished.
+    """
+    stop = threading.Event()
+    warm_up_thread = threading.Thread(target=warm_up, args=(stop,), name="warm-up", daemon=True)
+    warm_up_thread.start()
+    yield
+    stop.set()
+    warm_up_thread.join(timeout=5)
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -9,7 +30,8 @@ app = FastAPI(
     description="AI-powered hiring platform with intelligent candidate-job matching",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -27,7 +49,10 @@ app.include_router(jobs.router, prefix="/api")
 app.include_router(applications.router, prefix="/api")
 app.include_router(companies.router, prefix="/api")
 app.include_router(candidates.router, prefix="/api")
+app.include_router(interviews.router, prefix="/api")
 app.include_router(ml.router, prefix="/api")
+app.include_router(resumes.router, prefix="/api")
+app.include_router(admin.router, prefix="/api")
 
 
 @app.get("/")
@@ -47,6 +72,20 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/api/ready")
+def readiness_check():
+    """
+    Readiness check endpoint for load balancers.
+    
+    Returns 503 until startup warm-up (connection pool, parsers, matcher
+    indexes and caches) has completed, with per-phase timings.
+    """
+    report = warm_up_state.report()
+    if not warm_up_state.ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=report)
+    return report
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
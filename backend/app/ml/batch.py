@@ -0,0 +1,419 @@
+"""
+Parallel batch matching of many jobs against every candidate.
+
+Candidate features come from the columnar `CandidateStore` and are
+copied once into shared memory, so worker processes attach to them by name instead of
+receiving pickled ORM objects. Jobs are reduced to small plain tuples
+and fanned out to a process pool in (jobs x candidate range) shards;
+each worker writes its scores straight into a shared output matrix. The
+matrix is capped at OUTPUT_MAX_BYTES: with a large candidate pool fewer
+jobs go into each batch, and every batch reuses the same matrix.
+
+The scores are identical to `compute_match_score` up to rounding.
+"""
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session, load_only
+
+from app.core.config import settings
+from app.ml.geo import haversine_km
+from app.ml.matcher import distance_penalty, location_coordinates, match_weights, parse_skills
+from app.ml.relevance import DIMENSION, relevance_index
+from app.ml.store import CandidateStore, get_candidate_store
+from app.models import Application, Job
+
+
+# Upper bound of the shared jobs x candidates score matrix (16 jobs per batch at 1M candidates)
+OUTPUT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class JobFeatures(NamedTuple):
+    """Everything a worker needs to score one job, free of ORM state."""
+    skills: Tuple[str, ...]  # Canonical required skills
+    experience_min: int
+    experience_max: Optional[int]
+    remote_type: str
+    location: Optional[str]  # Lowercased
+    coordinates: Optional[Tuple[float, float]]
+    query_indices: np.ndarray  # Sparse IDF-weighted text query
+    query_values: np.ndarray
+
+
+class SharedArrays:
+    """A set of NumPy arrays copied into named shared memory blocks."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.spec: Dict[str, Tuple[str, tuple, str]] = {}
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+            self._blocks.append(block)
+            self.spec[name] = (block.name, array.shape, array.dtype.str)
+            self.arrays[name] = view
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.arrays.values())
+
+    def close(self) -> None:
+        """Release and unlink the blocks (owner process only)."""
+        self.arrays.clear()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+
+def attach_shared(spec: Dict[str, Tuple[str, tuple, str]]):
+    """
+    Map shared arrays created by `SharedArrays` in another process.
+
+    Returns:
+        Tuple of (arrays by name, open blocks to keep alive)
+    """
+    arrays, blocks = {}, []
+    for name, (block_name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return arrays, blocks
+
+
+def pack_job(job: Job, store: CandidateStore) -> JobFeatures:
+    """Reduce a job to the plain features scored by the workers."""
+    coordinates = location_coordinates(job) if job.location else None
+    if store.with_text and match_weights()["text"]:
+        query_indices, query_values = store.query_vector(relevance_index.job_vector(job))
+    else:
+        query_indices = query_values = np.zeros(0, dtype=np.float32)
+    return JobFeatures(
+        skills=tuple(parse_skills(job.skills_required)),
+        experience_min=job.experience_min or 0,
+        experience_max=job.experience_max,
+        remote_type=job.remote_type,
+        location=job.location.lower() if job.location else None,
+        coordinates=coordinates,
+        query_indices=query_indices,
+        query_values=query_values,
+    )
+
+
+class ShardScorer:
+    """Scores jobs against packed candidate arrays, in whole or by candidate range."""
+
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        skill_positions: Dict[str, int],
+        locations: List[str],
+        weights: Dict[str, float]
+    ):
+        self.arrays = arrays
+        self.output: Optional[np.ndarray] = arrays.pop("output", None)
+        self.skill_positions = skill_positions
+        self.locations = locations
+        self.weights = weights
+        self._scores_text = bool(weights["text"]) and "text_indptr" in arrays
+        # Dense query buffer per thread: scatter scorers serve several connections at once
+        self._local = threading.local()
+        self._blocks = []
+
+    @classmethod
+    def attach(cls, spec, output_spec, skill_positions, locations, weights) -> "ShardScorer":
+        """Scorer over arrays shared by `BatchMatchEngine` in another process."""
+        arrays, blocks = attach_shared({**spec, **output_spec})
+        scorer = cls(arrays, skill_positions, locations, weights)
+        scorer._blocks = blocks
+        return scorer
+
+    @property
+    def size(self) -> int:
+        return len(self.arrays["experience"])
+
+    def close(self) -> None:
+        self.arrays.clear()
+        self.output = None
+        for block in self._blocks:
+            block.close()
+
+    def score(self, shard: Tuple[int, Sequence[JobFeatures], int, int]) -> int:
+        """Write scores for the shard into the output matrix; returns pairs scored."""
+        first_row, jobs, start, stop = shard
+        for offset, job in enumerate(jobs):
+            self.output[first_row + offset, start:stop] = self.score_job(job, start, stop)
+        return len(jobs) * (stop - start)
+
+    def score_job(self, job: JobFeatures, start: int, stop: int) -> np.ndarray:
+        """Match scores of candidates [start, stop) for one job, as in `compute_match_score`."""
+        a = self.arrays
+        weights = self.weights
+
+        # 1. Skills: share of required skills among the candidate's skill ids
+        if job.skills:
+            wanted = np.zeros(len(self.skill_positions) + 1, dtype=bool)
+            for skill in job.skills:
+                if skill in self.skill_positions:
+                    wanted[self.skill_positions[skill]] = True
+            bounds = a["skill_indptr"][start:stop + 1]
+            hits = wanted[a["skill_ids"][bounds[0]:bounds[-1]]]
+            prefix = np.concatenate(([0], np.cumsum(hits, dtype=np.int64)))
+            matched = prefix[bounds[1:] - bounds[0]] - prefix[bounds[:-1] - bounds[0]]
+            skills = (matched / len(job.skills)) * 100
+        else:
+            skills = np.full(stop - start, 100.0)
+
+        # 2. Experience
+        experience = a["experience"][start:stop]
+        meets = experience >= job.experience_min
+        gap = job.experience_min - experience
+        under_penalty = np.where(gap <= 1, 0.9, np.where(gap <= 2, 0.7, 0.5))
+        if job.experience_max:
+            over_penalty = np.where(experience > job.experience_max, 0.95, 1.0)
+        else:
+            over_penalty = 1.0
+        experience_score = np.where(meets, 100 * over_penalty, 50 * under_penalty)
+
+        # 3. Location
+        location = self.location_scores(job, start, stop)
+
+        total = skills * weights["skills"] + experience_score * weights["experience"] + location * weights["location"]
+
+        # 4. Text relevance: CSR rows times the job's query vector
+        if self._scores_text and len(job.query_indices):
+            query = self._query_buffer()
+            query[job.query_indices] = job.query_values
+            first, last = a["text_indptr"][start], a["text_indptr"][stop]
+            products = a["text_data"][first:last] * query[a["text_indices"][first:last]]
+            prefix = np.concatenate(([0.0], np.cumsum(products, dtype=np.float64)))
+            bounds = a["text_indptr"][start:stop + 1] - first
+            relevance = (prefix[bounds[1:]] - prefix[bounds[:-1]]).astype(np.float32)
+            query[job.query_indices] = 0.0
+            total = total + relevance.astype(np.float64) * 100 * weights["text"]
+
+        return np.round(np.clip(total, 0.0, 100.0), 2)
+
+    def _query_buffer(self) -> np.ndarray:
+        """This thread's zeroed dense query vector (entries are reset after each use)."""
+        query = getattr(self._local, "query", None)
+        if query is None:
+            query = self._local.query = np.zeros(DIMENSION, dtype=np.float32)
+        return query
+
+    def location_scores(self, job: JobFeatures, start: int, stop: int) -> np.ndarray:
+        """Location component (base score times penalty) as in `compute_location_match`."""
+        count = stop - start
+        if job.remote_type == "remote":
+            return np.full(count, 100.0)
+        # No location on either side: match with a small penalty
+        scores = np.full(count, 90.0)
+        if not job.location:
+            return scores
+
+        codes = self.arrays["location_code"][start:stop]
+        has_location = codes >= 0
+        latitude = self.arrays["latitude"][start:stop]
+        geocoded = has_location & ~np.isnan(latitude)
+        if job.coordinates:
+            distances = haversine_km(latitude[geocoded], self.arrays["longitude"][start:stop][geocoded], *job.coordinates)
+            within = distances <= settings.LOCATION_MATCH_RADIUS_KM
+            scores[geocoded] = np.where(within, 100.0, 50 * distance_penalty(distances, job.remote_type))
+            textual = has_location & ~geocoded
+        else:
+            textual = has_location
+
+        # Fallback: case-insensitive containment either way, decided once per unique location
+        if textual.any():
+            location_match = np.fromiter(
+                (job.location in place or place in job.location for place in self.locations),
+                dtype=bool, count=len(self.locations)
+            )
+            matches = location_match[codes[textual]]
+            mismatch = 50 * float(distance_penalty(math.inf, job.remote_type))
+            scores[textual] = np.where(matches, 100.0, mismatch)
+        return scores
+
+
+_worker_scorer: Optional[ShardScorer] = None
+
+
+def _init_worker(spec, output_spec, skill_positions, locations, weights) -> None:
+    global _worker_scorer
+    _worker_scorer = ShardScorer.attach(spec, output_spec, skill_positions, locations, weights)
+
+
+def _score_shard(shard) -> int:
+    return _worker_scorer.score(shard)
+
+
+def plan_shards(num_jobs: int, num_candidates: int, workers: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Split a jobs x candidates block into roughly equal shards.
+
+    Aims for about four shards per worker so stragglers even out; when
+    there are fewer jobs than that, candidate ranges are split as well.
+
+    Returns:
+        List of (job_start, job_stop, candidate_start, candidate_stop)
+    """
+    if not num_jobs or not num_candidates:
+        return []
+    target = workers * 4
+    job_chunks = min(num_jobs, target)
+    candidate_chunks = min(num_candidates, max(1, math.ceil(target / job_chunks)))
+    job_bounds = np.linspace(0, num_jobs, job_chunks + 1).astype(int)
+    candidate_bounds = np.linspace(0, num_candidates, candidate_chunks + 1).astype(int)
+    return [
+        (int(job_bounds[j]), int(job_bounds[j + 1]), int(candidate_bounds[c]), int(candidate_bounds[c + 1]))
+        for j in range(job_chunks)
+        for c in range(candidate_chunks)
+    ]
+
+
+class BatchMatchEngine:
+    """
+    Score many jobs against a fixed candidate pool on multiple cores.
+
+    Usage:
+        with BatchMatchEngine(CandidateStore.load(db), workers=8) as engine:
+            for job_ids, scores in engine.score_jobs(jobs):
+                ...  # scores[i, j] is job_ids[i] vs engine.candidate_ids[j]
+
+    `batch_size` is lowered as needed to keep the score matrix within
+    OUTPUT_MAX_BYTES.
+    """
+
+    def __init__(self, store: CandidateStore, workers: Optional[int] = None, batch_size: int = 256):
+        self.workers = workers or settings.BATCH_MATCH_WORKERS or os.cpu_count() or 1
+        self.weights = match_weights()
+        self.store = store
+        # Arrays first: the vocabularies only grow, so later copies still cover them
+        columns = store.arrays
+        arrays = {name: array for name, array in columns.items() if name != "ids"}
+        self.candidate_ids = store.candidate_ids(columns)
+        self.skill_positions = dict(store.skill_index)
+        self.locations = list(store.locations)
+        self.shared = SharedArrays(arrays)
+        row_bytes = max(len(self.candidate_ids), 1) * np.dtype(np.float32).itemsize
+        self.batch_size = max(1, min(batch_size, OUTPUT_MAX_BYTES // row_bytes))
+        self.output = SharedArrays({"output": np.zeros((self.batch_size, len(self.candidate_ids)), dtype=np.float32)})
+        self.pairs = 0
+        self.seconds = 0.0
+
+        initargs = (self.shared.spec, self.output.spec, self.skill_positions, self.locations, self.weights)
+        if self.workers > 1:
+            self._pool = multiprocessing.get_context().Pool(self.workers, initializer=_init_worker, initargs=initargs)
+            self._local = None
+        else:
+            self._pool = None
+            self._local = ShardScorer.attach(*initargs)
+
+    def score_jobs(self, jobs: Sequence[Job]) -> Iterator[Tuple[List[str], np.ndarray]]:
+        """
+        Score jobs in batches of `batch_size`.
+
+        Yields:
+            Tuple of (job ids, scores array of shape (len(job ids), candidates));
+            the scores are a view of the shared output matrix, overwritten by
+            the next batch and released on close, so copy what must outlive it
+        """
+        for batch_start in range(0, len(jobs), self.batch_size):
+            batch = jobs[batch_start:batch_start + self.batch_size]
+            features = [pack_job(job, self.store) for job in batch]
+            shards = [
+                (job_start, features[job_start:job_stop], start, stop)
+                for job_start, job_stop, start, stop in plan_shards(len(features), len(self.candidate_ids), self.workers)
+            ]
+
+            started = time.perf_counter()
+            if self._pool is not None:
+                scored = sum(self._pool.imap_unordered(_score_shard, shards))
+            else:
+                scored = sum(self._local.score(shard) for shard in shards)
+            self.seconds += time.perf_counter() - started
+            self.pairs += scored
+
+            yield [str(job.id) for job in batch], self.output.arrays["output"][:len(batch)]
+
+    def stats(self) -> dict:
+        """Throughput of the scoring phase so far."""
+        return {
+            "workers": self.workers,
+            "candidates": len(self.candidate_ids),
+            "shared_bytes": self.shared.nbytes,
+            "output_bytes": self.output.nbytes,
+            "batch_size": self.batch_size,
+            "pairs": self.pairs,
+            "seconds": round(self.seconds, 3),
+            "pairs_per_second": round(self.pairs / self.seconds) if self.seconds else 0,
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._local is not None:
+            self._local.close()
+            self._local = None
+        self.shared.close()
+        self.output.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def rescore_applications(db: Session, workers: Optional[int] = None) -> dict:
+    """
+    Rescore every published job against every candidate (e.g. after a
+    weight change) and store the new match scores on existing applications.
+
+    Returns:
+        Engine throughput stats plus the number of applications updated
+    """
+    jobs = db.query(Job).filter(Job.status == "published").all()
+
+    updated = 0
+    with BatchMatchEngine(get_candidate_store(db), workers=workers) as engine:
+        column = {candidate_id: position for position, candidate_id in enumerate(engine.candidate_ids)}
+        for job_ids, scores in engine.score_jobs(jobs):
+            row = {job_id: position for position, job_id in enumerate(job_ids)}
+            applications = db.query(Application).options(
+                load_only(Application.id, Application.job_id, Application.candidate_id, Application.match_score)
+            ).filter(Application.job_id.in_(job_ids)).all()
+            for application in applications:
+                position = column.get(str(application.candidate_id))
+                if position is not None:
+                    application.match_score = round(float(scores[row[str(application.job_id)], position]), 2)
+                    updated += 1
+            db.commit()
+        stats = engine.stats()
+
+    return {**stats, "jobs": len(jobs), "applications_updated": updated}
+
+
+if __name__ == "__main__":
+    # Rescore all published jobs after changing match weights:
+    #     python -m app.ml.batch [workers]
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        result = rescore_applications(session, int(sys.argv[1]) if len(sys.argv) > 1 else None)
+    finally:
+        session.close()
+    print(result, file=sys.stderr)
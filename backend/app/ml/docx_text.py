@@ -0,0 +1,133 @@
+import io
+import re
+import zipfile
+from typing import IO, Iterator, List
+from xml.etree.ElementTree import iterparse
+
+# WordprocessingML namespaces
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+PARAGRAPH = W_NS + "p"
+TEXT = W_NS + "t"
+TAB = W_NS + "tab"
+BREAKS = (W_NS + "br", W_NS + "cr")
+TABLE_CELL = W_NS + "tc"
+TABLE_ROW = W_NS + "tr"
+# Text boxes are stored twice: once as DrawingML (mc:Choice) and once as VML
+# (mc:Fallback). Only the first copy is read.
+FALLBACK = MC_NS + "Fallback"
+
+DOCUMENT_PART = "word/document.xml"
+_HEADER_PART = re.compile(r"^word/header(\d*)\.xml$")
+_FOOTER_PART = re.compile(r"^word/footer(\d*)\.xml$")
+
+
+def _numbered_parts(names: List[str], pattern: re.Pattern) -> List[str]:
+    """Return part names matching pattern, ordered by their numeric suffix."""
+    found = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            found.append((int(match.group(1) or 0), name))
+    return [name for _, name in sorted(found)]
+
+
+def iter_part_text(stream: IO[bytes]) -> Iterator[str]:
+    """
+    Stream the text of one WordprocessingML part, one paragraph at a time.
+    
+    Paragraphs are yielded in document order, including those nested in
+    table cells and text boxes. Cells of a table row are joined with tabs;
+    a table nested in a cell adds its rows to that cell's text.
+    Parsed elements are detached from the tree as soon as they are consumed,
+    so memory use is bounded by the largest single paragraph rather than the
+    document.
+    """
+    ancestors = []
+    fallback_depth = 0
+    # One entry per open row and per open cell, innermost last, so nested tables
+    # do not mix their cells into the enclosing row
+    rows: List[List[str]] = []
+    cells: List[List[str]] = []
+    parts: List[str] = []
+    
+    for event, elem in iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            ancestors.append(elem)
+            if tag == FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == TABLE_ROW:
+                rows.append([])
+            elif tag == TABLE_CELL:
+                cells.append([])
+            continue
+        
+        ancestors.pop()
+        if ancestors:
+            ancestors[-1].remove(elem)
+        
+        if tag == FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            continue
+        elif tag == TEXT:
+            parts.append(elem.text or "")
+        elif tag == TAB:
+            parts.append("\t")
+        elif tag in BREAKS:
+            parts.append("\n")
+        elif tag == PARAGRAPH:
+            text = "".join(parts)
+            parts = []
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+        elif tag == TABLE_CELL:
+            text = " ".join(part for part in cells.pop() if part)
+            if rows:
+                rows[-1].append(text)
+        elif tag == TABLE_ROW:
+            text = "\t".join(rows.pop())
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+
+
+def iter_docx_text(file_bytes: bytes) -> Iterator[str]:
+    """
+    Stream paragraph text from a DOCX file without building an object model.
+    
+    Headers are read first, then the document body, then footers.
+    
+    Raises:
+        ValueError: If the file is not a valid DOCX archive
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(file_bytes))
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Not a valid DOCX file: {str(e)}")
+    
+    with archive:
+        names = archive.namelist()
+        if DOCUMENT_PART not in names:
+            raise ValueError("Not a valid DOCX file: missing word/document.xml")
+        
+        part_names = (
+            _numbered_parts(names, _HEADER_PART)
+            + [DOCUMENT_PART]
+            + _numbered_parts(names, _FOOTER_PART)
+        )
+        for name in part_names:
+            with archive.open(name) as stream:
+                yield from iter_part_text(stream)
+
+
+def extract_docx_text(file_bytes: bytes) -> str:
+    """Extract all text from a DOCX file as newline-separated paragraphs."""
+    return "\n".join(iter_docx_text(file_bytes))
@@ -0,0 +1,235 @@
+import csv
+import math
+import re
+import struct
+import sys
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func, update
+from sqlalchemy.orm import Session
+
+DATA_DIR = Path(__file__).parent / "data"
+GAZETTEER_CSV = DATA_DIR / "cities.csv"
+GAZETTEER_BIN = DATA_DIR / "cities.bin"
+
+# Binary layout: magic, place count, names blob length, float32 latitudes,
+# float32 longitudes, then UTF-8 "key\tindex\n" lines mapping names to places
+_MAGIC = b"GZT1"
+_HEADER = struct.Struct("<4sII")
+
+EARTH_RADIUS_KM = 6371.0
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_SEPARATORS = re.compile(r"[,;/|()]| - ")
+# Removed before punctuation is stripped, so phrases and hyphenated forms match
+_FILLER = re.compile(r"\b(?:greater|metro|area|region|city of|remote|hybrid|on[- ]?site)\b")
+
+Coordinates = Tuple[float, float]
+
+
+def normalize_place(text: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = _FILLER.sub(" ", text.lower().replace(".", ""))
+    return " ".join(_NON_ALNUM.sub(" ", text).split())
+
+
+def build_gazetteer(csv_path: Path = GAZETTEER_CSV, bin_path: Path = GAZETTEER_BIN) -> int:
+    """
+    Compile the gazetteer CSV into the binary table loaded at runtime.
+    
+    Each place is reachable by its name, "name region", "name country" and
+    any aliases. When two places share a key, the first one listed wins.
+    
+    Returns:
+        Number of places written
+    """
+    latitudes, longitudes, keys = [], [], {}
+    with open(csv_path, newline="", encoding="utf-8") as handle:
+        for index, row in enumerate(csv.DictReader(handle)):
+            latitudes.append(float(row["lat"]))
+            longitudes.append(float(row["lon"]))
+            names = [row["name"], f"{row['name']} {row['region']}", f"{row['name']} {row['country']}"]
+            names += [alias for alias in row["aliases"].split("|") if alias]
+            for name in names:
+                keys.setdefault(normalize_place(name), index)
+    
+    names_blob = "".join(f"{key}\t{index}\n" for key, index in keys.items()).encode("utf-8")
+    with open(bin_path, "wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, len(latitudes), len(names_blob)))
+        handle.write(np.asarray(latitudes, dtype="<f4").tobytes())
+        handle.write(np.asarray(longitudes, dtype="<f4").tobytes())
+        handle.write(names_blob)
+    return len(latitudes)
+
+
+class Gazetteer:
+    """Offline city lookup backed by the compact binary table."""
+    
+    def __init__(self, bin_path: Path = GAZETTEER_BIN):
+        data = bin_path.read_bytes()
+        magic, count, names_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a gazetteer file: {bin_path}")
+        
+        offset = _HEADER.size
+        self.latitudes = np.frombuffer(data, dtype="<f4", count=count, offset=offset)
+        self.longitudes = np.frombuffer(data, dtype="<f4", count=count, offset=offset + 4 * count)
+        names = data[offset + 8 * count:offset + 8 * count + names_length].decode("utf-8")
+        self.keys: Dict[str, int] = {}
+        for line in names.splitlines():
+            key, index = line.split("\t")
+            self.keys[key] = int(index)
+    
+    def _lookup(self, text: str) -> Optional[int]:
+        key = normalize_place(text)
+        if not key:
+            return None
+        if key in self.keys:
+            return self.keys[key]
+        # "Austin TX 78701" -> try dropping trailing words
+        words = key.split()
+        for end in range(len(words) - 1, 0, -1):
+            index = self.keys.get(" ".join(words[:end]))
+            if index is not None:
+                return index
+        return None
+    
+    def geocode(self, location: Optional[str]) -> Optional[Coordinates]:
+        """
+        Resolve a free-text location to (latitude, longitude).
+        
+        Tries the whole string, then "city, region" and each separated part
+        in order, so "New York, NY", "NYC" and "Brooklyn (Remote)" resolve.
+        """
+        if not location:
+            return None
+        
+        parts = [part for part in _SEPARATORS.split(location) if part.strip()]
+        attempts = [location]
+        if len(parts) > 1:
+            attempts.append(f"{parts[0]} {parts[1]}")
+        # Short trailing parts are region or country codes ("LA", "UK"), not cities
+        attempts.extend(part for i, part in enumerate(parts) if i == 0 or len(normalize_place(part)) > 3)
+        
+        for attempt in attempts:
+            index = self._lookup(attempt)
+            if index is not None:
+                return float(self.latitudes[index]), float(self.longitudes[index])
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    """Load the bundled gazetteer once per process."""
+    return Gazetteer()
+
+
+@lru_cache(maxsize=16384)
+def geocode(location: Optional[str]) -> Optional[Coordinates]:
+    """Memoized `Gazetteer.geocode` on the bundled table."""
+    return get_gazetteer().geocode(location)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; accepts scalars or NumPy arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(value) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Latitude/longitude box containing every point within radius_km.
+    
+    Returns:
+        (min_lat, max_lat, min_lon, max_lon)
+    """
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(lat))
+    lon_delta = 180.0 if cos_lat < 1e-6 else min(180.0, lat_delta / cos_lat)
+    return lat - lat_delta, lat + lat_delta, lon - lon_delta, lon + lon_delta
+
+
+def within_radius(lat_column, lon_column, lat: float, lon: float, radius_km: float):
+    """
+    SQL condition selecting rows within radius_km of (lat, lon).
+    
+    A bounding-box prefilter on the raw columns lets the database use the
+    coordinate index; the exact haversine distance is then checked on the
+    remaining rows.
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_km)
+    conditions = [lat_column.between(min_lat, max_lat)]
+    # Boxes crossing the antimeridian only filter on latitude
+    if min_lon >= -180.0 and max_lon <= 180.0:
+        conditions.append(lon_column.between(min_lon, max_lon))
+    
+    half_dlat = func.radians(lat_column - lat) / 2
+    half_dlon = func.radians(lon_column - lon) / 2
+    a = (
+        func.power(func.sin(half_dlat), 2)
+        + math.cos(math.radians(lat)) * func.cos(func.radians(lat_column)) * func.power(func.sin(half_dlon), 2)
+    )
+    conditions.append(2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(a, 1.0))) <= radius_km)
+    return and_(*conditions)
+
+
+def backfill_coordinates(db: Session, model, only_missing: bool = True, batch_size: int = 1000) -> int:
+    """
+    Geocode the stored locations of existing rows.
+    
+    The save hook only fills coordinates of rows written after it was
+    added; this covers older rows, and with `only_missing=False` rows
+    geocoded with an older gazetteer.
+    
+    Args:
+        db: Database session (committed once at the end)
+        model: `Job` or `Candidate`
+        only_missing: Skip rows that already have coordinates
+        batch_size: Rows per UPDATE round trip
+        
+    Returns:
+        Number of rows whose coordinates changed
+    """
+    query = db.query(model.id, model.location, model.location_lat, model.location_lon).filter(
+        model.location.isnot(None)
+    )
+    if only_missing:
+        query = query.filter(model.location_lat.is_(None))
+    
+    changes = []
+    for row in query.all():
+        latitude, longitude = geocode(row.location) or (None, None)
+        if (latitude, longitude) != (row.location_lat, row.location_lon):
+            changes.append({"id": row.id, "location_lat": latitude, "location_lon": longitude})
+    for start in range(0, len(changes), batch_size):
+        db.execute(update(model), changes[start:start + batch_size])
+    db.commit()
+    return len(changes)
+
+
+if __name__ == "__main__":
+    # Rebuild the binary table after editing cities.csv:
+    #     python -m app.ml.geo
+    # Then fill coordinates of existing jobs and candidates (--all also
+    # recomputes rows that already have them):
+    #     python -m app.ml.geo backfill [--all]
+    if len(sys.argv) > 1 and sys.argv[1] == "backfill":
+        from app.database import SessionLocal
+        from app.models import Candidate, Job
+        
+        session = SessionLocal()
+        try:
+            for table in (Job, Candidate):
+                updated = backfill_coordinates(session, table, only_missing="--all" not in sys.argv)
+                print(f"Updated coordinates of {updated} {table.__tablename__}", file=sys.stderr)
+        finally:
+            session.close()
+    else:
+        count = build_gazetteer()
+        print(f"Wrote {count} places to {GAZETTEER_BIN}", file=sys.stderr)
@@ -0,0 +1,248 @@
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Candidate
+from app.ml.matcher import compute_skills_match, parse_skills
+
+# Prime just above 2**32; with 32-bit inputs and coefficients a*x + b fits in uint64
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+def normalize_skill_set(skills: Iterable[str]) -> Set[str]:
+    """Lowercase, strip and deduplicate skills."""
+    return {skill.strip().lower() for skill in skills if skill and skill.strip()}
+
+
+class MinHasher:
+    """Computes MinHash signatures of string sets with fixed random permutations."""
+    
+    def __init__(self, num_perm: int, seed: int = 1):
+        generator = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = generator.integers(1, _MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+    
+    def signature(self, items: Set[str]) -> np.ndarray:
+        """Return the MinHash signature (one minimum per permutation)."""
+        if not items:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        hashes = np.fromiter(
+            (zlib.crc32(item.encode("utf-8")) for item in items), dtype=np.uint64, count=len(items)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0)
+
+
+class MinHashLSHIndex:
+    """
+    Locality-sensitive hashing index over candidate skill sets.
+    
+    Signatures are split into `bands` bands of `rows` rows; two sets collide
+    in a band when all rows agree, so sets with Jaccard similarity s are
+    retrieved with probability 1 - (1 - s**rows)**bands. More bands raise
+    recall, more rows raise precision and shrink candidate lists.
+    
+    An index loaded from the database is kept current by `refresh`, which
+    re-reads candidates changed after the newest `updated_at` applied (like
+    the candidate store), so every worker sees profile saves made on others.
+    """
+    
+    def __init__(self, bands: int, rows: int, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        self.seed = seed
+        self.hasher = MinHasher(bands * rows, seed)
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+        self._keys: Dict[str, List[bytes]] = {}
+        self._skills: Dict[str, Set[str]] = {}
+        self._unindexed: Set[str] = set()  # Candidates without skills
+        self._lock = threading.Lock()
+        # Serializes loads and refreshes; queries only take `_lock`
+        self._refresh_lock = threading.RLock()
+        self.loaded = False
+        self.watermark = None  # Newest updated_at applied so far
+        self.watermark_ids: Set[str] = set()  # Ids applied with updated_at == watermark
+        self.refreshed_at = 0.0  # time.monotonic() of the last load or refresh
+    
+    def _band_keys(self, skills: Set[str]) -> List[bytes]:
+        signature = self.hasher.signature(skills)
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+    
+    def add(self, candidate_id, skills: Iterable[str]) -> None:
+        """Insert or replace a candidate's skill set."""
+        key = str(candidate_id)
+        skill_set = normalize_skill_set(skills)
+        band_keys = self._band_keys(skill_set) if skill_set else []
+        
+        with self._lock:
+            self._remove_locked(key)
+            if not band_keys:
+                self._unindexed.add(key)
+                return
+            for bucket, band_key in zip(self._buckets, band_keys):
+                bucket.setdefault(band_key, set()).add(key)
+            self._keys[key] = band_keys
+            self._skills[key] = skill_set
+    
+    def remove(self, candidate_id) -> None:
+        """Remove a candidate from the index."""
+        with self._lock:
+            self._remove_locked(str(candidate_id))
+    
+    def _remove_locked(self, key: str) -> None:
+        self._unindexed.discard(key)
+        band_keys = self._keys.pop(key, None)
+        self._skills.pop(key, None)
+        if not band_keys:
+            return
+        for bucket, band_key in zip(self._buckets, band_keys):
+            members = bucket.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del bucket[band_key]
+    
+    def query(self, skills: Iterable[str]) -> Set[str]:
+        """Return ids of candidates colliding with the skill set in any band."""
+        skill_set = normalize_skill_set(skills)
+        if not skill_set:
+            return set()
+        
+        found: Set[str] = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(skill_set)):
+            members = bucket.get(band_key)
+            if members:
+                found.update(members)
+        return found
+    
+    def skills_of(self, candidate_id) -> Set[str]:
+        """Return the indexed skill set of a candidate."""
+        return self._skills.get(str(candidate_id), set())
+    
+    def _apply(self, rows) -> int:
+        """Index (id, skills_text, updated_at) rows and advance the watermark."""
+        applied = 0
+        for candidate_id, skills_text, updated_at in rows:
+            self.add(candidate_id, parse_skills(skills_text))
+            applied += 1
+            if updated_at is None:
+                continue
+            if self.watermark is None or updated_at > self.watermark:
+                self.watermark = updated_at
+                self.watermark_ids = {str(candidate_id)}
+            elif updated_at == self.watermark:
+                self.watermark_ids.add(str(candidate_id))
+        return applied
+    
+    def load(self, db: Session) -> None:
+        """
+        Index every candidate with a narrow query over id and skills.
+        
+        The new index is built aside and swapped in, so queries keep seeing
+        the previous contents until it is complete.
+        """
+        with self._refresh_lock:
+            fresh = MinHashLSHIndex(self.bands, self.rows, self.seed)
+            fresh._apply(db.query(Candidate.id, Candidate.skills_text, Candidate.updated_at).yield_per(5000))
+            with self._lock:
+                self._buckets, self._keys = fresh._buckets, fresh._keys
+                self._skills, self._unindexed = fresh._skills, fresh._unindexed
+            self.watermark, self.watermark_ids = fresh.watermark, fresh.watermark_ids
+            self.refreshed_at = time.monotonic()
+            self.loaded = True
+    
+    def refresh(self, db: Session, max_age: float = 0.0) -> int:
+        """
+        Load the index on first use, then apply candidates changed since the
+        last load or refresh.
+        
+        Deletes are not visible through `updated_at`, so the index is
+        reloaded when it no longer covers as many candidates as the table.
+        
+        Args:
+            db: Database session
+            max_age: Skip the refresh if the last one is more recent than this (seconds)
+        
+        Returns:
+            Number of candidates applied
+        """
+        if self.loaded and time.monotonic() - self.refreshed_at < max_age:
+            return 0
+        with self._refresh_lock:
+            if not self.loaded:
+                self.load(db)
+                return len(self._skills) + len(self._unindexed)
+            # Another thread may have refreshed while this one waited
+            if time.monotonic() - self.refreshed_at < max_age:
+                return 0
+            
+            watermark, seen = self.watermark, set(self.watermark_ids)
+            query = db.query(Candidate.id, Candidate.skills_text, Candidate.updated_at)
+            if watermark is not None:
+                query = query.filter(Candidate.updated_at >= watermark)
+            applied = self._apply(
+                row for row in query.yield_per(5000)
+                if not (row.updated_at == watermark and str(row.id) in seen)
+            )
+            
+            if db.query(func.count(Candidate.id)).scalar() != len(self._skills) + len(self._unindexed):
+                self.load(db)
+            self.refreshed_at = time.monotonic()
+            return applied
+    
+    def __len__(self) -> int:
+        return len(self._skills)
+
+
+def rank_candidates(
+    index: MinHashLSHIndex, job_skills: List[str], limit: int
+) -> List[Tuple[str, float, List[str], List[str]]]:
+    """
+    Retrieve approximate nearest candidates for a job and rerank them exactly.
+    
+    Only the candidates retrieved from the LSH index are scored with
+    `compute_skills_match`; ties are broken by Jaccard similarity.
+    
+    Returns:
+        List of (candidate_id, match_percentage, matched_skills, missing_skills)
+    """
+    job_set = normalize_skill_set(job_skills)
+    scored = []
+    for candidate_id in index.query(job_set):
+        candidate_skills = index.skills_of(candidate_id)
+        match_pct, matched, missing = compute_skills_match(list(candidate_skills), list(job_set))
+        jaccard = len(candidate_skills & job_set) / len(candidate_skills | job_set)
+        scored.append((match_pct, jaccard, candidate_id, matched, missing))
+    
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [(candidate_id, pct, matched, missing) for pct, _, candidate_id, matched, missing in scored[:limit]]
+
+
+_candidate_index: Optional[MinHashLSHIndex] = None
+_candidate_index_lock = threading.Lock()
+
+
+def get_candidate_index(db: Optional[Session] = None) -> MinHashLSHIndex:
+    """
+    Return the process-wide candidate LSH index.
+    
+    With a session the index is loaded on first use and refreshed from
+    `updated_at` at most every LSH_REFRESH_SECONDS; without one it is
+    returned as is (possibly not loaded yet).
+    """
+    global _candidate_index
+    if _candidate_index is None:
+        with _candidate_index_lock:
+            if _candidate_index is None:
+                _candidate_index = MinHashLSHIndex(settings.LSH_BANDS, settings.LSH_ROWS)
+    if db is not None:
+        _candidate_index.refresh(db, settings.LSH_REFRESH_SECONDS)
+    return _candidate_index
@@ -1,21 +1,33 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from app.core.config import settings
 from app.models import Candidate, Job
+from app.ml.geo import Coordinates, geocode, haversine_km
+from app.ml.relevance import relevance_index
+from app.ml.skills import canonical_skill
+
+# Location penalty floors for candidates far from a hybrid or on-site job
+LOCATION_MISMATCH_PENALTY = {"hybrid": 0.85, "on-site": 0.6}
 
 
 def parse_skills(skills_text: str) -> List[str]:
     """
     Parse comma-separated skills string into a list.
     
+    Aliases and small typos are resolved to canonical names, so
+    "Postgres" and "PostgreSQL" count as the same skill.
+    
     Args:
         skills_text: Comma-separated skills string
         
     Returns:
-        List of skill strings (lowercase, stripped)
+        List of unique canonical skill strings (lowercase, stripped)
     """
     if not skills_text:
         return []
     
-    return [skill.strip().lower() for skill in skills_text.split(',') if skill.strip()]
+    skills = (canonical_skill(skill) for skill in skills_text.split(',') if skill.strip())
+    return list(dict.fromkeys(skills))
 
 
 def compute_skills_match(candidate_skills: List[str], job_skills: List[str]) -> Tuple[float, List[str], List[str]]:
@@ -87,7 +99,32 @@ def compute_experience_match(candidate_exp: int, job_min_exp: int, job_max_exp:
         return False, penalty
 
 
-def compute_location_match(candidate_location: str, job_location: str, remote_type: str) -> Tuple[bool, float]:
+def location_coordinates(row) -> Optional[Coordinates]:
+    """Coordinates cached on a candidate or job row, geocoding if not yet cached."""
+    if row.location_lat is not None and row.location_lon is not None:
+        return row.location_lat, row.location_lon
+    return geocode(row.location)
+
+
+def distance_penalty(distance_km, remote_type: str):
+    """
+    Distance-decay location factor; accepts a scalar or a NumPy array.
+    
+    Within LOCATION_MATCH_RADIUS_KM the factor is 1. Beyond it the factor
+    decays exponentially towards the mismatch penalty for the remote type.
+    """
+    floor = LOCATION_MISMATCH_PENALTY.get(remote_type, LOCATION_MISMATCH_PENALTY["on-site"])
+    excess = np.maximum(distance_km - settings.LOCATION_MATCH_RADIUS_KM, 0.0)
+    return floor + (1.0 - floor) * np.exp(-excess / settings.LOCATION_DECAY_KM)
+
+
+def compute_location_match(
+    candidate_location: str,
+    job_location: str,
+    remote_type: str,
+    candidate_coords: Optional[Coordinates] = None,
+    job_coords: Optional[Coordinates] = None
+) -> Tuple[bool, float]:
     """
     Compute location match between candidate and job.
     
@@ -95,6 +132,8 @@ def compute_location_match(candidate_location: str, job_location: str, remote_ty
         candidate_location: Candidate's location
         job_location: Job's location
         remote_type: Job's remote type ('on-site', 'remote', 'hybrid')
+        candidate_coords: Cached (lat, lon) of the candidate location (geocoded if omitted)
+        job_coords: Cached (lat, lon) of the job location (geocoded if omitted)
         
     Returns:
         Tuple of (is_match, penalty_factor)
@@ -107,6 +146,15 @@ def compute_location_match(candidate_location: str, job_location: str, remote_ty
     if not candidate_location or not job_location:
         return True, 0.9
     
+    # Distance-based matching when both locations are in the gazetteer
+    candidate_coords = candidate_coords or geocode(candidate_location)
+    job_coords = job_coords or geocode(job_location)
+    if candidate_coords and job_coords:
+        distance = float(haversine_km(*candidate_coords, *job_coords))
+        if distance <= settings.LOCATION_MATCH_RADIUS_KM:
+            return True, 1.0
+        return False, float(distance_penalty(distance, remote_type))
+    
     # Simple location matching (case-insensitive contains)
     candidate_loc_lower = candidate_location.lower()
     job_loc_lower = job_location.lower()
@@ -116,38 +164,78 @@ def compute_location_match(candidate_location: str, job_location: str, remote_ty
         return True, 1.0
     
     # Hybrid jobs with location mismatch - moderate penalty
-    if remote_type == "hybrid":
-        return False, 0.85
-    
     # On-site with location mismatch - larger penalty
-    return False, 0.6
+    return False, LOCATION_MISMATCH_PENALTY.get(remote_type, LOCATION_MISMATCH_PENALTY["on-site"])
 
 
-def compute_match_score(candidate: Candidate, job: Job) -> float:
+def compute_location_matches(job: Job, candidates: Sequence[Candidate]) -> List[Tuple[bool, float]]:
     """
-    Compute overall match score between a candidate and a job.
+    Location match of many candidates against one job.
     
-    The score is calculated based on:
-    1. Skills match (60% weight)
-    2. Experience match (25% weight)
-    3. Location match (15% weight)
+    Distances for candidates with cached coordinates are computed in one
+    vectorized pass; the rest fall back to `compute_location_match`.
+    """
+    job_coords = location_coordinates(job) if job.location else None
+    if job.remote_type == "remote" or not job_coords:
+        return [
+            compute_location_match(candidate.location, job.location, job.remote_type)
+            for candidate in candidates
+        ]
     
-    Args:
-        candidate: Candidate model instance
-        job: Job model instance
-        
-    Returns:
-        Match score as a float between 0 and 100
+    results: List[Tuple[bool, float]] = [None] * len(candidates)
+    positions, latitudes, longitudes = [], [], []
+    for position, candidate in enumerate(candidates):
+        if candidate.location and candidate.location_lat is not None and candidate.location_lon is not None:
+            positions.append(position)
+            latitudes.append(candidate.location_lat)
+            longitudes.append(candidate.location_lon)
+        else:
+            results[position] = compute_location_match(
+                candidate.location, job.location, job.remote_type, job_coords=job_coords
+            )
+    
+    if positions:
+        distances = haversine_km(np.asarray(latitudes), np.asarray(longitudes), *job_coords)
+        matches = distances <= settings.LOCATION_MATCH_RADIUS_KM
+        penalties = np.where(matches, 1.0, distance_penalty(distances, job.remote_type))
+        for position, is_match, penalty in zip(positions, matches.tolist(), penalties.tolist()):
+            results[position] = (is_match, penalty)
+    
+    return results
+
+
+def match_weights() -> Dict[str, float]:
+    """
+    Get match score component weights, normalized to sum to 1.
+    
+    Defaults to skills 60%, experience 25%, location 15% and no text relevance.
     """
+    weights = {
+        "skills": settings.MATCH_WEIGHT_SKILLS,
+        "experience": settings.MATCH_WEIGHT_EXPERIENCE,
+        "location": settings.MATCH_WEIGHT_LOCATION,
+        "text": settings.MATCH_WEIGHT_TEXT,
+    }
+    total = sum(weights.values())
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def _structured_score(
+    candidate: Candidate,
+    job: Job,
+    weights: Dict[str, float],
+    location: Optional[Tuple[bool, float]] = None
+) -> float:
+    """Weighted skills, experience and location components of the match score."""
     # Parse skills
     candidate_skills = parse_skills(candidate.skills_text)
     job_skills = parse_skills(job.skills_required)
     
-    # 1. Skills Match (60% weight)
+    # 1. Skills Match
     skills_match_pct, matched_skills, missing_skills = compute_skills_match(candidate_skills, job_skills)
-    skills_score = skills_match_pct * 0.6
+    skills_score = skills_match_pct * weights["skills"]
     
-    # 2. Experience Match (25% weight)
+    # 2. Experience Match
     exp_match, exp_penalty = compute_experience_match(
         candidate.experience_years or 0,
         job.experience_min or 0,
@@ -155,25 +243,74 @@ def compute_match_score(candidate: Candidate, job: Job) -> float:
     )
     # Base experience score on whether they meet minimum
     exp_base_score = 100 if exp_match else 50
-    exp_score = (exp_base_score * exp_penalty) * 0.25
+    exp_score = (exp_base_score * exp_penalty) * weights["experience"]
     
-    # 3. Location Match (15% weight)
-    loc_match, loc_penalty = compute_location_match(
+    # 3. Location Match
+    loc_match, loc_penalty = location or compute_location_match(
         candidate.location,
         job.location,
-        job.remote_type
+        job.remote_type,
+        location_coordinates(candidate),
+        location_coordinates(job)
     )
     # Base location score on whether they match
     loc_base_score = 100 if loc_match else 50
-    loc_score = (loc_base_score * loc_penalty) * 0.15
+    loc_score = (loc_base_score * loc_penalty) * weights["location"]
     
-    # Calculate total score
-    total_score = skills_score + exp_score + loc_score
+    return skills_score + exp_score + loc_score
+
+
+def compute_match_score(candidate: Candidate, job: Job) -> float:
+    """
+    Compute overall match score between a candidate and a job.
+    
+    The score is calculated based on (default weights, see `match_weights`):
+    1. Skills match (60% weight)
+    2. Experience match (25% weight)
+    3. Location match (15% weight)
+    4. Text relevance of the job to the candidate profile (0% weight)
+    
+    Args:
+        candidate: Candidate model instance
+        job: Job model instance
+        
+    Returns:
+        Match score as a float between 0 and 100
+    """
+    weights = match_weights()
+    total_score = _structured_score(candidate, job, weights)
+    
+    # 4. Text relevance (TF-IDF)
+    if weights["text"]:
+        total_score += relevance_index.score(candidate, job) * weights["text"]
     
     # Ensure score is between 0 and 100
     return round(min(100.0, max(0.0, total_score)), 2)
 
 
+def compute_match_scores(job: Job, candidates: Sequence[Candidate]) -> List[float]:
+    """
+    Compute match scores of many candidates against one job.
+    
+    Equivalent to calling `compute_match_score` per candidate, with location
+    distances and text relevance (one sparse product) computed vectorized. This is the ORM-level reference the
+    columnar `BatchMatchEngine` is checked against; production scoring of
+    many candidates goes through the engine or the scatter shards.
+    """
+    weights = match_weights()
+    locations = compute_location_matches(job, candidates)
+    totals = [
+        _structured_score(candidate, job, weights, location)
+        for candidate, location in zip(candidates, locations)
+    ]
+    
+    if weights["text"]:
+        relevance = relevance_index.score_many(candidates, job)
+        totals = [total + score * weights["text"] for total, score in zip(totals, relevance.tolist())]
+    
+    return [round(min(100.0, max(0.0, total)), 2) for total in totals]
+
+
 def get_match_details(candidate: Candidate, job: Job) -> dict:
     """
     Get detailed match information between candidate and job.
@@ -197,11 +334,14 @@ def get_match_details(candidate: Candidate, job: Job) -> dict:
     loc_match, loc_penalty = compute_location_match(
         candidate.location,
         job.location,
-        job.remote_type
+        job.remote_type,
+        location_coordinates(candidate),
+        location_coordinates(job)
     )
     
     return {
         "overall_score": compute_match_score(candidate, job),
+        "text_relevance": round(relevance_index.score(candidate, job), 2),
         "skills": {
             "match_percentage": round(skills_match_pct, 2),
             "matched": matched_skills,
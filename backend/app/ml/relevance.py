@@ -0,0 +1,189 @@
+import math
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.models import Candidate, Job
+
+# Terms are hashed into a fixed-size space so vectors can be built
+# independently per document without a shared vocabulary
+HASH_BITS = 18
+DIMENSION = 1 << HASH_BITS
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
+    "by", "from", "as", "is", "was", "are", "were", "be", "been", "have", "has", "had",
+    "will", "would", "can", "this", "that", "these", "those", "we", "you", "our", "your",
+    "their", "it", "its", "who", "what", "which", "all", "any", "into", "about", "us",
+})
+
+# Sparse vector: (sorted term indices, L2-normalized weights)
+SparseVector = Tuple[np.ndarray, np.ndarray]
+
+EMPTY_VECTOR: SparseVector = (np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase text and split it into terms, dropping stop words."""
+    if not text:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def term_index(term: str) -> int:
+    """Stable hash of a term into the vector space (identical across processes)."""
+    return zlib.crc32(term.encode("utf-8")) & (DIMENSION - 1)
+
+
+def vectorize(text: Optional[str]) -> SparseVector:
+    """
+    Build a sparse, L2-normalized term-frequency vector.
+    
+    Uses sublinear term frequency (1 + log tf) so repeated terms do not
+    dominate long descriptions.
+    """
+    counts: Dict[int, int] = {}
+    for token in tokenize(text):
+        index = term_index(token)
+        counts[index] = counts.get(index, 0) + 1
+    
+    if not counts:
+        return EMPTY_VECTOR
+    
+    indices = np.fromiter(sorted(counts), dtype=np.int32, count=len(counts))
+    weights = np.array([1.0 + math.log(counts[i]) for i in indices], dtype=np.float32)
+    weights /= np.linalg.norm(weights)
+    return indices, weights
+
+
+def csr_matvec(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, query: SparseVector) -> np.ndarray:
+    """
+    Dot product of every row of a CSR term matrix with a sparse query vector.
+
+    Args:
+        indptr, indices, data: The matrix, rows with sorted term indices
+            (the layout of the candidate store's text columns)
+        query: Sparse vector with sorted, unique indices
+
+    Returns:
+        float64 array with one score per row
+    """
+    rows = len(indptr) - 1
+    query_indices, query_weights = query
+    if not len(query_indices) or not len(indices):
+        return np.zeros(rows)
+    positions = np.minimum(np.searchsorted(query_indices, indices), len(query_indices) - 1)
+    products = np.where(query_indices[positions] == indices, data * query_weights[positions], 0.0)
+    return np.bincount(np.repeat(np.arange(rows), np.diff(indptr)), weights=products, minlength=rows)
+
+
+def job_text(job: Job) -> str:
+    """Text used to describe a job for relevance scoring."""
+    return " ".join(part for part in (job.title, job.skills_required, job.description) if part)
+
+
+def candidate_text(candidate: Candidate) -> str:
+    """Text used to describe a candidate for relevance scoring."""
+    return " ".join(part for part in (candidate.headline, candidate.skills_text) if part)
+
+
+class TextRelevanceIndex:
+    """
+    TF-IDF relevance between job texts and candidate profiles.
+    
+    Job vectors are cached when a job is published and candidate vectors
+    when a profile is saved, keyed by the row's `updated_at` so stale
+    entries are rebuilt on demand; each cache keeps at most `max_entries`,
+    dropping the least recently used. Inverse document frequencies come from
+    the candidate store, which covers the whole candidates table (or the
+    shared snapshot); until a store is attached, relevance is the plain
+    term-frequency cosine.
+    """
+    
+    def __init__(self, max_entries: int = 50_000):
+        self.max_entries = max_entries
+        self._jobs: "OrderedDict[str, Tuple[object, SparseVector]]" = OrderedDict()
+        self._candidates: "OrderedDict[str, Tuple[object, SparseVector]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._frequencies = None  # CandidateStore providing document frequencies
+    
+    def use_document_frequencies(self, store) -> None:
+        """Take IDF weights from a `CandidateStore` (called by `get_candidate_store`)."""
+        self._frequencies = store
+    
+    def _cached(self, cache: OrderedDict, row, text: Callable) -> SparseVector:
+        """Return a row's cached vector, building it if missing or stale."""
+        key = str(row.id)
+        with self._lock:
+            cached = cache.get(key)
+            if cached and cached[0] == row.updated_at:
+                cache.move_to_end(key)
+                return cached[1]
+        
+        vector = vectorize(text(row))
+        with self._lock:
+            cache[key] = (row.updated_at, vector)
+            cache.move_to_end(key)
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+        return vector
+    
+    def job_vector(self, job: Job) -> SparseVector:
+        """Return the cached vector for a job, building it if missing or stale."""
+        return self._cached(self._jobs, job, job_text)
+    
+    def candidate_vector(self, candidate: Candidate) -> SparseVector:
+        """Return the cached vector for a candidate, building it if missing or stale."""
+        return self._cached(self._candidates, candidate, candidate_text)
+    
+    def discard_job(self, job_id) -> None:
+        """Drop a job's cached vector (e.g. after it is unpublished or deleted)."""
+        with self._lock:
+            self._jobs.pop(str(job_id), None)
+    
+    def query_vector(self, job: Job) -> SparseVector:
+        """Sparse IDF-weighted, L2-normalized query vector for a job."""
+        vector = self.job_vector(job)
+        store = self._frequencies
+        return store.query_vector(vector) if store is not None else vector
+    
+    def score(self, candidate: Candidate, job: Job) -> float:
+        """Cosine relevance of one candidate to one job, scaled to 0-100."""
+        indices, weights = self.candidate_vector(candidate)
+        query_indices, query_weights = self.query_vector(job)
+        if len(indices) == 0 or len(query_indices) == 0:
+            return 0.0
+        # Both index arrays are sorted and unique
+        _, left, right = np.intersect1d(indices, query_indices, assume_unique=True, return_indices=True)
+        return float(np.dot(weights[left], query_weights[right])) * 100
+    
+    def score_many(self, candidates: Sequence[Candidate], job: Job) -> np.ndarray:
+        """
+        Cosine relevance of many candidates to one job, scaled to 0-100.
+        
+        The candidates' vectors are stacked into one CSR matrix and scored
+        with a single product against the job's query vector.
+        """
+        vectors = [self.candidate_vector(candidate) for candidate in candidates]
+        if not vectors:
+            return np.zeros(0)
+        lengths = np.fromiter((len(indices) for indices, _ in vectors), dtype=np.int64, count=len(vectors))
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        indices = np.concatenate([indices for indices, _ in vectors])
+        data = np.concatenate([weights for _, weights in vectors])
+        return csr_matvec(indptr, indices, data, self.query_vector(job)) * 100
+    
+    def stats(self) -> dict:
+        """Cache sizes for monitoring."""
+        return {"jobs": len(self._jobs), "candidates": len(self._candidates)}
+
+
+# Process-wide index shared by the API routes and the matcher
+relevance_index = TextRelevanceIndex(max_entries=settings.RELEVANCE_CACHE_MAX_ENTRIES)
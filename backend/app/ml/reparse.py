@@ -0,0 +1,292 @@
+"""
+Resumable re-parse of stored resumes after the resume parser changes.
+
+Candidates record the `PARSER_VERSION` that last filled their skills and
+experience. When the skill vocabulary or an extractor changes, the
+version changes too, and this pipeline walks every candidate whose
+resume is in the blob store and who is not on the current version:
+- keyset batches of candidate ids, so nothing is held in memory or
+  skipped when rows are added meanwhile
+- extraction in a process pool; workers read the stored `.txt` sidecar
+  (or re-extract the PDF/DOCX with `reextract`) and return plain fields
+- results are merged with the stored fields: new skills are appended,
+  experience and phone are only filled when empty, so profile edits
+  made by the candidate are never overwritten
+- changed rows are written with one executemany UPDATE per batch,
+  unchanged rows only get their version stamp; the candidates trigger
+  in schema.sql leaves `updated_at` alone for an update that changes
+  nothing but `parser_version`, so the candidate store does not re-read
+  them
+
+Progress is checkpointed to `<RESUME_STORE_DIR>/reparse-checkpoint.json`
+after every committed batch; an interrupted run continues after the
+last committed id. The checkpoint also carries the throughput and ETA
+shown in the admin stats.
+"""
+import multiprocessing
+import os
+import re
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from app.core.blobstore import BlobStore, get_resume_store
+from app.core.config import settings
+from app.ml.resume_parser import PARSER_VERSION, extract_fields, extract_resume_text
+from app.ml.skills import canonical_skill
+from app.models import Candidate
+
+RESUME_URL_PATTERN = re.compile(r"/api/resumes/([0-9a-f]{64})")
+CHECKPOINT_NAME = "reparse-checkpoint.json"
+COUNTERS = ("processed", "changed", "unchanged", "failed", "missing")
+
+
+def checkpoint_path(store: BlobStore) -> str:
+    return os.path.join(store.root, CHECKPOINT_NAME)
+
+
+def load_checkpoint(store: BlobStore) -> Optional[dict]:
+    """The saved checkpoint, or None if there is none."""
+    try:
+        with open(checkpoint_path(store), "rb") as checkpoint:
+            return orjson.loads(checkpoint.read())
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(store: BlobStore, checkpoint: dict) -> None:
+    store._write_atomic(checkpoint_path(store), [orjson.dumps(checkpoint, option=orjson.OPT_INDENT_2)])
+
+
+_worker_store: Optional[BlobStore] = None
+_worker_reextract = False
+
+
+def _init_worker(store_root: str, reextract: bool) -> None:
+    global _worker_store, _worker_reextract
+    _worker_store = BlobStore(store_root)
+    _worker_reextract = reextract
+
+
+def _reparse(task: Tuple[str, str]) -> Tuple[str, Optional[dict], Optional[str]]:
+    """
+    Extract the fields of one stored resume.
+
+    Returns:
+        (candidate id, skills/experience/phone or None, error name or None)
+    """
+    candidate_id, digest = task
+    try:
+        text = None if _worker_reextract else _worker_store.get_text(digest)
+        if text is None:
+            if not _worker_store.exists(digest):
+                return candidate_id, None, "missing"
+            metadata = _worker_store.metadata(digest) or {}
+            text = extract_resume_text(_worker_store.read(digest), "resume" + metadata.get("extension", ""))
+            _worker_store.put_text(digest, text)
+        fields = extract_fields(text)
+    except Exception as e:
+        return candidate_id, None, type(e).__name__
+    return candidate_id, {
+        "skills": fields["skills"],
+        "experience_years": fields["experience_years"],
+        "phone": fields["phone"],
+    }, None
+
+
+def merge_fields(candidate, parsed: dict) -> Dict:
+    """
+    Stored fields updated with freshly parsed ones.
+
+    Skills are added when their canonical name is not already listed;
+    experience and phone are only filled in when empty.
+
+    Returns:
+        Changed column values (empty if nothing changed)
+    """
+    changes = {}
+    existing = [skill.strip() for skill in (candidate.skills_text or "").split(",") if skill.strip()]
+    known = {canonical_skill(skill) for skill in existing}
+    added = []
+    for skill in parsed["skills"]:
+        canonical = canonical_skill(skill)
+        if canonical not in known:
+            known.add(canonical)
+            added.append(skill)
+    if added:
+        changes["skills_text"] = ", ".join(existing + added)
+    if not candidate.experience_years and parsed["experience_years"]:
+        changes["experience_years"] = parsed["experience_years"]
+    if not candidate.phone and parsed["phone"]:
+        changes["phone"] = parsed["phone"][:20]
+    return changes
+
+
+def _pending(db: Session):
+    return db.query(Candidate).filter(
+        Candidate.resume_url.like("%/api/resumes/%"),
+        or_(Candidate.parser_version.is_(None), Candidate.parser_version != PARSER_VERSION)
+    )
+
+
+def reparse_resumes(db: Session, workers: Optional[int] = None, batch_size: int = 500,
+                    reextract: bool = False, restart: bool = False) -> dict:
+    """
+    Bring every stored resume's candidate up to the current parser version.
+
+    Args:
+        db: Session used for reading batches and writing updates
+        workers: Extraction processes (default BATCH_MATCH_WORKERS or CPU count)
+        batch_size: Candidates per batch (and per commit)
+        reextract: Re-extract text from the PDF/DOCX instead of using stored text
+        restart: Ignore a saved checkpoint for the current version
+
+    Returns:
+        The final checkpoint (counters, throughput, elapsed seconds)
+
+    Raises:
+        RuntimeError: If RESUME_STORE_DIR is not configured
+    """
+    store = get_resume_store()
+    if store is None:
+        raise RuntimeError("RESUME_STORE_DIR is not configured")
+    workers = workers or settings.BATCH_MATCH_WORKERS or os.cpu_count() or 1
+
+    checkpoint = load_checkpoint(store)
+    if restart or not checkpoint or checkpoint.get("parser_version") != PARSER_VERSION:
+        checkpoint = {"parser_version": PARSER_VERSION, "last_id": None, **dict.fromkeys(COUNTERS, 0), "elapsed": 0.0}
+    checkpoint.update(
+        status="running",
+        workers=workers,
+        started_at=datetime.now(timezone.utc).isoformat(),
+        pending_at_start=_pending(db).count(),
+    )
+    save_checkpoint(store, checkpoint)
+
+    if workers > 1:
+        pool = multiprocessing.get_context().Pool(workers, initializer=_init_worker, initargs=(store.root, reextract))
+        run = pool.imap_unordered
+    else:
+        pool = None
+        _init_worker(store.root, reextract)
+        run = map
+    run_processed = 0
+    started = time.perf_counter()
+    elapsed_before = checkpoint["elapsed"]
+    wrapped = False
+    try:
+        while True:
+            query = _pending(db).with_entities(
+                Candidate.id, Candidate.resume_url, Candidate.skills_text, Candidate.experience_years, Candidate.phone
+            )
+            if checkpoint["last_id"]:
+                query = query.filter(Candidate.id > uuid.UUID(checkpoint["last_id"]))
+            rows = query.order_by(Candidate.id).limit(batch_size).all()
+            if not rows:
+                # One more pass from the start picks up rows added below the
+                # keyset position since it was saved (stamped rows drop out)
+                if checkpoint["last_id"] and not wrapped:
+                    wrapped = True
+                    checkpoint["last_id"] = None
+                    continue
+                break
+
+            by_id = {str(row.id): row for row in rows}
+            changed: List[dict] = []
+            unchanged = []
+            errors = 0
+            tasks = []
+            for row in rows:
+                match = RESUME_URL_PATTERN.search(row.resume_url)
+                if match:
+                    tasks.append((str(row.id), match.group(1)))
+                else:
+                    checkpoint["missing"] += 1
+                    errors += 1
+                    unchanged.append(row.id)
+
+            now = datetime.now(timezone.utc)
+            for candidate_id, parsed, error in run(_reparse, tasks):
+                row = by_id[candidate_id]
+                if error:
+                    # Stamped anyway so a broken file is not retried on every run
+                    checkpoint["missing" if error == "missing" else "failed"] += 1
+                    errors += 1
+                    unchanged.append(row.id)
+                    continue
+                changes = merge_fields(row, parsed)
+                if changes:
+                    changed.append({"id": row.id, "parser_version": PARSER_VERSION, "updated_at": now, **changes})
+                else:
+                    unchanged.append(row.id)
+
+            if changed:
+                db.execute(update(Candidate), changed)
+            if unchanged:
+                # Stamp only: keep updated_at (the ORM onupdate would set now(), the trigger keeps OLD)
+                db.execute(
+                    update(Candidate)
+                    .where(Candidate.id.in_(unchanged))
+                    .values(parser_version=PARSER_VERSION, updated_at=Candidate.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+
+            run_processed += len(rows)
+            elapsed = time.perf_counter() - started
+            checkpoint["last_id"] = str(rows[-1].id)
+            checkpoint["processed"] += len(rows)
+            checkpoint["changed"] += len(changed)
+            checkpoint["unchanged"] += len(unchanged) - errors
+            checkpoint["elapsed"] = round(elapsed_before + elapsed, 3)
+            checkpoint["rows_per_second"] = round(run_processed / elapsed, 1) if elapsed else 0
+            remaining = max(checkpoint["pending_at_start"] - run_processed, 0)
+            checkpoint["eta_seconds"] = round(remaining / checkpoint["rows_per_second"]) if checkpoint["rows_per_second"] else None
+            save_checkpoint(store, checkpoint)
+    except BaseException:
+        db.rollback()
+        checkpoint["status"] = "interrupted"
+        save_checkpoint(store, checkpoint)
+        raise
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    checkpoint.update(status="complete", eta_seconds=0, finished_at=datetime.now(timezone.utc).isoformat())
+    save_checkpoint(store, checkpoint)
+    return checkpoint
+
+
+def reparse_progress() -> Optional[dict]:
+    """Progress of the latest re-parse run for the admin stats (None if never run)."""
+    store = get_resume_store()
+    checkpoint = load_checkpoint(store) if store is not None else None
+    if checkpoint is None:
+        return None
+    return {**checkpoint, "current_parser_version": PARSER_VERSION}
+
+
+if __name__ == "__main__":
+    # Re-parse stored resumes after a parser change (safe to interrupt and rerun):
+    #     python -m app.ml.reparse [workers] [--reextract] [--restart]
+    from app.database import SessionLocal
+
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    session = SessionLocal()
+    try:
+        result = reparse_resumes(
+            session,
+            int(arguments[0]) if arguments else None,
+            reextract="--reextract" in sys.argv,
+            restart="--restart" in sys.argv,
+        )
+    finally:
+        session.close()
+    print(result, file=sys.stderr)
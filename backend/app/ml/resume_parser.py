@@ -1,9 +1,16 @@
 import re
-import pdfplumber
-from docx import Document
+import importlib
+import zlib
 from typing import Dict, List, Optional
 import io
 
+from app.ml.docx_text import extract_docx_text
+from app.ml.skills import SKILL_ALIASES
+
+# pdfplumber (with pdfminer) is imported on first use so that processes
+# which never parse a resume do not pay its import cost.
+_HEAVY_PARSER_MODULES = ("pdfplumber",)
+
 
 # Predefined list of common tech skills
 TECH_SKILLS = [
@@ -33,8 +40,16 @@ TECH_SKILLS = [
 ]
 
 
+def warm_up_parsers() -> None:
+    """Import the PDF parser libraries ahead of the first upload."""
+    for module_name in _HEAVY_PARSER_MODULES:
+        importlib.import_module(module_name)
+
+
 def extract_text_from_pdf(file_bytes: bytes) -> str:
     """Extract text from PDF file."""
+    import pdfplumber
+    
     try:
         with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
             text = ""
@@ -46,56 +61,134 @@ def extract_text_from_pdf(file_bytes: bytes) -> str:
 
 
 def extract_text_from_docx(file_bytes: bytes) -> str:
-    """Extract text from DOCX file."""
+    """
+    Extract text from DOCX file.
+    
+    Streams headers, body (including tables and text boxes) and footers
+    straight from the archive instead of building a python-docx document.
+    """
     try:
-        doc = Document(io.BytesIO(file_bytes))
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text
+        return extract_docx_text(file_bytes)
     except Exception as e:
         raise ValueError(f"Error extracting text from DOCX: {str(e)}")
 
 
+# Precompiled patterns shared by all extractors
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+PHONE_PATTERNS = [
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # +1-234-567-8900
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # (234) 567-8900
+    re.compile(r'\d{10}'),  # 2345678900
+]
+
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'experience[:\s]+(\d+)\+?\s*years?'),
+    re.compile(r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience'),
+]
+
+NAME_PATTERN = re.compile(r'^[A-Za-z\s.]+$')
+
+# A single alternation is equivalent to any() over the individual keywords
+EDUCATION_PATTERN = re.compile('|'.join([
+    r'bachelor', r'master', r'phd', r'doctorate', r'b\.?s\.?', r'm\.?s\.?',
+    r'b\.?tech', r'm\.?tech', r'mba', r'university', r'college', r'degree'
+]))
+
+
+# Bump when an extractor changes its output; vocabulary changes are fingerprinted below.
+# Candidates parsed with another version are picked up by `python -m app.ml.reparse`.
+PARSER_REVISION = 1
+PARSER_VERSION = "{}.{:08x}".format(PARSER_REVISION, zlib.crc32("\n".join(
+    sorted(TECH_SKILLS) + sorted(f"{alias}={skill}" for alias, skill in SKILL_ALIASES.items())
+).encode()))
+
+
+def _compile_skill_patterns(terms: List[str]):
+    """
+    Build a single-pass matcher for skill names and aliases.
+    
+    The combined pattern reports at most one term per start position, so any
+    term that can match at the same position as a longer one (for example
+    "react" inside "react js") is also kept as an individual pattern.
+    """
+    lowered = list(dict.fromkeys(term.lower() for term in terms))
+    individual = {skill: re.compile(r'\b' + re.escape(skill) + r'\b') for skill in lowered}
+    overlapping = {
+        short: individual[short] for short in lowered for long in lowered
+        if short != long and long.startswith(short) and individual[short].match(long)
+    }
+    alternatives = '|'.join(re.escape(skill) for skill in sorted(lowered, key=len, reverse=True))
+    combined = re.compile(r'\b(?=(' + alternatives + r')\b)')
+    return combined, overlapping
+
+
+SKILLS_PATTERN, OVERLAPPING_SKILL_PATTERNS = _compile_skill_patterns(TECH_SKILLS + list(SKILL_ALIASES))
+
+
+class ResumeText:
+    """
+    Resume text prepared once for all extractors.
+    
+    Lowercases and splits the text a single time, so the extractors share
+    that work instead of each redoing it on the whole text.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.lines = text.split('\n')
+        self.lower_lines = self.lower.split('\n')
+
+
 def extract_email(text: str) -> Optional[str]:
     """Extract email address from text using regex."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = EMAIL_PATTERN.search(text)
     return match.group(0) if match else None
 
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text using regex."""
-    # Matches various phone formats
-    phone_patterns = [
-        r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-234-567-8900
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (234) 567-8900
-        r'\d{10}',  # 2345678900
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
+    # Patterns are tried in order of specificity
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(0)
     
     return None
 
 
+def _skills_from_lower(text_lower: str) -> List[str]:
+    """Match skills against already-lowercased text, in TECH_SKILLS order."""
+    found = set(SKILLS_PATTERN.findall(text_lower))
+    for term, pattern in OVERLAPPING_SKILL_PATTERNS.items():
+        if term not in found and pattern.search(text_lower):
+            found.add(term)
+    found = {SKILL_ALIASES.get(term, term) for term in found}
+    
+    # Capitalize for consistency and remove duplicates while preserving order
+    return list(dict.fromkeys(skill.title() for skill in TECH_SKILLS if skill.lower() in found))
+
+
 def extract_skills(text: str) -> List[str]:
     """
     Extract skills from text by matching against predefined skill list.
     
     Uses case-insensitive matching and returns unique skills found.
+    Known aliases (e.g. "Postgres", "React.js") count as the canonical skill.
     """
-    text_lower = text.lower()
-    found_skills = []
-    
-    for skill in TECH_SKILLS:
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill.title())  # Capitalize for consistency
+    return _skills_from_lower(text.lower())
+
+
+def _experience_from_lower(text_lower: str) -> int:
+    """Match experience patterns against already-lowercased text."""
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            return int(match.group(1))
     
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(found_skills))
+    return 0
 
 
 def extract_experience_years(text: str) -> int:
@@ -104,18 +197,7 @@ def extract_experience_years(text: str) -> int:
     
     Looks for patterns like "5 years experience", "3+ years", etc.
     """
-    patterns = [
-        r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-        r'experience[:\s]+(\d+)\+?\s*years?',
-        r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            return int(match.group(1))
-    
-    return 0
+    return _experience_from_lower(text.lower())
 
 
 def extract_name(text: str) -> Optional[str]:
@@ -134,58 +216,71 @@ def extract_name(text: str) -> Optional[str]:
         line = line.strip()
         if line and len(line) < 50:  # Names are usually short
             # Check if it looks like a name (mostly letters and spaces)
-            if re.match(r'^[A-Za-z\s.]+$', line):
+            if NAME_PATTERN.match(line):
                 return line
     
     return None
 
 
+def _education_from_lines(lines: List[str], lower_lines: List[str]) -> Optional[str]:
+    """Collect education lines given original and lowercased lines."""
+    education_lines = []
+    
+    for i, line_lower in enumerate(lower_lines):
+        if EDUCATION_PATTERN.search(line_lower):
+            # Include this line and potentially the next few lines
+            education_lines.append(lines[i].strip())
+            if i + 1 < len(lines):
+                education_lines.append(lines[i + 1].strip())
+            if len(education_lines) >= 5:
+                break
+    
+    return ' '.join(education_lines[:5]) if education_lines else None  # Limit to first 5 lines
+
+
 def extract_education(text: str) -> Optional[str]:
     """
     Extract education information from resume.
     
     Looks for common degree keywords and university names.
     """
-    education_keywords = [
-        r'bachelor', r'master', r'phd', r'doctorate', r'b\.?s\.?', r'm\.?s\.?',
-        r'b\.?tech', r'm\.?tech', r'mba', r'university', r'college', r'degree'
-    ]
-    
-    lines = text.split('\n')
-    education_lines = []
+    return _education_from_lines(text.split('\n'), text.lower().split('\n'))
+
+
+def extract_fields(text: str) -> Dict:
+    """
+    Extract all structured fields from resume text.
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        if any(re.search(keyword, line_lower) for keyword in education_keywords):
-            # Include this line and potentially the next few lines
-            education_lines.append(line.strip())
-            if i + 1 < len(lines):
-                education_lines.append(lines[i + 1].strip())
+    Experience, education and skills reuse one lowercased copy and line
+    split of the text. Results are identical to calling the individual
+    extractors on the whole text.
+    """
+    resume = ResumeText(text)
     
-    return ' '.join(education_lines[:5]) if education_lines else None  # Limit to first 5 lines
+    return {
+        "name": extract_name(text),
+        "email": extract_email(text),
+        "phone": extract_phone(text),
+        "skills": _skills_from_lower(resume.lower),
+        "experience_years": _experience_from_lower(resume.lower),
+        "education_text": _education_from_lines(resume.lines, resume.lower_lines),
+    }
 
 
-def parse_resume(file_bytes: bytes, filename: str) -> Dict:
+def extract_resume_text(file_bytes: bytes, filename: str) -> str:
     """
-    Parse resume file and extract structured information.
+    Extract the plain text of a PDF or DOCX resume.
     
     Args:
         file_bytes: Binary content of the resume file
         filename: Name of the file (to determine type)
         
     Returns:
-        Dictionary containing extracted information:
-        - name: Candidate's name
-        - email: Email address
-        - phone: Phone number
-        - skills: List of identified skills
-        - experience_years: Years of experience
-        - education_text: Education information
+        Extracted text
         
     Raises:
-        ValueError: If file format is not supported or parsing fails
+        ValueError: If the format is not supported or too little text was found
     """
-    # Determine file type and extract text
     if filename.lower().endswith('.pdf'):
         text = extract_text_from_pdf(file_bytes)
     elif filename.lower().endswith('.docx'):
@@ -196,14 +291,27 @@ def parse_resume(file_bytes: bytes, filename: str) -> Dict:
     if not text or len(text.strip()) < 50:
         raise ValueError("Could not extract meaningful text from resume. Please check the file.")
     
-    # Extract information
-    parsed_data = {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "skills": extract_skills(text),
-        "experience_years": extract_experience_years(text),
-        "education_text": extract_education(text)
-    }
+    return text
+
+
+def parse_resume(file_bytes: bytes, filename: str) -> Dict:
+    """
+    Parse resume file and extract structured information.
     
-    return parsed_data
+    Args:
+        file_bytes: Binary content of the resume file
+        filename: Name of the file (to determine type)
+        
+    Returns:
+        Dictionary containing extracted information:
+        - name: Candidate's name
+        - email: Email address
+        - phone: Phone number
+        - skills: List of identified skills
+        - experience_years: Years of experience
+        - education_text: Education information
+        
+    Raises:
+        ValueError: If file format is not supported or parsing fails
+    """
+    return extract_fields(extract_resume_text(file_bytes, filename))
@@ -0,0 +1,446 @@
+"""
+Scatter-gather candidate scoring across scorer processes.
+
+Candidates are hash-partitioned by id across N scorer processes, each
+owning the packed features of its shard. A coordinator sends a job's
+top-K request to every shard over a socket, waits until a per-shard
+deadline, and merges the partial top-K lists. Shards that miss the
+deadline are reported and the result is flagged as partial.
+
+Scorers are plain processes listening on TCP, so a cluster runs on one
+box as a `LocalCluster` or across machines via `SCATTER_ADDRESSES`.
+Text relevance uses each shard's own document frequencies, which are
+close to global ones because the partitioning is by hash.
+
+Connections are authenticated with `SCATTER_AUTHKEY`. Scorers started
+from the database re-read changed candidates of their shard every
+`SCATTER_SHARD_REFRESH_SECONDS`; with refresh disabled they serve the
+candidates as of startup and must be restarted to see changes.
+"""
+import heapq
+import itertools
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+import zlib
+from multiprocessing.connection import Client, Connection, Listener, wait
+from types import SimpleNamespace
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.ml.batch import JobFeatures, ShardScorer
+from app.ml.matcher import location_coordinates, match_weights, parse_skills
+from app.ml.relevance import job_text, vectorize
+from app.ml.store import STORE_COLUMNS, CandidateStore, id_bytes
+from app.models import Candidate, Job
+
+Address = Tuple[str, int]
+
+
+def shard_of(candidate_id, num_shards: int) -> int:
+    """Stable shard number of a candidate (identical across processes and hosts)."""
+    return zlib.crc32(str(candidate_id).encode("utf-8")) % num_shards
+
+
+def parse_addresses(value: str) -> List[Address]:
+    """Parse "host:port,host:port" into address tuples."""
+    addresses = []
+    for item in value.split(","):
+        if item.strip():
+            host, port = item.strip().rsplit(":", 1)
+            addresses.append((host, int(port)))
+    return addresses
+
+
+def authkey() -> bytes:
+    """Shared secret for coordinator/scorer connections (`SCATTER_AUTHKEY`)."""
+    if not settings.SCATTER_AUTHKEY:
+        raise RuntimeError("SCATTER_AUTHKEY must be set to run scatter-gather scorers")
+    return settings.SCATTER_AUTHKEY.encode("utf-8")
+
+
+def job_request(job: Job) -> JobFeatures:
+    """
+    Reduce a job to a scoring request.
+
+    Unlike `batch.pack_job` the text part is the job's raw term vector;
+    each shard applies its own IDF weights.
+    """
+    query_indices, query_values = vectorize(job_text(job)) if match_weights()["text"] else (np.zeros(0), np.zeros(0))
+    return JobFeatures(
+        skills=tuple(parse_skills(job.skills_required)),
+        experience_min=job.experience_min or 0,
+        experience_max=job.experience_max,
+        remote_type=job.remote_type,
+        location=job.location.lower() if job.location else None,
+        coordinates=location_coordinates(job) if job.location else None,
+        query_indices=query_indices,
+        query_values=query_values,
+    )
+
+
+class ShardIndex:
+    """One shard's packed candidates and its top-K search."""
+
+    def __init__(self, candidates: Sequence[Candidate]):
+        self.store = CandidateStore.from_rows(candidates)
+        self.table_rows: Optional[int] = None  # Size of the candidates table at the last refresh
+        self._publish()
+
+    def _publish(self) -> None:
+        """Swap in ids and scorer for the store's current columns in one assignment."""
+        columns = self.store.arrays
+        self._state = (
+            self.store.candidate_ids(columns),
+            ShardScorer(dict(columns), self.store.skill_index, self.store.locations, match_weights()),
+        )
+
+    @property
+    def candidate_ids(self) -> List[str]:
+        return self._state[0]
+
+    def refresh(self, db: Session, shard: int, num_shards: int) -> int:
+        """
+        Apply candidates of this shard changed since the last load or refresh.
+
+        Deletes are not visible through `updated_at`, so whenever the table
+        size changed the shard's ids are recounted and the missing ones
+        removed.
+
+        Returns:
+            Number of rows applied or removed
+        """
+        store = self.store
+        query = db.query(*(getattr(Candidate, name) for name in STORE_COLUMNS))
+        applied = store.apply(row for row in store.changes(query) if shard_of(row.id, num_shards) == shard)
+
+        table_rows = db.query(func.count(Candidate.id)).scalar()
+        if self.table_rows is not None and table_rows != self.table_rows:
+            shard_ids = np.array([
+                id_bytes(candidate_id) for (candidate_id,) in db.query(Candidate.id).yield_per(20000)
+                if shard_of(candidate_id, num_shards) == shard
+            ], dtype="S16")
+            if len(shard_ids) != len(store):
+                applied += store.retain(shard_ids)
+        self.table_rows = table_rows
+
+        if applied:
+            self._publish()
+        return applied
+
+    def idf_weighted(self, job: JobFeatures) -> JobFeatures:
+        """Apply this shard's IDF to the job's raw term vector."""
+        _, query_values = self.store.query_vector((job.query_indices, job.query_values))
+        return job._replace(query_values=query_values)
+
+    def top_k(self, job: JobFeatures, k: int) -> List[Tuple[float, str]]:
+        """Best k (score, candidate_id) pairs, highest first."""
+        candidate_ids, scorer = self._state
+        if not candidate_ids or k <= 0:
+            return []
+        scores = scorer.score_job(self.idf_weighted(job), 0, len(candidate_ids))
+        if k < len(scores):
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(float(scores[i]), candidate_ids[i]) for i in best]
+
+
+def load_shard(db: Session, shard: int, num_shards: int) -> list:
+    """Stream candidate rows and keep those hashed to this shard."""
+    columns = [getattr(Candidate, name) for name in STORE_COLUMNS]
+    return [
+        row for row in db.query(*columns).yield_per(5000)
+        if shard_of(row.id, num_shards) == shard
+    ]
+
+
+def serve_shard(
+    address: Address,
+    shard: int,
+    num_shards: int,
+    rows: Optional[Sequence] = None,
+    delay: float = 0.0,
+    ready=None,
+    key: Optional[bytes] = None
+) -> None:
+    """
+    Run a scorer process for one shard until told to stop.
+
+    Args:
+        address: (host, port) to listen on
+        shard: Shard number owned by this scorer
+        num_shards: Total number of shards
+        rows: Candidate rows of this shard (loaded from the database and
+            refreshed every SCATTER_SHARD_REFRESH_SECONDS if omitted)
+        delay: Artificial per-request delay in seconds, to simulate a slow shard
+        ready: Optional event set once the shard is indexed and listening
+        key: Connection secret (default: `authkey()`)
+    """
+    key = key or authkey()
+    stopping = threading.Event()
+    if rows is None:
+        from app.database import SessionLocal
+        db = SessionLocal()
+        try:
+            index = ShardIndex(load_shard(db, shard, num_shards))
+            index.table_rows = db.query(func.count(Candidate.id)).scalar()
+        finally:
+            db.close()
+        if settings.SCATTER_SHARD_REFRESH_SECONDS > 0:
+            threading.Thread(
+                target=_refresh_shard, args=(index, shard, num_shards, stopping), daemon=True
+            ).start()
+    else:
+        index = ShardIndex(rows)
+
+    with Listener(address, authkey=key) as listener:
+        if ready is not None:
+            ready.set()
+        # One thread per coordinator connection (each API worker has its own coordinator)
+        while True:
+            conn = listener.accept()
+            if stopping.is_set():
+                conn.close()
+                return
+            threading.Thread(
+                target=_serve_connection, args=(conn, address, stopping, shard, index, delay, key), daemon=True
+            ).start()
+
+
+def _refresh_shard(index: ShardIndex, shard: int, num_shards: int, stopping: threading.Event) -> None:
+    """Keep a database-backed shard current until the scorer stops."""
+    from app.database import SessionLocal
+
+    while not stopping.wait(settings.SCATTER_SHARD_REFRESH_SECONDS):
+        db = SessionLocal()
+        try:
+            index.refresh(db, shard, num_shards)
+        except Exception as e:
+            print(f"Shard {shard}: refresh failed: {e}", file=sys.stderr)
+        finally:
+            db.close()
+
+
+def _serve_connection(
+    conn: Connection,
+    address: Address,
+    stopping: threading.Event,
+    shard: int,
+    index: ShardIndex,
+    delay: float,
+    key: bytes
+) -> None:
+    """Answer requests on one coordinator connection until it closes."""
+    with conn:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                return
+            kind, request_id = message[0], message[1]
+            if kind == "stop":
+                # Wake the accept loop so it sees the flag
+                stopping.set()
+                Client(address, authkey=key).close()
+                return
+            if kind == "top_k":
+                job, k = message[2], message[3]
+                started = time.perf_counter()
+                if delay:
+                    time.sleep(delay)
+                hits = index.top_k(job, k)
+                conn.send(("top_k", request_id, shard, hits, time.perf_counter() - started))
+
+
+class TopKResult(NamedTuple):
+    """Merged top-K across shards."""
+    candidates: List[Tuple[str, float]]  # (candidate_id, match_score), best first
+    partial: bool  # True if any shard missed the deadline or failed
+    missing_shards: List[int]
+    shard_ms: Dict[int, float]  # Scoring time reported by each shard that answered
+
+
+class ScatterGatherCoordinator:
+    """
+    Fans top-K requests out to scorer shards and merges their answers.
+
+    One connection is kept per shard. Requests are serialized, and replies
+    that arrive after their deadline are discarded by request id.
+    """
+
+    def __init__(self, addresses: Sequence[Address], deadline_ms: Optional[float] = None,
+                 key: Optional[bytes] = None):
+        self.addresses = list(addresses)
+        self.key = key or authkey()
+        self.deadline_ms = deadline_ms if deadline_ms is not None else settings.SCATTER_SHARD_DEADLINE_MS
+        self._connections: Dict[int, Optional[Connection]] = {shard: None for shard in range(len(self.addresses))}
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _connection(self, shard: int) -> Optional[Connection]:
+        conn = self._connections[shard]
+        if conn is None:
+            try:
+                conn = Client(self.addresses[shard], authkey=self.key)
+            except OSError:
+                return None
+            self._connections[shard] = conn
+        return conn
+
+    def _drop(self, shard: int) -> None:
+        conn = self._connections[shard]
+        if conn is not None:
+            conn.close()
+        self._connections[shard] = None
+
+    def top_k(self, job: Job, k: int) -> TopKResult:
+        """Best k candidates for a job across all shards answering within the deadline."""
+        request = job_request(job)
+        with self._lock:
+            request_id = next(self._request_ids)
+            pending: Dict[Connection, int] = {}
+            for shard in self._connections:
+                conn = self._connection(shard)
+                if conn is None:
+                    continue
+                try:
+                    conn.send(("top_k", request_id, request, k))
+                    pending[conn] = shard
+                except OSError:
+                    self._drop(shard)
+
+            answers: Dict[int, List[Tuple[float, str]]] = {}
+            shard_ms: Dict[int, float] = {}
+            deadline = time.monotonic() + self.deadline_ms / 1000
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for conn in wait(list(pending), timeout=remaining):
+                    shard = pending[conn]
+                    try:
+                        reply = conn.recv()
+                    except (EOFError, OSError):
+                        del pending[conn]
+                        self._drop(shard)
+                        continue
+                    # Late reply to an earlier request: skip it and keep waiting
+                    if reply[1] != request_id:
+                        continue
+                    del pending[conn]
+                    answers[shard] = reply[3]
+                    shard_ms[shard] = round(reply[4] * 1000, 2)
+
+        merged = heapq.merge(*answers.values(), key=lambda hit: -hit[0])
+        missing = sorted(set(self._connections) - set(answers))
+        return TopKResult(
+            candidates=[(candidate_id, score) for score, candidate_id in itertools.islice(merged, k)],
+            partial=bool(missing),
+            missing_shards=missing,
+            shard_ms=shard_ms,
+        )
+
+    def stop_shards(self) -> None:
+        """Ask every reachable shard to exit."""
+        with self._lock:
+            for shard in self._connections:
+                conn = self._connection(shard)
+                if conn is not None:
+                    try:
+                        conn.send(("stop", 0))
+                    except OSError:
+                        pass
+                    self._drop(shard)
+
+    def close(self) -> None:
+        with self._lock:
+            for shard in self._connections:
+                self._drop(shard)
+
+
+class LocalCluster:
+    """
+    Stand-in cluster: N scorer processes on localhost plus a coordinator.
+
+    Usage:
+        with LocalCluster(candidates, num_shards=4) as cluster:
+            result = cluster.coordinator.top_k(job, 20)
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[Candidate],
+        num_shards: int,
+        base_port: int = 0,
+        deadline_ms: Optional[float] = None,
+        delays: Optional[Dict[int, float]] = None
+    ):
+        rows: List[List[SimpleNamespace]] = [[] for _ in range(num_shards)]
+        for candidate in candidates:
+            row = SimpleNamespace(**{name: getattr(candidate, name) for name in STORE_COLUMNS})
+            rows[shard_of(candidate.id, num_shards)].append(row)
+
+        context = multiprocessing.get_context()
+        key = os.urandom(32)  # Local processes only, so no configured secret is needed
+        self.addresses = [("127.0.0.1", base_port + shard if base_port else _free_port()) for shard in range(num_shards)]
+        self.processes = []
+        ready_events = []
+        for shard, address in enumerate(self.addresses):
+            ready = context.Event()
+            process = context.Process(
+                target=serve_shard,
+                args=(address, shard, num_shards, rows[shard], (delays or {}).get(shard, 0.0), ready, key),
+                daemon=True,
+            )
+            process.start()
+            self.processes.append(process)
+            ready_events.append(ready)
+        for ready in ready_events:
+            ready.wait()
+        self.coordinator = ScatterGatherCoordinator(self.addresses, deadline_ms, key)
+
+    def close(self) -> None:
+        self.coordinator.stop_shards()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+_coordinator: Optional[ScatterGatherCoordinator] = None
+
+
+def get_coordinator() -> Optional[ScatterGatherCoordinator]:
+    """Process-wide coordinator for `SCATTER_ADDRESSES`, or None if not configured."""
+    global _coordinator
+    if _coordinator is None and settings.SCATTER_ADDRESSES:
+        _coordinator = ScatterGatherCoordinator(parse_addresses(settings.SCATTER_ADDRESSES))
+    return _coordinator
+
+
+if __name__ == "__main__":
+    # Run the scorer for one shard, loading its candidates from the database:
+    #     python -m app.ml.scatter <shard> <num_shards> <host:port>
+    shard_number, shard_count = int(sys.argv[1]), int(sys.argv[2])
+    serve_shard(parse_addresses(sys.argv[3])[0], shard_number, shard_count)
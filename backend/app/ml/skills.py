@@ -0,0 +1,176 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+# Common alternative spellings mapped to canonical skill names. Entries are
+# also matched in resume text, so avoid aliases that are ordinary words.
+SKILL_ALIASES = {
+    "postgres": "postgresql", "postgre": "postgresql", "psql": "postgresql",
+    "react.js": "react", "reactjs": "react", "react js": "react",
+    "vue.js": "vue", "vuejs": "vue", "angularjs": "angular", "angular.js": "angular",
+    "nodejs": "node.js", "node js": "node.js",
+    "express.js": "express", "expressjs": "express",
+    "golang": "go", "k8s": "kubernetes",
+    "amazon web services": "aws", "google cloud": "gcp", "google cloud platform": "gcp",
+    "microsoft azure": "azure",
+    "sklearn": "scikit-learn", "scikit learn": "scikit-learn",
+    "tensorflow2": "tensorflow", "py torch": "pytorch",
+    "mongo": "mongodb", "elastic search": "elasticsearch",
+    "ms sql": "sql", "t-sql": "sql", "tsql": "sql",
+    "cicd": "ci/cd", "ci cd": "ci/cd", "continuous integration": "ci/cd",
+    "javascript es6": "javascript", "ecmascript": "javascript",
+    "type script": "typescript", "c sharp": "c#", "cpp": "c++",
+    "ruby on rails": "rails", "spring boot": "spring", "tailwindcss": "tailwind",
+    "restful api": "rest api", "restful apis": "rest api", "rest apis": "rest api",
+    "ml": "machine learning", "natural language processing": "nlp",
+    "css3": "css", "html5": "html", "python3": "python", "python 3": "python",
+    "es6": "javascript", "es2015": "javascript", "angular2": "angular", "vue3": "vue",
+    "java8": "java", "java 8": "java", "java 11": "java", "java 17": "java",
+    "c++11": "c++", "c++14": "c++", "c++17": "c++", "c++20": "c++", "php7": "php", "php8": "php",
+}
+
+# Ordinary words one edit away from a skill with the same first letter
+# ("scale" ~ scala, "spell" ~ shell); they are never fuzzy-matched
+FUZZY_STOPWORDS = {
+    "docket", "flash", "reach", "scalar", "scale", "scram", "scrub", "shall", "shelf", "shift",
+    "smell", "spell", "sprint", "string", "strum", "swell", "tasting", "tenting", "texting",
+}
+
+# A version number after a known skill: "css3", "python 3.11", "java17"
+VERSION_SUFFIX = re.compile(r"^(.{3,}?)\s*\d+(?:\.\d+)*$")
+
+
+def normalize_skill(token: str) -> str:
+    """Lowercase a raw skill token and collapse whitespace."""
+    return " ".join(token.lower().split())
+
+
+def damerau_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between a and b.
+    
+    Returns max_distance + 1 as soon as the distance is known to exceed it.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class SkillCanonicalizer:
+    """
+    Resolve raw skill tokens to canonical skill names.
+    
+    Exact names and aliases are dictionary lookups, also after stripping
+    a version suffix ("css3"). Misspellings are resolved with a
+    SymSpell-style index: every vocabulary term is stored under all strings
+    obtained by deleting up to `max_distance` characters, so a lookup only
+    generates the deletes of the query and verifies the few terms that
+    share one, independent of vocabulary size.
+
+    Fuzzy matching is conservative, since a wrong hit turns an ordinary
+    word into a skill ("rest" into rust): tokens under five characters and
+    FUZZY_STOPWORDS are never fuzzed, a match must keep the first letter
+    ("nails" is not rails), and the closest term must be unique.
+    """
+    
+    def __init__(self, vocabulary: Iterable[str], aliases: Dict[str, str], max_distance: int = 2):
+        self.max_distance = max_distance
+        self.vocabulary: List[str] = list(dict.fromkeys(normalize_skill(term) for term in vocabulary))
+        self.exact: Dict[str, str] = {term: term for term in self.vocabulary}
+        for alias, canonical in aliases.items():
+            self.exact.setdefault(normalize_skill(alias), normalize_skill(canonical))
+        self.aliases_of: Dict[str, Set[str]] = {}
+        for alias, canonical in self.exact.items():
+            self.aliases_of.setdefault(canonical, set()).add(alias)
+        
+        self._deletes: Dict[str, Set[str]] = {}
+        for term in self.vocabulary:
+            for variant in self._delete_variants(term, self.allowed_distance(term)):
+                self._deletes.setdefault(variant, set()).add(term)
+    
+    def allowed_distance(self, token: str) -> int:
+        """Edit budget by length: none for short tokens like "go", "rest" or "hash"."""
+        if len(token) < 5:
+            return 0
+        if len(token) < 8:
+            return min(1, self.max_distance)
+        return self.max_distance
+    
+    @staticmethod
+    def _delete_variants(term: str, distance: int) -> Set[str]:
+        variants = {term}
+        frontier = {term}
+        for _ in range(distance):
+            frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+            variants |= frontier
+        return variants
+    
+    def lookup(self, token: str) -> Optional[str]:
+        """Return the canonical skill for a token, or None if nothing is close enough."""
+        token = normalize_skill(token)
+        if token in self.exact:
+            return self.exact[token]
+        versioned = VERSION_SUFFIX.match(token)
+        if versioned and versioned.group(1) in self.exact:
+            return self.exact[versioned.group(1)]
+        
+        distance = self.allowed_distance(token)
+        if not distance or token in FUZZY_STOPWORDS:
+            return None
+        
+        candidates: Set[str] = set()
+        for variant in self._delete_variants(token, distance):
+            candidates |= self._deletes.get(variant, set())
+        
+        best, best_distance, tied = None, None, False
+        for term in candidates:
+            if term[0] != token[0]:
+                continue
+            term_distance = damerau_levenshtein(token, term, min(distance, self.allowed_distance(term)))
+            if term_distance <= min(distance, self.allowed_distance(term)):
+                if best_distance is None or term_distance < best_distance:
+                    best, best_distance, tied = term, term_distance, False
+                elif term_distance == best_distance:
+                    tied = True
+        # Two equally close skills: the token is as likely to be neither
+        return None if tied else best
+    
+    def canonicalize(self, token: str) -> str:
+        """Return the canonical skill, or the normalized token if it is unknown."""
+        return self.lookup(token) or normalize_skill(token)
+    
+    def variants(self, token: str) -> Set[str]:
+        """The canonical form of a token plus all of its known aliases."""
+        canonical = self.canonicalize(token)
+        return {normalize_skill(token), canonical} | self.aliases_of.get(canonical, set())
+
+
+@lru_cache(maxsize=1)
+def get_skill_canonicalizer() -> SkillCanonicalizer:
+    """Build the canonicalizer over TECH_SKILLS once per process."""
+    # Imported here because the resume parser imports SKILL_ALIASES from this module
+    from app.ml.resume_parser import TECH_SKILLS
+    return SkillCanonicalizer(TECH_SKILLS, SKILL_ALIASES)
+
+
+@lru_cache(maxsize=65536)
+def canonical_skill(token: str) -> str:
+    """Memoized canonical skill name for a raw token."""
+    return get_skill_canonicalizer().canonicalize(token)
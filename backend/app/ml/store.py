@@ -0,0 +1,621 @@
+"""
+Compact columnar snapshot of candidate match features.
+
+Matching only needs a few fields per candidate, so instead of ORM
+objects the store keeps flat NumPy columns: 16-byte ids, experience,
+interned location codes and coordinates, skills as interned ids in a
+CSR layout (`skill_indptr` / `skill_ids`) and, when text relevance is
+weighted, the TF-IDF term vectors as a second CSR matrix.
+
+The store is built from one narrow SELECT and kept current by
+re-reading only rows changed since the newest `updated_at` already
+applied. `updated_at` is set when the writing transaction starts, so a
+slow transaction can commit rows behind that watermark: the delta starts
+CANDIDATE_WATERMARK_LAG_SECONDS earlier and skips rows already applied
+with the same timestamp. Deletes are found by recounting ids.
+
+Changed rows never rewrite the base columns: they go to a small overlay
+with the same layout, and the base rows they replace are masked out.
+Readers get the merged columns through `arrays`. A store loaded from the
+table folds the overlay into its base once it grows past a few percent.
+
+Snapshots persist the columns as `.npy` files plus a `meta.json` with
+the vocabularies and watermark. Workers map them read-only, so every
+worker on a host shares one physical copy; the delta since the snapshot
+only occupies the private overlay, until a newer snapshot is mapped.
+Publishing takes an advisory lock on the snapshot directory, so only one
+process writes the first snapshot and the others map it.
+"""
+import fcntl
+import json
+import os
+import sys
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.ml.matcher import location_coordinates, match_weights, parse_skills
+from app.ml.relevance import DIMENSION, SparseVector, candidate_text, relevance_index, vectorize
+from app.models import Candidate
+
+# Columns read by the narrow SELECT (headline only feeds text relevance)
+STORE_COLUMNS = (
+    "id", "experience_years", "location", "location_lat", "location_lon",
+    "skills_text", "updated_at", "headline",
+)
+
+# Bump when the snapshot layout changes; older snapshots are then ignored
+SNAPSHOT_FORMAT = 2
+SNAPSHOTS_KEPT = 3
+
+# A privately held base absorbs the overlay beyond this many rows (or 5% of the base)
+OVERLAY_COMPACT_ROWS = 1000
+
+# Columns of a CSR matrix: row pointers plus one or more aligned value arrays
+CSR_MATRICES = {
+    "skill_indptr": ("skill_ids",),
+    "text_indptr": ("text_indices", "text_data"),
+}
+
+
+def id_bytes(value) -> bytes:
+    """16-byte form of a candidate id given as UUID or string."""
+    return value.bytes if isinstance(value, uuid.UUID) else uuid.UUID(str(value)).bytes
+
+
+def watermark_lag() -> timedelta:
+    """How far behind the watermark a delta starts re-reading."""
+    return timedelta(seconds=settings.CANDIDATE_WATERMARK_LAG_SECONDS)
+
+
+@contextmanager
+def snapshot_lock(directory):
+    """Hold the snapshot directory's advisory lock (across processes) while publishing."""
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / ".lock", "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def take_csr_rows(indptr: np.ndarray, values: Tuple[np.ndarray, ...], keep: np.ndarray):
+    """
+    Select rows of a CSR matrix by boolean mask.
+
+    Returns:
+        Tuple of (new indptr, tuple of new value arrays)
+    """
+    lengths = np.diff(indptr)
+    element_keep = np.repeat(keep, lengths)
+    new_indptr = np.concatenate(([0], np.cumsum(lengths[keep]))).astype(indptr.dtype)
+    return new_indptr, tuple(array[element_keep] for array in values)
+
+
+class CandidateStore:
+    """
+    Candidate match features as NumPy columns, refreshed incrementally.
+
+    Usage:
+        store = CandidateStore.load(db)
+        ...
+        store.refresh(db)  # applies rows changed since the last load
+        columns = store.arrays  # merged base and overlay
+    """
+
+    def __init__(self, with_text: Optional[bool] = None):
+        self.with_text = bool(match_weights()["text"]) if with_text is None else with_text
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.skills: List[str] = []
+        self.skill_index: Dict[str, int] = {}
+        self.locations: List[str] = []
+        self.location_index: Dict[str, int] = {}
+        self.watermark = None  # Newest updated_at applied so far
+        # Ids applied with updated_at within the lag before the watermark, and that updated_at
+        self.watermark_ids: Dict[bytes, datetime] = {}
+        self.snapshot_version: Optional[str] = None  # Snapshot the columns were mapped from
+        self.document_frequency = np.zeros(DIMENSION, dtype=np.int32) if self.with_text else None
+        # (base columns, mask of base rows replaced by the overlay or None, overlay columns);
+        # replaced as a whole on every change, so readers can hold one consistent version
+        self._state: Tuple[Dict[str, np.ndarray], Optional[np.ndarray], Dict[str, np.ndarray]] = (
+            self._empty_arrays(), None, self._empty_arrays()
+        )
+        self._live_rows: Tuple[object, Optional[np.ndarray]] = (None, None)
+
+    def _empty_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {
+            "ids": np.zeros(0, dtype="S16"),
+            "experience": np.zeros(0, dtype=np.int16),
+            "location_code": np.zeros(0, dtype=np.int32),
+            "latitude": np.zeros(0, dtype=np.float32),
+            "longitude": np.zeros(0, dtype=np.float32),
+            "skill_indptr": np.zeros(1, dtype=np.int64),
+            "skill_ids": np.zeros(0, dtype=np.int32),
+        }
+        if self.with_text:
+            arrays["text_indptr"] = np.zeros(1, dtype=np.int64)
+            arrays["text_indices"] = np.zeros(0, dtype=np.int32)
+            arrays["text_data"] = np.zeros(0, dtype=np.float32)
+        return arrays
+
+    def __len__(self) -> int:
+        base, superseded, overlay = self._state
+        replaced = int(np.count_nonzero(superseded)) if superseded is not None else 0
+        return len(base["ids"]) - replaced + len(overlay["ids"])
+
+    @property
+    def base(self) -> Dict[str, np.ndarray]:
+        """Base columns (memory-mapped when opened from a snapshot)."""
+        return self._state[0]
+
+    @property
+    def overlay_rows(self) -> int:
+        return len(self._state[2]["ids"])
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Current columns: base rows that were not replaced, then overlay rows.
+
+        The base is returned as is while there is no overlay; otherwise the
+        merged columns are built on each call, so take them once per use.
+        """
+        base, superseded, overlay = self._state
+        if superseded is None and not len(overlay["ids"]):
+            return base
+        merged = dict(base)
+        if superseded is not None:
+            self._drop_rows(merged, ~superseded)
+        self._append(merged, overlay)
+        return merged
+
+    @classmethod
+    def from_rows(cls, rows: Iterable, with_text: Optional[bool] = None) -> "CandidateStore":
+        """Build a store from candidate rows or objects with the STORE_COLUMNS attributes."""
+        store = cls(with_text)
+        store.apply(rows)
+        store.compact()
+        return store
+
+    @classmethod
+    def load(cls, db: Session, with_text: Optional[bool] = None) -> "CandidateStore":
+        """Build a store from the candidates table with one narrow SELECT."""
+        store = cls(with_text)
+        store.apply(store._select(db).yield_per(5000))
+        store.compact()
+        return store
+
+    def _select(self, db: Session):
+        columns = STORE_COLUMNS if self.with_text else STORE_COLUMNS[:-1]
+        return db.query(*(getattr(Candidate, name) for name in columns))
+
+    def changes(self, query) -> Iterator:
+        """
+        Rows of a candidates query changed since the watermark and not yet applied.
+
+        The query starts a lag before the watermark, to catch rows of
+        transactions that committed after it; rows already applied with
+        the same `updated_at` are skipped by id.
+        """
+        watermark, seen = self.watermark, dict(self.watermark_ids)
+        if watermark is not None:
+            query = query.filter(Candidate.updated_at >= watermark - watermark_lag())
+        for row in query.yield_per(5000):
+            if seen.get(id_bytes(row.id)) != row.updated_at:
+                yield row
+
+    def refresh(self, db: Session) -> int:
+        """
+        Apply candidates changed since the last load or refresh.
+
+        Deletes are not visible through `updated_at`, so when the store's
+        size no longer matches the table the ids are recounted (one narrow
+        column) and the missing ones removed. Either way the change is
+        published in one swap and a mapped snapshot stays mapped.
+
+        Returns:
+            Number of rows applied or removed
+        """
+        applied = self.apply(self.changes(self._select(db)))
+        if db.query(func.count(Candidate.id)).scalar() != len(self):
+            table_ids = np.array([id_bytes(value) for (value,) in db.query(Candidate.id).yield_per(20000)], dtype="S16")
+            applied += self.retain(table_ids)
+        return applied
+
+    def apply(self, rows: Iterable) -> int:
+        """
+        Insert or replace candidates.
+
+        Rows go to the overlay; base rows with the same ids are masked
+        out, so the base columns (possibly a shared mapping) stay untouched.
+
+        Returns:
+            Number of rows applied
+        """
+        latest: Dict[bytes, object] = {}
+        for row in rows:
+            latest[id_bytes(row.id)] = row
+        if not latest:
+            return 0
+
+        with self._lock:
+            chunk = self._pack(list(latest.values()))
+            base, superseded, overlay = self._state
+            if len(base["ids"]):
+                replaced = np.isin(base["ids"], chunk["ids"])
+                if superseded is not None:
+                    replaced &= ~superseded
+                if replaced.any():
+                    self._forget_text(base, replaced)
+                    superseded = replaced if superseded is None else superseded | replaced
+            overlay = dict(overlay)
+            if len(overlay["ids"]):
+                replaced = np.isin(overlay["ids"], chunk["ids"])
+                if replaced.any():
+                    self._forget_text(overlay, replaced)
+                    self._drop_rows(overlay, ~replaced)
+            if self.with_text:
+                np.add.at(self.document_frequency, chunk["text_indices"], 1)
+            self._append(overlay, chunk)
+            self._state = (base, superseded, overlay)
+
+            if self.snapshot_version is None and len(overlay["ids"]) > max(OVERLAY_COMPACT_ROWS, len(base["ids"]) // 20):
+                self._state = (self.arrays, None, self._empty_arrays())
+        return len(latest)
+
+    def retain(self, ids: np.ndarray) -> int:
+        """
+        Remove the candidates whose ids are not in `ids`.
+
+        Base rows are masked out like replaced ones, so the base columns
+        (possibly a shared mapping) stay untouched.
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock:
+            base, superseded, overlay = self._state
+            removed = 0
+            if len(base["ids"]):
+                missing = ~np.isin(base["ids"], ids)
+                if superseded is not None:
+                    missing &= ~superseded
+                if missing.any():
+                    self._forget_text(base, missing)
+                    superseded = missing if superseded is None else superseded | missing
+                    removed += int(np.count_nonzero(missing))
+            if len(overlay["ids"]):
+                missing = ~np.isin(overlay["ids"], ids)
+                if missing.any():
+                    overlay = dict(overlay)
+                    self._forget_text(overlay, missing)
+                    self._drop_rows(overlay, ~missing)
+                    removed += int(np.count_nonzero(missing))
+            self._state = (base, superseded, overlay)
+        return removed
+
+    def compact(self) -> None:
+        """Fold the overlay into new private base columns."""
+        with self._lock:
+            self._state = (self.arrays, None, self._empty_arrays())
+
+    def _pack(self, rows: List) -> Dict[str, np.ndarray]:
+        """Pack rows into column arrays, interning new skills and locations."""
+        count = len(rows)
+        ids = np.array([id_bytes(row.id) for row in rows], dtype="S16")
+        experience = np.zeros(count, dtype=np.int16)
+        location_code = np.full(count, -1, dtype=np.int32)
+        latitude = np.full(count, np.nan, dtype=np.float32)
+        longitude = np.full(count, np.nan, dtype=np.float32)
+        skill_lengths = np.zeros(count, dtype=np.int64)
+        skill_ids: List[int] = []
+        text_vectors: List[SparseVector] = []
+
+        for position, row in enumerate(rows):
+            experience[position] = min(row.experience_years or 0, np.iinfo(np.int16).max)
+            if row.location:
+                place = row.location.lower()
+                code = self.location_index.get(place)
+                if code is None:
+                    code = self.location_index[place] = len(self.locations)
+                    self.locations.append(place)
+                location_code[position] = code
+                coordinates = location_coordinates(row)
+                if coordinates:
+                    latitude[position], longitude[position] = coordinates
+
+            skills = parse_skills(row.skills_text)
+            for skill in skills:
+                skill_id = self.skill_index.get(skill)
+                if skill_id is None:
+                    skill_id = self.skill_index[skill] = len(self.skills)
+                    self.skills.append(skill)
+                skill_ids.append(skill_id)
+            skill_lengths[position] = len(skills)
+
+            if self.with_text:
+                text_vectors.append(vectorize(candidate_text(row)))
+
+        chunk = {
+            "ids": ids,
+            "experience": experience,
+            "location_code": location_code,
+            "latitude": latitude,
+            "longitude": longitude,
+            "skill_indptr": np.concatenate(([0], np.cumsum(skill_lengths))),
+            "skill_ids": np.array(skill_ids, dtype=np.int32),
+        }
+        if self.with_text:
+            lengths = np.fromiter((len(vector[0]) for vector in text_vectors), dtype=np.int64, count=count)
+            chunk["text_indptr"] = np.concatenate(([0], np.cumsum(lengths)))
+            chunk["text_indices"] = np.concatenate([vector[0] for vector in text_vectors]).astype(np.int32)
+            chunk["text_data"] = np.concatenate([vector[1] for vector in text_vectors]).astype(np.float32)
+
+        stamped = [row for row in rows if row.updated_at is not None]
+        if stamped:
+            newest = max(row.updated_at for row in stamped)
+            if self.watermark is None or newest > self.watermark:
+                self.watermark = newest
+            cutoff = self.watermark - watermark_lag()
+            recent = {key: value for key, value in self.watermark_ids.items() if value >= cutoff}
+            recent.update((id_bytes(row.id), row.updated_at) for row in stamped if row.updated_at >= cutoff)
+            self.watermark_ids = recent
+        return chunk
+
+    def _forget_text(self, arrays: Dict[str, np.ndarray], rows: np.ndarray) -> None:
+        """Remove the term counts of the masked rows from the document frequencies."""
+        if self.with_text:
+            dropped = np.repeat(rows, np.diff(arrays["text_indptr"]))
+            np.subtract.at(self.document_frequency, arrays["text_indices"][dropped], 1)
+
+    @staticmethod
+    def _drop_rows(arrays: Dict[str, np.ndarray], keep: np.ndarray) -> None:
+        """Remove the rows not in `keep` from every column."""
+        for indptr_name, value_names in CSR_MATRICES.items():
+            if indptr_name in arrays:
+                indptr, values = take_csr_rows(arrays[indptr_name], tuple(arrays[name] for name in value_names), keep)
+                arrays[indptr_name] = indptr
+                arrays.update(zip(value_names, values))
+        for name in ("ids", "experience", "location_code", "latitude", "longitude"):
+            arrays[name] = arrays[name][keep]
+
+    @staticmethod
+    def _append(arrays: Dict[str, np.ndarray], chunk: Dict[str, np.ndarray]) -> None:
+        """Append packed rows to every column."""
+        for indptr_name, value_names in CSR_MATRICES.items():
+            if indptr_name in arrays:
+                arrays[indptr_name] = np.concatenate((arrays[indptr_name], chunk[indptr_name][1:] + arrays[indptr_name][-1]))
+                for name in value_names:
+                    arrays[name] = np.concatenate((arrays[name], chunk[name]))
+        for name in ("ids", "experience", "location_code", "latitude", "longitude"):
+            arrays[name] = np.concatenate((arrays[name], chunk[name]))
+
+    def candidate_ids(self, arrays: Optional[Dict[str, np.ndarray]] = None) -> List[str]:
+        """
+        Candidate ids as strings, in row order.
+
+        Args:
+            arrays: Columns taken earlier from `arrays`, to get ids of that
+                same version (default: the current one)
+        """
+        # Raw buffer rather than tolist(), which strips trailing NUL bytes of "S16" values
+        raw = (self.arrays if arrays is None else arrays)["ids"].tobytes()
+        return [str(uuid.UUID(bytes=raw[offset:offset + 16])) for offset in range(0, len(raw), 16)]
+
+    def skills_of(self, row: int) -> List[str]:
+        """Canonical skills of the candidate at a row of `arrays`."""
+        state = self._state
+        base, superseded, overlay = state
+        if superseded is None:
+            live = len(base["ids"])
+        else:
+            if self._live_rows[0] is not state:
+                self._live_rows = (state, np.flatnonzero(~superseded))
+            live = len(self._live_rows[1])
+        if row < live:
+            columns, position = base, row if superseded is None else int(self._live_rows[1][row])
+        else:
+            columns, position = overlay, row - live
+        indptr = columns["skill_indptr"]
+        return [self.skills[skill_id] for skill_id in columns["skill_ids"][indptr[position]:indptr[position + 1]].tolist()]
+
+    def query_vector(self, vector: SparseVector) -> SparseVector:
+        """IDF-weight and L2-normalize a job's term vector with this store's document frequencies."""
+        indices, weights = vector
+        if not len(indices) or self.document_frequency is None:
+            return vector
+        total = max(len(self), 1)
+        idf = np.log((total + 1) / (self.document_frequency[indices] + 1)) + 1.0
+        weighted = weights * idf
+        return indices, (weighted / np.linalg.norm(weighted)).astype(np.float32)
+
+    def memory_report(self) -> dict:
+        """Bytes held per column and in total, also scaled to 100k candidates."""
+        columns = {name: int(array.nbytes) for name, array in self.arrays.items()}
+        vocabularies = sum(sys.getsizeof(term) for term in self.skills + self.locations)
+        if self.document_frequency is not None:
+            columns["document_frequency"] = int(self.document_frequency.nbytes)
+        total = sum(columns.values()) + vocabularies
+        return {
+            "candidates": len(self),
+            "columns": columns,
+            "vocabulary_bytes": vocabularies,
+            "total_bytes": total,
+            "bytes_per_100k": round(total * 100_000 / len(self)) if len(self) else 0,
+        }
+
+    def save(self, directory) -> str:
+        """
+        Write a snapshot of the current columns and make it the current one.
+
+        Each snapshot goes to its own version directory, renamed into place
+        once complete, and the `CURRENT` file is then switched atomically.
+        Older versions beyond SNAPSHOTS_KEPT are removed, except the one
+        that was current until now (a worker may be opening it); workers
+        still mapping removed versions keep their pages until they reopen.
+
+        Returns:
+            The new snapshot version
+        """
+        with snapshot_lock(directory):
+            return self._write(Path(directory))
+
+    def _write(self, root: Path) -> str:
+        """Publish a snapshot; the caller holds `snapshot_lock`."""
+        previous = self.current_version(root)
+        # Columns first: the vocabularies only grow, so later copies still cover them
+        arrays = self.arrays
+        meta = {
+            "format": SNAPSHOT_FORMAT,
+            "rows": len(arrays["ids"]),
+            "with_text": self.with_text,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "watermark_ids": {
+                str(uuid.UUID(bytes=key)): value.isoformat() for key, value in self.watermark_ids.items()
+            },
+            "skills": list(self.skills),
+            "locations": list(self.locations),
+        }
+
+        version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{os.getpid()}"
+        staging = root / f".staging-{version}"
+        staging.mkdir()
+        for name, array in arrays.items():
+            np.save(staging / f"{name}.npy", np.ascontiguousarray(array))
+        if self.document_frequency is not None:
+            np.save(staging / "document_frequency.npy", self.document_frequency)
+        (staging / "meta.json").write_text(json.dumps(meta))
+        os.replace(staging, root / version)
+
+        pointer = root / f".CURRENT-{version}"
+        pointer.write_text(version)
+        os.replace(pointer, root / "CURRENT")
+
+        versions = sorted(path for path in root.iterdir() if path.is_dir() and not path.name.startswith("."))
+        for old in versions[:-SNAPSHOTS_KEPT]:
+            if old.name == previous:
+                continue
+            for file in old.iterdir():
+                file.unlink()
+            old.rmdir()
+        return version
+
+    @staticmethod
+    def current_version(directory) -> Optional[str]:
+        """Version named by the snapshot directory's CURRENT file, if any."""
+        pointer = Path(directory) / "CURRENT"
+        return pointer.read_text().strip() if pointer.exists() else None
+
+    @classmethod
+    def open(cls, directory, with_text: Optional[bool] = None) -> Optional["CandidateStore"]:
+        """
+        Map the current snapshot read-only.
+
+        Returns:
+            The store, or None if there is no usable snapshot (missing,
+            older format, or lacking text vectors that are needed)
+        """
+        version = cls.current_version(directory)
+        if version is None:
+            return None
+        path = Path(directory) / version
+        meta = json.loads((path / "meta.json").read_text())
+        store = cls(with_text)
+        if meta["format"] != SNAPSHOT_FORMAT or (store.with_text and not meta["with_text"]):
+            return None
+
+        store.with_text = meta["with_text"]
+        store._state = (
+            {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in store._empty_arrays()},
+            None,
+            store._empty_arrays(),
+        )
+        if store.with_text:
+            # Small and updated in place by deltas, so kept in private memory
+            store.document_frequency = np.load(path / "document_frequency.npy")
+        store.skills = meta["skills"]
+        store.skill_index = {skill: position for position, skill in enumerate(store.skills)}
+        store.locations = meta["locations"]
+        store.location_index = {place: position for position, place in enumerate(store.locations)}
+        store.watermark = datetime.fromisoformat(meta["watermark"]) if meta["watermark"] else None
+        store.watermark_ids = {
+            id_bytes(key): datetime.fromisoformat(value) for key, value in meta["watermark_ids"].items()
+        }
+        store.snapshot_version = version
+        return store
+
+
+_candidate_store: Optional[CandidateStore] = None
+_candidate_store_lock = threading.Lock()
+
+
+def loaded_candidate_store() -> Optional[CandidateStore]:
+    """The process-wide candidate store if it has been loaded, without loading it."""
+    return _candidate_store
+
+
+def get_candidate_store(db: Session) -> CandidateStore:
+    """
+    Return the process-wide candidate store, current with the database.
+
+    With CANDIDATE_SNAPSHOT_DIR set, the store is mapped from the current
+    snapshot (remapped only when a newer one is published) and only the
+    delta since the snapshot is read. If there is no snapshot yet, one
+    process loads the table and publishes it under `snapshot_lock` while
+    the others wait and map it. Otherwise the store is loaded from the
+    table. The store's document frequencies also weight `relevance_index`.
+    """
+    global _candidate_store
+    directory = settings.CANDIDATE_SNAPSHOT_DIR
+    with _candidate_store_lock:
+        if directory and (
+            _candidate_store is None
+            or _candidate_store.snapshot_version != CandidateStore.current_version(directory)
+        ):
+            _candidate_store = CandidateStore.open(directory) or _candidate_store
+        if _candidate_store is None and directory:
+            with snapshot_lock(directory):
+                # Another process may have published while this one waited for the lock
+                _candidate_store = CandidateStore.open(directory)
+                if _candidate_store is None:
+                    CandidateStore.load(db)._write(Path(directory))
+                    _candidate_store = CandidateStore.open(directory)
+        if _candidate_store is None:
+            _candidate_store = CandidateStore.load(db)
+        else:
+            _candidate_store.refresh(db)
+        relevance_index.use_document_frequencies(_candidate_store)
+        return _candidate_store
+
+
+if __name__ == "__main__":
+    # Publish a fresh snapshot (e.g. from cron) so worker deltas stay small:
+    #     python -m app.ml.store [directory]
+    from app.database import SessionLocal
+
+    target = sys.argv[1] if len(sys.argv) > 1 else settings.CANDIDATE_SNAPSHOT_DIR
+    if not target:
+        sys.exit("usage: python -m app.ml.store <directory> (or set CANDIDATE_SNAPSHOT_DIR)")
+    session = SessionLocal()
+    try:
+        snapshot = CandidateStore.open(target)
+        if snapshot is None:
+            snapshot = CandidateStore.load(session)
+        else:
+            snapshot.refresh(session)
+    finally:
+        session.close()
+    print(f"Wrote snapshot {snapshot.save(target)} with {len(snapshot)} candidates", file=sys.stderr)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Integer, Numeric, Text, ForeignKey, TIMESTAMP, CheckConstraint, ARRAY
+from sqlalchemy import Column, String, Integer, Float, Numeric, Text, ForeignKey, TIMESTAMP, CheckConstraint, UniqueConstraint, ARRAY, Index, event, inspect
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, query_expression
 from sqlalchemy.sql import func
 import uuid
 
@@ -38,11 +38,14 @@ class Candidate(Base):
     headline = Column(String(500))
     experience_years = Column(Integer, default=0)
     location = Column(String(255), index=True)
+    location_lat = Column(Float)  # Geocoded from location on save
+    location_lon = Column(Float)
     skills_text = Column(Text)  # Comma-separated skills
     resume_url = Column(Text)
     phone = Column(String(20))
     linkedin_url = Column(String(500))
     github_url = Column(String(500))
+    parser_version = Column(String(32))  # Resume parser version that last filled skills/experience
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -81,6 +84,8 @@ class Job(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
     location = Column(String(255), index=True)
+    location_lat = Column(Float)  # Geocoded from location on save
+    location_lon = Column(Float)
     remote_type = Column(String(50), default="on-site")
     employment_type = Column(String(50), default="full-time")
     skills_required = Column(Text)  # Comma-separated skills
@@ -94,10 +99,14 @@ class Job(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Truncated description, populated only by listing queries via with_expression()
+    description_preview = query_expression()
+    
     __table_args__ = (
         CheckConstraint("remote_type IN ('on-site', 'remote', 'hybrid')", name="check_remote_type"),
         CheckConstraint("employment_type IN ('full-time', 'part-time', 'contract', 'internship')", name="check_employment_type"),
         CheckConstraint("status IN ('draft', 'published', 'closed')", name="check_job_status"),
+        Index("idx_jobs_location_coords", "location_lat", "location_lon"),
     )
     
     # Relationships
@@ -123,6 +132,7 @@ class Application(Base):
     
     __table_args__ = (
         CheckConstraint("status IN ('applied', 'screening', 'shortlisted', 'interview', 'rejected', 'offer', 'accepted', 'declined')", name="check_application_status"),
+        UniqueConstraint("job_id", "candidate_id", name="applications_job_id_candidate_id_key"),  # One application per job
     )
     
     # Relationships
@@ -170,8 +180,24 @@ class Interview(Base):
         CheckConstraint("interview_type IN ('screening', 'technical', 'behavioral', 'final')", name="check_interview_type"),
         CheckConstraint("status IN ('scheduled', 'completed', 'cancelled', 'rescheduled')", name="check_interview_status"),
         CheckConstraint("rating >= 1 AND rating <= 5", name="check_rating_range"),
+        Index("idx_interviews_interviewer_scheduled", "interviewer_id", "scheduled_at"),
     )
     
     # Relationships
     application = relationship("Application", back_populates="interviews")
     interviewer = relationship("User", foreign_keys=[interviewer_id])
+
+
+@event.listens_for(Candidate, "before_insert")
+@event.listens_for(Candidate, "before_update")
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def cache_location_coordinates(mapper, connection, target):
+    """Geocode the location when it is saved so scoring never re-parses it."""
+    # Imported here: the gazetteer (and NumPy) load on the first save, not with the models
+    from app.ml.geo import geocode
+    
+    if target.location_lat is not None and not inspect(target).attrs.location.history.has_changes():
+        return
+    coordinates = geocode(target.location)
+    target.location_lat, target.location_lon = coordinates if coordinates else (None, None)
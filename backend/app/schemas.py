@@ -178,12 +178,28 @@ class JobResponse(JobBase):
     posted_by: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
+    description_preview: Optional[str] = None
     company: Optional[CompanyResponse] = None
     
     class Config:
         from_attributes = True
 
 
+class JobImportRowError(BaseModel):
+    """Rejected row of a bulk job import."""
+    row: int  # 1-based data row (CSV) or line (JSONL)
+    errors: List[str]
+
+
+class JobImportResponse(BaseModel):
+    """Schema for the result of a bulk job import."""
+    imported: int
+    failed: int
+    dry_run: bool = False
+    job_ids: List[UUID] = []
+    errors: List[JobImportRowError] = []
+
+
 # ============================================================================
 # APPLICATION SCHEMAS
 # ============================================================================
@@ -204,6 +220,19 @@ class ApplicationUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class ApplicationBulkStatusUpdate(BaseModel):
+    """Schema for moving many applications to one status."""
+    application_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+    status: str = Field(..., pattern="^(applied|screening|shortlisted|interview|rejected|offer|accepted|declined)$")
+
+
+class ApplicationBulkStatusResponse(BaseModel):
+    """Schema for bulk status update response."""
+    status: str
+    updated: List[UUID]
+    skipped: List[UUID]  # Not found, not for a job you posted, or already in this status
+
+
 class ApplicationResponse(ApplicationBase):
     """Schema for application response."""
     id: UUID
@@ -265,6 +294,7 @@ class InterviewBase(BaseModel):
 class InterviewCreate(InterviewBase):
     """Schema for creating an interview."""
     application_id: UUID
+    interviewer_id: Optional[UUID] = None  # Defaults to the scheduling recruiter
 
 
 class InterviewUpdate(BaseModel):
@@ -272,6 +302,7 @@ class InterviewUpdate(BaseModel):
     scheduled_at: Optional[datetime] = None
     duration_minutes: Optional[int] = Field(None, ge=15, le=480)
     meeting_link: Optional[str] = None
+    interviewer_id: Optional[UUID] = None
     status: Optional[str] = Field(None, pattern="^(scheduled|completed|cancelled|rescheduled)$")
     notes: Optional[str] = None
     feedback: Optional[str] = None
@@ -293,6 +324,13 @@ class InterviewResponse(InterviewBase):
         from_attributes = True
 
 
+class InterviewSlot(BaseModel):
+    """A free interview slot."""
+    start: datetime
+    end: datetime
+    interviewer_ids: List[UUID]  # Interviewers free for the whole slot
+
+
 # ============================================================================
 # ML SCHEMAS
 # ============================================================================
@@ -305,6 +343,8 @@ class ResumeParseResponse(BaseModel):
     skills: List[str] = []
     experience_years: int = 0
     education_text: Optional[str] = None
+    resume_id: Optional[str] = None  # SHA-256 of the stored file, when the resume store is enabled
+    resume_url: Optional[str] = None
 
 
 class MatchScoreRequest(BaseModel):
@@ -322,6 +362,28 @@ class MatchScoreResponse(BaseModel):
     location_match: bool
 
 
+class CandidateMatchResponse(BaseModel):
+    """Schema for a candidate retrieved for a job by skill similarity."""
+    candidate_id: UUID
+    match_percentage: float
+    matched_skills: List[str] = []
+    missing_skills: List[str] = []
+
+
+class RankedCandidate(BaseModel):
+    """Schema for one candidate in a scatter-gather ranking."""
+    candidate_id: UUID
+    match_score: float
+
+
+class RankedCandidatesResponse(BaseModel):
+    """Schema for the merged top candidates across scorer shards."""
+    job_id: UUID
+    partial: bool  # True if some shards missed the deadline
+    missing_shards: List[int] = []
+    candidates: List[RankedCandidate]
+
+
 class ScreeningScoreRequest(BaseModel):
     """Schema for screening score calculation request."""
     application_id: UUID
@@ -0,0 +1,92 @@
+"""
+Benchmark: cache backends.
+
+Times get/set of serialized job lists through the in-process LRU backend
+and through the Redis-protocol backend against the local stand-in server
+(point CACHE_BENCH_URL at a real Redis to compare), reports the encoded
+size against plain JSON, and checks tag invalidation across namespaces
+and that an unreachable server degrades to misses.
+
+Run from the backend directory:
+    python -m benchmarks.bench_cache [operations]
+"""
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+
+import orjson
+
+from app.core.cache import Cache, MISSING, MemoryCacheBackend, RedisCacheBackend, RespServer, encode_value
+from benchmarks.bench_batch import pick_skills
+
+
+def make_job(rng):
+    return {
+        "id": uuid.UUID(int=rng.getrandbits(128)),
+        "company_id": uuid.UUID(int=rng.getrandbits(128)),
+        "title": rng.choice(["Backend Engineer", "Data Scientist", "Frontend Developer", "SRE"]),
+        "location": rng.choice(["Austin, TX", "Remote", "New York, NY", "Berlin"]),
+        "skills_required": pick_skills(rng, 3, 10),
+        "salary_min": rng.randrange(60_000, 120_000, 5_000),
+        "salary_max": rng.randrange(120_000, 220_000, 5_000),
+        "status": "published",
+        "created_at": datetime(2024, 1, 1, rng.randrange(24)),
+        "description_preview": " ".join(rng.choice(["build", "scale", "ship", "design", "own"]) for _ in range(35)),
+    }
+
+
+def run(label, backend, pages, operations):
+    cache = Cache("bench", ttl=60, backend=backend)
+    start = time.perf_counter()
+    for i in range(operations):
+        cache.set(i % len(pages), pages[i % len(pages)], tags=[f"page:{i % len(pages)}"])
+    set_us = (time.perf_counter() - start) / operations * 1e6
+    start = time.perf_counter()
+    for i in range(operations):
+        cache.get(i % len(pages))
+    get_us = (time.perf_counter() - start) / operations * 1e6
+    print(f"  {label:<22} set={set_us:7.1f} us  get={get_us:7.1f} us  hit_rate={cache.stats()['hit_rate']}")
+
+
+def check_invalidation(backend):
+    jobs, lists = Cache("jobs", 60, backend), Cache("lists", 60, backend)
+    jobs.set("a", {"title": "A"}, tags=["job:a", "company:x"])
+    jobs.set("b", {"title": "B"}, tags=["job:b", "company:y"])
+    lists.set("x", ["a"], tags=["company:x"])
+    jobs.invalidate("company:x")
+    return jobs.get("a") is MISSING and lists.get("x") is MISSING and jobs.get("b") == {"title": "B"}
+
+
+if __name__ == "__main__":
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = random.Random(17)
+    pages = [[make_job(rng) for _ in range(20)] for _ in range(200)]
+
+    json_size = sum(len(orjson.dumps(page)) for page in pages) / len(pages)
+    encoded_size = sum(len(encode_value(page)) for page in pages) / len(pages)
+    print(f"20-job page: {json_size / 1024:.1f} KB as JSON, {encoded_size / 1024:.1f} KB encoded")
+
+    server = None
+    url = os.environ.get("CACHE_BENCH_URL")
+    if not url:
+        server = RespServer().start()
+        url = server.url
+    remote = RedisCacheBackend(url)
+    remote.execute("FLUSHDB")
+
+    run("memory LRU", MemoryCacheBackend(), pages, operations)
+    run(f"RESP ({'stand-in' if server else url})", remote, pages, operations // 4)
+
+    for label, backend in (("memory", MemoryCacheBackend()), ("RESP", remote)):
+        print(f"  tag invalidation ({label}): {'ok' if check_invalidation(backend) else 'FAILED'}")
+
+    remote.close()
+    if server is not None:
+        server.stop()
+    down = Cache("down", 60, RedisCacheBackend(url, timeout=0.2))
+    down.set("k", 1)
+    result = down.get("k")
+    print(f"  server down: get -> {'miss' if result is MISSING else result}, errors={down.stats()['errors']}")
@@ -0,0 +1,129 @@
+"""
+Benchmark: streaming DOCX extraction vs python-docx on large generated files.
+
+Reports wall time and peak Python memory (tracemalloc) for each extractor,
+after checking the extracted text of a document with nested tables.
+python-docx is only needed for the comparison; install it separately with
+`pip install python-docx`.
+
+Run from the backend directory:
+    python -m benchmarks.bench_docx
+"""
+import io
+import time
+import tracemalloc
+import zipfile
+
+from app.ml.docx_text import extract_docx_text
+
+PARAGRAPH_COUNTS = (1_000, 10_000, 50_000)
+TABLE_EVERY = 20
+
+NAMESPACE = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def paragraph(text: str) -> str:
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def package(body: str) -> bytes:
+    """Zip a document body into a minimal DOCX."""
+    document = f"<w:document {NAMESPACE}><w:body>{body}</w:body></w:document>"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", ROOT_RELS)
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def table(*rows) -> str:
+    """A table whose rows are lists of cell contents (XML)."""
+    return "<w:tbl>" + "".join(
+        "<w:tr>" + "".join(f"<w:tc>{cell}</w:tc>" for cell in row) + "</w:tr>" for row in rows
+    ) + "</w:tbl>"
+
+
+def check_nested_tables() -> bool:
+    """Check that a table nested in a cell stays in that cell."""
+    body = (
+        paragraph("Intro")
+        + table(
+            [paragraph("Skills"), paragraph("Languages") + table([paragraph("Python"), paragraph("Go")]) + paragraph("Tools")],
+            [paragraph("Years"), paragraph("5")],
+        )
+        + paragraph("End")
+    )
+    expected = "Intro\nSkills\tLanguages Python\tGo Tools\nYears\t5\nEnd"
+    text = extract_docx_text(package(body))
+    if text != expected:
+        print(f"❌ nested tables: expected {expected!r}, got {text!r}")
+        return False
+    print("✅ nested tables extracted cell by cell")
+    return True
+
+
+def build_docx(paragraphs: int) -> bytes:
+    """Generate a DOCX with the given number of paragraphs plus periodic skill tables."""
+    body = []
+    for i in range(paragraphs):
+        body.append(paragraph(f"Led project {i} using Python, Docker and PostgreSQL across teams."))
+        if i % TABLE_EVERY == 0:
+            body.append(table([paragraph("Skills"), paragraph("Kubernetes, Terraform, AWS")]))
+    return package("".join(body))
+
+
+def python_docx_text(file_bytes: bytes) -> str:
+    from docx import Document
+    doc = Document(io.BytesIO(file_bytes))
+    return "\n".join(p.text for p in doc.paragraphs)
+
+
+def measure(extractor, file_bytes: bytes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = extractor(file_bytes)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(text)
+
+
+if __name__ == "__main__":
+    if not check_nested_tables():
+        raise SystemExit(1)
+    
+    try:
+        import docx  # noqa: F401
+        has_python_docx = True
+    except ImportError:
+        has_python_docx = False
+        print("python-docx not installed, reporting the streaming extractor only")
+    
+    for count in PARAGRAPH_COUNTS:
+        file_bytes = build_docx(count)
+        print(f"\n{count} paragraphs ({len(file_bytes) / 1024:.0f} KiB compressed)")
+        
+        elapsed, peak, chars = measure(extract_docx_text, file_bytes)
+        print(f"  streaming:   {elapsed * 1000:8.1f} ms  peak {peak / 1024 / 1024:6.1f} MiB  {chars} chars")
+        
+        if has_python_docx:
+            elapsed, peak, chars = measure(python_docx_text, file_bytes)
+            print(f"  python-docx: {elapsed * 1000:8.1f} ms  peak {peak / 1024 / 1024:6.1f} MiB  {chars} chars")
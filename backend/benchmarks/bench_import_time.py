@@ -0,0 +1,90 @@
+"""
+Import-time benchmark with a budget check.
+
+Runs `python -X importtime` in a fresh interpreter that imports the
+frameworks (FastAPI, SQLAlchemy, Pydantic) first and then `app.main`, so
+the budget applies to the application's own import time, which does not
+swing with how long the frameworks take on a given machine. Reports the
+slowest imports and fails if `app.main` exceeds the budget or a lazily
+loaded module (parser libraries, NumPy and the matching modules) was
+imported.
+
+Run from the backend directory:
+    python -m benchmarks.bench_import_time [budget_ms]
+"""
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 1000
+TARGET_MODULE = "app.main"
+# Imported before the target and reported separately
+FRAMEWORK_MODULES = ("fastapi", "fastapi.security", "sqlalchemy.orm", "sqlalchemy.dialects.postgresql", "pydantic_settings")
+LAZY_MODULES = (
+    "pdfplumber", "pdfminer", "docx", "numpy",
+    "app.ml.geo", "app.ml.relevance", "app.ml.matcher", "app.ml.lsh",
+    "app.ml.store", "app.ml.batch", "app.ml.scatter",
+)
+TOP_N = 10
+
+
+def measure_imports(module: str, preload=FRAMEWORK_MODULES) -> dict:
+    """
+    Return {module name: (cumulative import time in microseconds, nesting level)}.
+
+    `preload` is imported first, so its time is not counted in `module`.
+    """
+    statements = [f"import {name}" for name in (*preload, module)]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        raise SystemExit(f"❌ Failed to import {module}")
+    
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.rstrip()[1:]
+        level = (len(name) - len(name.lstrip())) // 2
+        timings[name.strip()] = (int(cumulative), level)
+    return timings
+
+
+if __name__ == "__main__":
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    timings = measure_imports(TARGET_MODULE)
+    
+    # Direct imports of the target (lines printed after it is done, at nesting level 1)
+    names = list(timings)
+    position = names.index(TARGET_MODULE)
+    start = max((index + 1 for index, name in enumerate(names[:position]) if timings[name][1] == 0), default=0)
+    direct = {name: timings[name][0] for name in names[start:position] if timings[name][1] == 1}
+    print(f"Slowest direct imports of {TARGET_MODULE}:")
+    for name, us in sorted(direct.items(), key=lambda item: item[1], reverse=True)[:TOP_N]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    
+    framework_ms = sum(timings[name][0] for name in FRAMEWORK_MODULES if name in timings and timings[name][1] == 0) / 1000
+    print(f"  (frameworks imported first: {framework_ms:.1f} ms, not counted)")
+    
+    total_ms = timings[TARGET_MODULE][0] / 1000
+    eager = sorted({lazy for lazy in LAZY_MODULES for name in timings if name == lazy or name.startswith(lazy + ".")})
+    
+    failed = False
+    if total_ms > budget_ms:
+        print(f"❌ {TARGET_MODULE} took {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+        failed = True
+    else:
+        print(f"✅ {TARGET_MODULE} took {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    
+    if eager:
+        print(f"❌ Lazily loaded modules imported at startup: {', '.join(eager)}")
+        failed = True
+    
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,76 @@
+"""
+Benchmark: MinHash LSH candidate retrieval vs brute-force skill matching.
+
+Generates a synthetic candidate pool whose skills follow a Zipf-like
+popularity curve (so "python", "git" and "sql" appear almost everywhere),
+then reports query latency and recall@K of LSH retrieval + exact rerank
+against a brute-force scan for several band/row settings.
+
+Run from the backend directory:
+    python -m benchmarks.bench_lsh [num_candidates]
+"""
+import random
+import sys
+import time
+
+from app.ml.lsh import MinHashLSHIndex, normalize_skill_set, rank_candidates
+from app.ml.matcher import compute_skills_match
+from app.ml.resume_parser import TECH_SKILLS
+
+TOP_K = 20
+NUM_JOBS = 50
+SETTINGS = [(16, 2), (32, 2), (64, 2), (32, 3)]
+
+
+def make_skill_sets(count, rng, low, high):
+    weights = [1.0 / (rank + 1) for rank in range(len(TECH_SKILLS))]
+    return [
+        normalize_skill_set(rng.choices(TECH_SKILLS, weights=weights, k=rng.randint(low, high)))
+        for _ in range(count)
+    ]
+
+
+def brute_force(candidates, job_set, limit):
+    scored = []
+    for candidate_id, skills in candidates.items():
+        match_pct, _, _ = compute_skills_match(list(skills), list(job_set))
+        jaccard = len(skills & job_set) / len(skills | job_set)
+        scored.append(((match_pct, jaccard), candidate_id))
+    scored.sort(reverse=True)
+    return scored[:limit]
+
+
+if __name__ == "__main__":
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(7)
+    candidates = {str(i): skills for i, skills in enumerate(make_skill_sets(num_candidates, rng, 3, 12))}
+    jobs = [skills for skills in make_skill_sets(NUM_JOBS, rng, 3, 8) if skills]
+    
+    start = time.perf_counter()
+    truth = [brute_force(candidates, job_set, TOP_K) for job_set in jobs]
+    brute_ms = (time.perf_counter() - start) / len(jobs) * 1000
+    print(f"{num_candidates} candidates, {len(jobs)} jobs, K={TOP_K}")
+    print(f"  brute force: {brute_ms:8.2f} ms/query")
+    
+    for bands, rows in SETTINGS:
+        index = MinHashLSHIndex(bands, rows)
+        start = time.perf_counter()
+        for candidate_id, skills in candidates.items():
+            index.add(candidate_id, skills)
+        build_s = time.perf_counter() - start
+        
+        recall_total, retrieved_total = 0.0, 0
+        start = time.perf_counter()
+        results = [rank_candidates(index, list(job_set), TOP_K) for job_set in jobs]
+        query_ms = (time.perf_counter() - start) / len(jobs) * 1000
+        
+        for job_set, expected, found in zip(jobs, truth, results):
+            retrieved_total += len(index.query(job_set))
+            # Ties make ids ambiguous, so count results scoring at least the K-th true score
+            threshold = expected[-1][0][0] if expected else 0.0
+            hits = sum(1 for _, pct, _, _ in found if pct >= threshold)
+            recall_total += min(hits, len(expected)) / max(len(expected), 1)
+        
+        print(f"  bands={bands:<3} rows={rows}: {query_ms:8.2f} ms/query  "
+              f"recall@{TOP_K}={recall_total / len(jobs):.3f}  "
+              f"avg retrieved={retrieved_total / len(jobs):8.0f}  build={build_s:.1f}s")
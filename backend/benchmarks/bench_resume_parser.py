@@ -0,0 +1,124 @@
+"""
+Benchmark: single-pass resume field extraction vs the per-extractor rescans.
+
+The reference implementation below is the original parser, which rescans
+the full text in every extractor. The benchmark checks that `extract_fields`
+produces identical output on every resume in the fixture corpus and reports
+the per-resume extraction time of both.
+
+Run from the backend directory:
+    python -m benchmarks.bench_resume_parser
+"""
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from app.ml.resume_parser import TECH_SKILLS, extract_fields
+
+FIXTURES = Path(__file__).parent / "fixtures" / "resumes"
+REPEAT = 200
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (original rescanning extractors)
+# ---------------------------------------------------------------------------
+
+def reference_email(text):
+    match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    return match.group(0) if match else None
+
+
+def reference_phone(text):
+    for pattern in [
+        r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\d{10}',
+    ]:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(0)
+    return None
+
+
+def reference_skills(text):
+    text_lower = text.lower()
+    found = []
+    for skill in TECH_SKILLS:
+        if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
+            found.append(skill.title())
+    return list(dict.fromkeys(found))
+
+
+def reference_experience(text):
+    for pattern in [
+        r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
+        r'experience[:\s]+(\d+)\+?\s*years?',
+        r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience',
+    ]:
+        match = re.search(pattern, text.lower())
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def reference_name(text):
+    for line in text.strip().split('\n')[:5]:
+        line = line.strip()
+        if line and len(line) < 50 and re.match(r'^[A-Za-z\s.]+$', line):
+            return line
+    return None
+
+
+def reference_education(text):
+    keywords = [
+        r'bachelor', r'master', r'phd', r'doctorate', r'b\.?s\.?', r'm\.?s\.?',
+        r'b\.?tech', r'm\.?tech', r'mba', r'university', r'college', r'degree'
+    ]
+    lines = text.split('\n')
+    education_lines = []
+    for i, line in enumerate(lines):
+        line_lower = line.lower()
+        if any(re.search(keyword, line_lower) for keyword in keywords):
+            education_lines.append(line.strip())
+            if i + 1 < len(lines):
+                education_lines.append(lines[i + 1].strip())
+    return ' '.join(education_lines[:5]) if education_lines else None
+
+
+def reference_fields(text):
+    return {
+        "name": reference_name(text),
+        "email": reference_email(text),
+        "phone": reference_phone(text),
+        "skills": reference_skills(text),
+        "experience_years": reference_experience(text),
+        "education_text": reference_education(text),
+    }
+
+
+if __name__ == "__main__":
+    corpus = {path.name: path.read_text() for path in sorted(FIXTURES.glob("*.txt"))}
+    
+    mismatches = 0
+    for name, text in corpus.items():
+        expected, actual = reference_fields(text), extract_fields(text)
+        if expected != actual:
+            mismatches += 1
+            print(f"❌ {name}: outputs differ")
+            for key in expected:
+                if expected[key] != actual[key]:
+                    print(f"   {key}: {expected[key]!r} != {actual[key]!r}")
+    
+    texts = list(corpus.values())
+    reference = min(timeit.repeat(lambda: [reference_fields(t) for t in texts], number=1, repeat=REPEAT))
+    single_pass = min(timeit.repeat(lambda: [extract_fields(t) for t in texts], number=1, repeat=REPEAT))
+    
+    print(f"Resume field extraction ({len(texts)} fixtures, best of {REPEAT})")
+    print(f"  reference:   {reference / len(texts) * 1e6:8.1f} µs/resume")
+    print(f"  single-pass: {single_pass / len(texts) * 1e6:8.1f} µs/resume   "
+          f"speedup: {reference / single_pass:4.1f}x")
+    
+    if mismatches:
+        sys.exit(1)
+    print(f"✅ Identical output on all {len(texts)} fixtures")
@@ -0,0 +1,68 @@
+"""
+Benchmark: scatter-gather top-K over local scorer processes.
+
+Starts a LocalCluster of N scorer processes on localhost, checks the
+merged top-K against scoring the whole pool in one process, reports
+request latency, then makes one shard slow to show the deadline
+returning a partial result.
+
+Run from the backend directory:
+    python -m benchmarks.bench_scatter [num_candidates] [num_shards]
+"""
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from app.core.config import settings
+from app.ml.batch import BatchMatchEngine
+from app.ml.store import CandidateStore
+from app.ml.scatter import LocalCluster
+from benchmarks.bench_batch import make_candidate, make_job
+
+TOP_K = 20
+NUM_JOBS = 30
+
+
+def exact_top_scores(candidates, jobs):
+    store = CandidateStore.from_rows(candidates)
+    with BatchMatchEngine(store, workers=1, batch_size=len(jobs)) as engine:
+        return [
+            np.sort(row.astype(np.float64))[::-1][:TOP_K].round(2).tolist()
+            for _, scores in engine.score_jobs(jobs) for row in scores
+        ]
+
+
+if __name__ == "__main__":
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_shards = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    settings.MATCH_WEIGHT_TEXT = 0.0  # Per-shard IDF would make text scores differ slightly
+
+    rng = random.Random(5)
+    now = datetime(2024, 1, 1)
+    candidates = [make_candidate(rng, now) for _ in range(num_candidates)]
+    jobs = [make_job(rng, now) for _ in range(NUM_JOBS)]
+    expected = exact_top_scores(candidates, jobs)
+
+    start = time.perf_counter()
+    with LocalCluster(candidates, num_shards, deadline_ms=5000) as cluster:
+        print(f"{num_candidates} candidates on {num_shards} shards (started in {time.perf_counter() - start:.1f}s)")
+        latencies, mismatches = [], 0
+        for job, top_scores in zip(jobs, expected):
+            started = time.perf_counter()
+            result = cluster.coordinator.top_k(job, TOP_K)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if [round(score, 2) for _, score in result.candidates] != top_scores:
+                mismatches += 1
+        print(f"  top-{TOP_K}: p50={statistics.median(latencies):.1f} ms  max={max(latencies):.1f} ms  "
+              f"mismatched jobs={mismatches}/{len(jobs)}")
+
+    with LocalCluster(candidates, num_shards, deadline_ms=200, delays={0: 1.0}) as cluster:
+        started = time.perf_counter()
+        result = cluster.coordinator.top_k(jobs[0], TOP_K)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"  slow shard 0: partial={result.partial} missing={result.missing_shards} "
+              f"returned {len(result.candidates)} in {elapsed:.0f} ms (deadline 200 ms)")
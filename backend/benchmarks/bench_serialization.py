@@ -0,0 +1,91 @@
+"""
+Micro-benchmark: serialization time per 100-item page of jobs and applications.
+
+Compares the default FastAPI path (per-item model validation, jsonable_encoder
+and the stdlib JSON encoder) with the precompiled TypeAdapter + orjson path.
+
+Run from the backend directory:
+    python -m benchmarks.bench_serialization
+"""
+import json
+import timeit
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas import JobResponse, ApplicationResponse
+from app.core.serialization import (
+    FastJSONResponse, job_list_adapter, application_list_adapter, serialize_list
+)
+
+PAGE_SIZE = 100
+REPEAT = 50
+
+
+def make_company():
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(), name="Acme Corp", description="We build things. " * 20,
+        website="https://acme.example", logo_url=None, industry="Software",
+        size="51-200", location="New York, NY", created_by=uuid.uuid4(),
+        created_at=now, updated_at=now,
+    )
+
+
+def make_job(company):
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(), company_id=company.id, title="Senior Backend Engineer",
+        description="Design and operate APIs. " * 80, location="New York, NY",
+        remote_type="hybrid", employment_type="full-time",
+        skills_required="python, fastapi, postgresql, docker, aws",
+        salary_min=Decimal("120000.00"), salary_max=Decimal("160000.00"),
+        currency="USD", experience_min=3, experience_max=8, status="published",
+        posted_by=uuid.uuid4(), created_at=now, updated_at=now, company=company,
+    )
+
+
+def make_application(job):
+    now = datetime.now(timezone.utc)
+    candidate = SimpleNamespace(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), headline="Backend developer",
+        experience_years=5, location="Brooklyn, NY",
+        skills_text="python, django, postgresql, redis", phone="555-0100",
+        linkedin_url=None, github_url=None, resume_url=None,
+        created_at=now, updated_at=now,
+    )
+    return SimpleNamespace(
+        id=uuid.uuid4(), job_id=job.id, candidate_id=candidate.id, status="applied",
+        match_score=Decimal("78.50"), screening_score=None,
+        cover_letter="I am excited to apply. " * 30, notes=None,
+        created_at=now, updated_at=now, job=job, candidate=candidate,
+    )
+
+
+def stdlib_path(schema, rows):
+    models = [schema.model_validate(row, from_attributes=True) for row in rows]
+    return json.dumps(jsonable_encoder(models)).encode("utf-8")
+
+
+def fast_path(adapter, rows):
+    return FastJSONResponse(serialize_list(adapter, rows)).body
+
+
+def report(label, schema, adapter, rows):
+    baseline = min(timeit.repeat(lambda: stdlib_path(schema, rows), number=1, repeat=REPEAT))
+    fast = min(timeit.repeat(lambda: fast_path(adapter, rows), number=1, repeat=REPEAT))
+    print(f"{label:<14} stdlib: {baseline * 1000:7.2f} ms/page   "
+          f"fast: {fast * 1000:7.2f} ms/page   speedup: {baseline / fast:4.1f}x")
+
+
+if __name__ == "__main__":
+    company = make_company()
+    jobs = [make_job(company) for _ in range(PAGE_SIZE)]
+    applications = [make_application(job) for job in jobs]
+    
+    print(f"Serialization benchmark ({PAGE_SIZE} items per page, best of {REPEAT})")
+    report("jobs", JobResponse, job_list_adapter, jobs)
+    report("applications", ApplicationResponse, application_list_adapter, applications)
@@ -0,0 +1,86 @@
+"""
+Benchmark: typo-tolerant skill canonicalization.
+
+Builds a SkillCanonicalizer over a synthetic vocabulary (the real
+TECH_SKILLS plus generated terms) and reports index build time and
+per-lookup latency for exact hits, aliases, misspellings and unknown
+tokens, compared with a linear edit-distance scan over the vocabulary.
+
+Run from the backend directory:
+    python -m benchmarks.bench_skills [vocabulary_size]
+"""
+import random
+import string
+import sys
+import time
+
+from app.ml.resume_parser import TECH_SKILLS
+from app.ml.skills import SKILL_ALIASES, SkillCanonicalizer, damerau_levenshtein
+
+NUM_QUERIES = 2_000
+SCAN_QUERIES = 50
+
+
+def make_vocabulary(size, rng):
+    vocabulary = [skill.lower() for skill in TECH_SKILLS]
+    seen = set(vocabulary)
+    while len(vocabulary) < size:
+        term = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 14)))
+        if term not in seen:
+            seen.add(term)
+            vocabulary.append(term)
+    return vocabulary
+
+
+def misspell(term, rng):
+    position = rng.randrange(1, len(term))  # Typos rarely hit the first letter
+    edit = rng.choice(["swap", "drop", "replace"])
+    if edit == "swap" and position < len(term) - 1:
+        return term[:position] + term[position + 1] + term[position] + term[position + 2:]
+    if edit == "drop" and len(term) > 4:
+        return term[:position] + term[position + 1:]
+    return term[:position] + rng.choice(string.ascii_lowercase) + term[position + 1:]
+
+
+def linear_scan(vocabulary, token):
+    best = None
+    for term in vocabulary:
+        distance = damerau_levenshtein(token, term, 2)
+        if distance <= 2 and (best is None or distance < best[0]):
+            best = (distance, term)
+    return best[1] if best else None
+
+
+def time_lookups(canonicalizer, tokens):
+    start = time.perf_counter()
+    for token in tokens:
+        canonicalizer.lookup(token)
+    return (time.perf_counter() - start) / len(tokens) * 1e6
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = random.Random(11)
+    vocabulary = make_vocabulary(size, rng)
+
+    start = time.perf_counter()
+    canonicalizer = SkillCanonicalizer(vocabulary, SKILL_ALIASES)
+    build_s = time.perf_counter() - start
+    print(f"{len(vocabulary)} skills, {len(canonicalizer._deletes)} delete keys, build={build_s:.2f}s")
+
+    long_terms = [term for term in vocabulary if len(term) >= 5]
+    workloads = {
+        "exact": [rng.choice(vocabulary) for _ in range(NUM_QUERIES)],
+        "alias": [rng.choice(list(SKILL_ALIASES)) for _ in range(NUM_QUERIES)],
+        "misspelled": [misspell(rng.choice(long_terms), rng) for _ in range(NUM_QUERIES)],
+        "unknown": ["".join(rng.choices(string.ascii_lowercase, k=10)) for _ in range(NUM_QUERIES)],
+    }
+    for name, tokens in workloads.items():
+        print(f"  {name:<11} {time_lookups(canonicalizer, tokens):8.1f} µs/lookup")
+
+    scan_tokens = workloads["misspelled"][:SCAN_QUERIES]
+    start = time.perf_counter()
+    for token in scan_tokens:
+        linear_scan(vocabulary, token)
+    scan_us = (time.perf_counter() - start) / len(scan_tokens) * 1e6
+    print(f"  linear scan {scan_us:8.1f} µs/lookup (misspelled)")
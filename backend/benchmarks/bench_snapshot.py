@@ -0,0 +1,97 @@
+"""
+Benchmark: memory-mapped candidate store snapshots.
+
+Builds a synthetic store, writes a snapshot, then compares opening it
+with rebuilding from rows, applies a 1% delta on top of the mapped
+snapshot, and starts several worker processes that map and scan the
+snapshot to show the resident (RSS) and proportional (PSS) size of the
+mapped files in each: the pages are shared, so PSS per worker is the
+column size divided by the number of workers.
+
+Run from the backend directory:
+    python -m benchmarks.bench_snapshot [num_candidates] [workers]
+"""
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.ml.store import CandidateStore
+from benchmarks.bench_batch import make_candidate, pick_skills
+
+
+def mapped_kb(directory):
+    """(Rss, Pss) in kB of this process's mappings of files under directory (Linux)."""
+    rss = pss = 0
+    inside = False
+    with open("/proc/self/smaps") as smaps:
+        for line in smaps:
+            fields = line.split()
+            if "-" in fields[0] and len(fields) >= 5:
+                inside = len(fields) >= 6 and fields[5].startswith(directory)
+            elif inside and fields[0] == "Rss:":
+                rss += int(fields[1])
+            elif inside and fields[0] == "Pss:":
+                pss += int(fields[1])
+    return rss, pss
+
+
+def worker(directory, started, results):
+    store = CandidateStore.open(directory)
+    # Touch every page of every column
+    checksum = sum(int(np.asarray(array).view(np.uint8).sum()) for array in store.arrays.values())
+    started.wait()
+    results.put((*mapped_kb(directory), checksum))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    rng = random.Random(13)
+    now = datetime(2024, 1, 1)
+    rows = [make_candidate(rng, now) for _ in range(count)]
+
+    start = time.perf_counter()
+    store = CandidateStore.from_rows(rows, with_text=True)
+    build_s = time.perf_counter() - start
+    column_mb = sum(array.nbytes for array in store.arrays.values()) / 1e6
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        store.save(directory)
+        save_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mapped = CandidateStore.open(directory)
+        open_ms = (time.perf_counter() - start) * 1000
+        print(f"{count} candidates, {column_mb:.1f} MB of columns")
+        print(f"  build from rows: {build_s:.2f}s  save: {save_s:.2f}s  open (mmap): {open_ms:.1f} ms")
+
+        changed = rng.sample(rows, max(1, count // 100))
+        for row in changed:
+            row.skills_text = pick_skills(rng, 3, 12)
+            row.updated_at = now + timedelta(minutes=5)
+        start = time.perf_counter()
+        mapped.apply(changed)
+        delta_ms = (time.perf_counter() - start) * 1000
+        still_mapped = all(isinstance(array, np.memmap) for array in mapped.base.values())
+        print(f"  delta of {len(changed)} rows on the mapped snapshot: {delta_ms:.0f} ms "
+              f"({mapped.overlay_rows} overlay rows, base {'still mapped' if still_mapped else 'COPIED'})")
+
+        context = multiprocessing.get_context("spawn")
+        started, results = context.Event(), context.Queue()
+        processes = [context.Process(target=worker, args=(directory, started, results)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        time.sleep(1.0 + 0.5 * workers)  # Let every worker map and scan before sampling
+        started.set()
+        samples = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        rss = sum(sample[0] for sample in samples) / len(samples) / 1e3
+        pss = sum(sample[1] for sample in samples) / len(samples) / 1e3
+        print(f"  {workers} workers mapping the snapshot: avg mapped RSS={rss:.1f} MB  avg mapped PSS={pss:.1f} MB")
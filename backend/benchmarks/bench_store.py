@@ -0,0 +1,74 @@
+"""
+Benchmark: columnar candidate store vs ORM objects.
+
+Reports the memory footprint of `CandidateStore` per 100k candidates
+against the same candidates as `Candidate` ORM instances (measured with
+tracemalloc; the session identity map would add more), then times an
+incremental refresh of 1% of the rows and checks it against a rebuild.
+
+Run from the backend directory:
+    python -m benchmarks.bench_store [num_candidates]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from app.ml.store import STORE_COLUMNS, CandidateStore
+from app.models import Candidate
+from benchmarks.bench_batch import make_candidate, pick_skills
+
+
+def orm_bytes(rows):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [Candidate(**{name: getattr(row, name) for name in STORE_COLUMNS}) for row in rows]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return used
+
+
+def per_100k(total, count):
+    return total * 100_000 / count / 1e6
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(9)
+    now = datetime(2024, 1, 1)
+    rows = [make_candidate(rng, now) for _ in range(count)]
+
+    for with_text in (False, True):
+        start = time.perf_counter()
+        store = CandidateStore.from_rows(rows, with_text=with_text)
+        build_s = time.perf_counter() - start
+        report = store.memory_report()
+        label = "store (+text)" if with_text else "store"
+        print(f"  {label:<14} {per_100k(report['total_bytes'], count):7.1f} MB per 100k  build={build_s:.2f}s")
+    print(f"  {'ORM objects':<14} {per_100k(orm_bytes(rows), count):7.1f} MB per 100k")
+    print("  columns:", ", ".join(f"{name}={size / 1e6:.1f}MB" for name, size in report["columns"].items()))
+
+    # Incremental refresh: change 1% of the candidates
+    changed = rng.sample(rows, max(1, count // 100))
+    for row in changed:
+        row.skills_text = pick_skills(rng, 3, 12)
+        row.experience_years = rng.randint(0, 15)
+        row.updated_at = now + timedelta(minutes=5)
+    start = time.perf_counter()
+    store.apply(changed)
+    refresh_ms = (time.perf_counter() - start) * 1000
+
+    rebuilt = CandidateStore.from_rows(rows, with_text=True)
+    rebuilt_arrays, store_arrays = rebuilt.arrays, store.arrays
+    expected = {
+        candidate_id: (int(rebuilt_arrays["experience"][row]), sorted(rebuilt.skills_of(row)))
+        for row, candidate_id in enumerate(rebuilt.candidate_ids(rebuilt_arrays))
+    }
+    actual = {
+        candidate_id: (int(store_arrays["experience"][row]), sorted(store.skills_of(row)))
+        for row, candidate_id in enumerate(store.candidate_ids(store_arrays))
+    }
+    status = "matches" if actual == expected else "DIFFERS from"
+    print(f"  refresh of {len(changed)} rows: {refresh_ms:.1f} ms, {status} a full rebuild")
@@ -26,11 +26,14 @@ CREATE TABLE candidates (
     headline VARCHAR(500),
     experience_years INTEGER DEFAULT 0,
     location VARCHAR(255),
+    location_lat DOUBLE PRECISION, -- Geocoded from location on save
+    location_lon DOUBLE PRECISION,
     skills_text TEXT, -- Comma-separated or JSON array of skills
     resume_url TEXT, -- URL to stored resume file
     phone VARCHAR(20),
     linkedin_url VARCHAR(500),
     github_url VARCHAR(500),
+    parser_version VARCHAR(32), -- Resume parser version that last filled skills/experience
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -62,6 +65,8 @@ CREATE TABLE jobs (
     title VARCHAR(255) NOT NULL,
     description TEXT NOT NULL,
     location VARCHAR(255),
+    location_lat DOUBLE PRECISION, -- Geocoded from location on save
+    location_lon DOUBLE PRECISION,
     remote_type VARCHAR(50) DEFAULT 'on-site' CHECK (remote_type IN ('on-site', 'remote', 'hybrid')),
     employment_type VARCHAR(50) DEFAULT 'full-time' CHECK (employment_type IN ('full-time', 'part-time', 'contract', 'internship')),
     skills_required TEXT, -- Comma-separated or JSON array
@@ -80,6 +85,7 @@ CREATE INDEX idx_jobs_company_id ON jobs(company_id);
 CREATE INDEX idx_jobs_status ON jobs(status);
 CREATE INDEX idx_jobs_location ON jobs(location);
 CREATE INDEX idx_jobs_created_at ON jobs(created_at DESC);
+CREATE INDEX idx_jobs_location_coords ON jobs(location_lat, location_lon);
 
 -- Applications table
 CREATE TABLE applications (
@@ -133,6 +139,7 @@ CREATE TABLE interviews (
 
 CREATE INDEX idx_interviews_application_id ON interviews(application_id);
 CREATE INDEX idx_interviews_scheduled_at ON interviews(scheduled_at);
+CREATE INDEX idx_interviews_interviewer_scheduled ON interviews(interviewer_id, scheduled_at);
 
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -143,12 +150,26 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Candidates: a re-parse stamp alone (only parser_version changes) keeps updated_at,
+-- so the candidate store does not re-read every stamped row
+CREATE OR REPLACE FUNCTION update_candidates_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF to_jsonb(NEW) - 'parser_version' - 'updated_at' = to_jsonb(OLD) - 'parser_version' - 'updated_at' THEN
+        NEW.updated_at = OLD.updated_at;
+    ELSE
+        NEW.updated_at = CURRENT_TIMESTAMP;
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
 -- Create triggers for updated_at
 CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 CREATE TRIGGER update_candidates_updated_at BEFORE UPDATE ON candidates
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+    FOR EACH ROW EXECUTE FUNCTION update_candidates_updated_at_column();
 
 CREATE TRIGGER update_companies_updated_at BEFORE UPDATE ON companies
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
@@ -176,3 +197,43 @@ COMMENT ON TABLE jobs IS 'Job postings with requirements and details';
 COMMENT ON TABLE applications IS 'Job applications with AI match scores';
 COMMENT ON TABLE screening_answers IS 'Screening question responses with AI scoring';
 COMMENT ON TABLE interviews IS 'Interview scheduling and feedback';
+
+-- ============================================================================
+-- Upgrading an existing database
+-- Run the statements below on databases created from an earlier schema.sql
+-- ============================================================================
+
+-- Geocoded locations (filled in the next time each row is saved)
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS location_lat DOUBLE PRECISION;
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS location_lon DOUBLE PRECISION;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS location_lat DOUBLE PRECISION;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS location_lon DOUBLE PRECISION;
+CREATE INDEX IF NOT EXISTS idx_jobs_location_coords ON jobs(location_lat, location_lon);
+
+-- Resume parser version stamp (NULL until the re-parse pipeline has processed the row)
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS parser_version VARCHAR(32);
+-- Candidates: a re-parse stamp alone (only parser_version changes) keeps updated_at,
+-- so the candidate store does not re-read every stamped row
+CREATE OR REPLACE FUNCTION update_candidates_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF to_jsonb(NEW) - 'parser_version' - 'updated_at' = to_jsonb(OLD) - 'parser_version' - 'updated_at' THEN
+        NEW.updated_at = OLD.updated_at;
+    ELSE
+        NEW.updated_at = CURRENT_TIMESTAMP;
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+DROP TRIGGER IF EXISTS update_candidates_updated_at ON candidates;
+CREATE TRIGGER update_candidates_updated_at BEFORE UPDATE ON candidates
+    FOR EACH ROW EXECUTE FUNCTION update_candidates_updated_at_column();
+
+-- Interviewer calendars (conflict checks and free-slot search)
+CREATE INDEX IF NOT EXISTS idx_interviews_interviewer_scheduled ON interviews(interviewer_id, scheduled_at);
+
+-- One application per candidate and job (tables created without the UNIQUE constraint).
+-- Fails if duplicates exist: resolve them first, since deleting an application
+-- also deletes its interviews and screening answers. To list them:
+--   SELECT job_id, candidate_id, COUNT(*) FROM applications GROUP BY 1, 2 HAVING COUNT(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS applications_job_id_candidate_id_key ON applications(job_id, candidate_id);
@@ -0,0 +1,81 @@
+"""
+Fire parallel submits of the same application against the database in
+DATABASE_URL and check that exactly one row is created.
+
+Creates a throwaway recruiter, company, job and candidate, and deletes
+them again afterwards. Run from the backend directory:
+    python test_concurrent_apply.py [parallel_submits]
+"""
+import sys
+import threading
+import time
+import uuid
+
+from fastapi import HTTPException
+
+from app.api.applications import create_application
+from app.database import SessionLocal
+from app.models import Application, Candidate, Company, Job, User
+from app.schemas import ApplicationCreate
+
+
+def submit(barrier, user_id, job_id, results):
+    session = SessionLocal()
+    try:
+        user = session.get(User, user_id)
+        barrier.wait()
+        started = time.perf_counter()
+        try:
+            create_application(ApplicationCreate(job_id=job_id), db=session, current_user=user)
+            results.append(("created", time.perf_counter() - started))
+        except HTTPException as e:
+            results.append((e.status_code, time.perf_counter() - started))
+    except Exception as e:
+        results.append((type(e).__name__, 0.0))
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    parallel = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    tag = uuid.uuid4().hex[:8]
+
+    print(f"🧪 Firing {parallel} parallel submits of one application...")
+    session = SessionLocal()
+    recruiter = User(email=f"race-recruiter-{tag}@example.com", password_hash="x", role="recruiter", full_name="Race Recruiter")
+    applicant = User(email=f"race-candidate-{tag}@example.com", password_hash="x", role="candidate", full_name="Race Candidate")
+    session.add_all([recruiter, applicant])
+    session.flush()
+    company = Company(name=f"Race Test {tag}", created_by=recruiter.id)
+    session.add(company)
+    session.flush()
+    job = Job(company_id=company.id, posted_by=recruiter.id, title="Race Test", description="Concurrency check", status="published")
+    session.add(Candidate(user_id=applicant.id, skills_text="Python"))
+    session.add(job)
+    session.commit()
+    applicant_id, job_id = applicant.id, job.id
+
+    try:
+        barrier = threading.Barrier(parallel)
+        results = []
+        threads = [threading.Thread(target=submit, args=(barrier, applicant_id, job_id, results)) for _ in range(parallel)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        rows = session.query(Application).filter(Application.job_id == job_id).count()
+        outcomes = [outcome for outcome, _ in results]
+        slowest = max(seconds for _, seconds in results) * 1000
+        print(f"Outcomes: {outcomes.count('created')} created, {outcomes.count(400)} rejected as duplicates, "
+              f"{len(outcomes) - outcomes.count('created') - outcomes.count(400)} errors; slowest {slowest:.1f} ms")
+        if rows == 1 and outcomes.count("created") == 1 and outcomes.count(400) == parallel - 1:
+            print("✅ Exactly one application was created")
+        else:
+            print(f"❌ Expected one application, found {rows} (outcomes: {outcomes})")
+            sys.exit(1)
+    finally:
+        session.query(Company).filter(Company.id == company.id).delete()
+        session.query(User).filter(User.id.in_([recruiter.id, applicant_id])).delete()
+        session.commit()
+        session.close()
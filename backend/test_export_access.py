@@ -0,0 +1,61 @@
+"""
+Check the error paths of the applicant export: an unknown job must give
+404 and another recruiter's job 403 (not a 500).
+
+Runs in-process without a database (the session and current user are
+replaced). Run from the backend directory:
+    python test_export_access.py
+"""
+import sys
+import uuid
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app.api.auth import get_current_user
+from app.database import get_db
+from app.main import app
+
+
+class StubQuery:
+    """Answers `db.query(Job).filter(...).first()` with a fixed job."""
+
+    def __init__(self, job):
+        self.job = job
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return self.job
+
+
+class StubSession:
+    def __init__(self, job):
+        self.job = job
+
+    def query(self, *entities):
+        return StubQuery(self.job)
+
+    def close(self):
+        pass
+
+
+if __name__ == "__main__":
+    recruiter = SimpleNamespace(id=uuid.uuid4(), role="recruiter", is_active=True)
+    other_job = SimpleNamespace(id=uuid.uuid4(), posted_by=uuid.uuid4())
+    app.dependency_overrides[get_current_user] = lambda: recruiter
+    client = TestClient(app, raise_server_exceptions=False)
+
+    failures = 0
+    for label, job, expected in (("unknown job", None, 404), ("another recruiter's job", other_job, 403)):
+        app.dependency_overrides[get_db] = lambda job=job: StubSession(job)
+        response = client.get(f"/api/applications/job/{uuid.uuid4()}/export", params={"status": "applied"})
+        if response.status_code == expected:
+            print(f"✅ {label}: {response.status_code}")
+        else:
+            print(f"❌ {label}: expected {expected}, got {response.status_code}")
+            failures += 1
+
+    app.dependency_overrides.clear()
+    sys.exit(1 if failures else 0)
@@ -43,8 +43,8 @@ const JobCard = ({ job, showCompany = true }) => {
             )}
 
             <p style={styles.description}>
-                {job.description?.substring(0, 150)}
-                {job.description?.length > 150 && '...'}
+                {(job.description_preview ?? job.description)?.substring(0, 150)}
+                {(job.description_preview ?? job.description)?.length > 150 && '...'}
             </p>
 
             {job.skills_required && (
@@ -20,7 +20,9 @@ const JobApplicants = () => {
             setLoading(true);
             const [jobResponse, applicantsResponse] = await Promise.all([
                 apiClient.get(`/jobs/${jobId}`),
-                apiClient.get(`/applications/job/${jobId}`)
+                apiClient.get(`/applications/job/${jobId}`, {
+                    params: { fields: 'id,status,match_score,created_at,cover_letter,candidate' }
+                })
             ]);
             setJob(jobResponse.data);
             setApplicants(applicantsResponse.data);